@@ -168,6 +168,8 @@ export interface GenerateSlidesRequest {
   slide_count?: number;
   title?: string;
   theme?: ThemeName;
+  generation_mode?: "agent" | "single_shot" | "outline";
+  bypass_cache?: boolean;
 }
 
 export interface GenerateSlidesResponse {
@@ -191,12 +193,13 @@ export interface SlideUpdate {
 }
 
 export interface AgentEvent {
-  type: "thinking" | "tool_call" | "tool_result" | "complete" | "error";
+  type: "thinking" | "slide_preview" | "tool_call" | "tool_result" | "complete" | "error";
   message?: string;
   tool?: string;
   args?: Record<string, unknown>;
   slide_number?: number;
   slide?: Slide;
+  partial?: boolean;
   result?: string;
   success?: boolean;
   presentation_id?: number;
@@ -3,13 +3,17 @@ Public API - Export endpoints for PDF and PPTX
 """
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
+from apps.public_api.dependencies import RequireAPIKey
 from packages.common.core.database import AsyncSessionDep
+from packages.common.schemas import BulkExportRequest
+from packages.common.services.bulk_export import stream_export_zip
+from packages.common.services.export_cache import export_cache
+from packages.common.services.export_service import write_pdf, write_pptx
 from packages.common.services.presentation_service import PresentationService
-from packages.common.services.export_service import generate_pdf, generate_pptx
-
-from apps.public_api.dependencies import RequireAPIKey
+from packages.common.services.render_pool import RenderPoolBusyError
 
 router = APIRouter()
 
@@ -19,7 +23,7 @@ async def export_pdf(
     presentation_id: int,
     db: AsyncSessionDep,
     api_key: RequireAPIKey,
-) -> StreamingResponse:
+) -> FileResponse:
     """
     Export presentation to PDF.
 
@@ -32,15 +36,18 @@ async def export_pdf(
         raise HTTPException(status_code=404, detail="Presentation not found")
 
     try:
-        pdf_bytes = generate_pdf(presentation)
+        export = await export_cache.render(write_pdf, presentation, "pdf")
 
-        return StreamingResponse(
-            iter([pdf_bytes]),
+        return FileResponse(
+            export.path,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{presentation.title}.pdf"'
             },
+            background=BackgroundTask(export.cleanup),
         )
+    except RenderPoolBusyError as e:
+        raise _busy(e) from None
     except ImportError:
         raise HTTPException(
             status_code=501,
@@ -53,7 +60,7 @@ async def export_pptx(
     presentation_id: int,
     db: AsyncSessionDep,
     api_key: RequireAPIKey,
-) -> StreamingResponse:
+) -> FileResponse:
     """
     Export presentation to PPTX (PowerPoint).
 
@@ -65,12 +72,57 @@ async def export_pptx(
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
 
-    pptx_bytes = generate_pptx(presentation)
+    try:
+        export = await export_cache.render(write_pptx, presentation, "pptx")
+    except RenderPoolBusyError as e:
+        raise _busy(e) from None
 
-    return StreamingResponse(
-        iter([pptx_bytes]),
+    return FileResponse(
+        export.path,
         media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
         headers={
             "Content-Disposition": f'attachment; filename="{presentation.title}.pptx"'
         },
+        background=BackgroundTask(export.cleanup),
+    )
+
+
+@router.post("/bulk")
+async def export_bulk(
+    request: BulkExportRequest,
+    db: AsyncSessionDep,
+    api_key: RequireAPIKey,
+) -> StreamingResponse:
+    """
+    Export many presentations as one streamed ZIP archive.
+
+    Only exports presentations owned by the authenticated API key. Files are
+    rendered a few at a time and added to the archive as each one completes;
+    any that fail to render are listed in errors.txt inside the archive.
+    """
+    presentation_ids = list(dict.fromkeys(request.presentation_ids))
+    service = PresentationService(db)
+    presentations = await service.get_many(presentation_ids, api_key_id=api_key.id)
+
+    missing = set(presentation_ids) - {p.id for p in presentations}
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Presentations not found: {', '.join(map(str, sorted(missing)))}",
+        )
+
+    writer = write_pdf if request.format == "pdf" else write_pptx
+    return StreamingResponse(
+        stream_export_zip(presentations, request.format, writer),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="presentations.zip"'},
+    )
+
+
+def _busy(error: RenderPoolBusyError) -> HTTPException:
+    """503 with Retry-After for an export the render pool can't take yet"""
+    return HTTPException(
+        status_code=503,
+        detail="Export service is busy, please retry shortly",
+        headers={"Retry-After": str(error.retry_after)},
     )
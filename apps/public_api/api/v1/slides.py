@@ -2,11 +2,20 @@
 Public API - Slide generation endpoints
 """
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from typing import Annotated
+
+from fastapi import APIRouter, File, Form, Header, HTTPException, UploadFile
 
 from packages.common.core.database import AsyncSessionDep
-from packages.common.schemas import GenerateSlidesRequest, GenerateSlidesResponse
+from packages.common.schemas import (
+    GenerateSlidesRequest,
+    GenerateSlidesResponse,
+    GenerationJobResponse,
+    GenerationMode,
+)
 from packages.common.services.file_extractor import file_extractor
+from packages.common.services.jobs import get_job_queue
+from packages.common.services.presentation_service import PresentationService
 from packages.common.services.slide_generator import SlideGeneratorService
 
 from apps.public_api.dependencies import RequireAPIKey
@@ -19,12 +28,19 @@ async def generate_slides(
     request: GenerateSlidesRequest,
     db: AsyncSessionDep,
     api_key: RequireAPIKey,
+    idempotency_key: str | None = Header(
+        default=None,
+        max_length=255,
+        description="Retries with the same key return the original presentation",
+    ),
 ) -> GenerateSlidesResponse:
     """
     Generate slides from input text.
 
     Requires X-API-Key header for authentication.
     Takes raw text input and uses LLM to structure it into a presentation.
+    An optional Idempotency-Key header makes retries safe: a request that
+    reuses a key attaches to (or returns) the original generation.
     """
     try:
         generator = SlideGeneratorService(db)
@@ -33,7 +49,10 @@ async def generate_slides(
             slide_count=request.slide_count or 8,
             title=request.title,
             theme=request.theme,
+            mode=request.generation_mode,
+            use_cache=not request.bypass_cache,
             api_key_id=api_key.id,
+            idempotency_key=idempotency_key,
         )
         return GenerateSlidesResponse(presentation=presentation)
     except Exception as e:
@@ -48,6 +67,12 @@ async def generate_slides_from_file(
     slide_count: int = Form(default=8, ge=5, le=15, description="Target number of slides"),
     title: str | None = Form(default=None, max_length=255, description="Optional presentation title"),
     theme: str = Form(default="neobrutalism", description="Presentation theme"),
+    generation_mode: Annotated[
+        GenerationMode, Form(description="Generation strategy: agent, single_shot or outline")
+    ] = "agent",
+    bypass_cache: bool = Form(
+        default=False, description="Always run a fresh generation instead of reusing one"
+    ),
 ) -> GenerateSlidesResponse:
     """
     Generate slides from an uploaded file.
@@ -66,8 +91,76 @@ async def generate_slides_from_file(
             slide_count=slide_count,
             title=title,
             theme=theme,
+            mode=generation_mode,
+            use_cache=not bypass_cache,
             api_key_id=api_key.id,
         )
         return GenerateSlidesResponse(presentation=presentation)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/jobs", response_model=GenerationJobResponse, status_code=202)
+async def submit_generation_job(
+    request: GenerateSlidesRequest,
+    api_key: RequireAPIKey,
+    idempotency_key: str | None = Header(
+        default=None,
+        max_length=255,
+        description="Retries with the same key return the original job",
+    ),
+) -> GenerationJobResponse:
+    """
+    Queue a slide generation and return immediately.
+
+    Requires X-API-Key header for authentication.
+    Poll GET /jobs/{job_id} for status and progress, then fetch the
+    presentation from GET /jobs/{job_id}/result once completed.
+    An optional Idempotency-Key header makes retries safe: a submit that
+    reuses a key returns the original job instead of queueing another.
+    """
+    job = await get_job_queue().submit(
+        request, api_key_id=api_key.id, idempotency_key=idempotency_key
+    )
+    return GenerationJobResponse.model_validate(job.model_dump())
+
+
+@router.get("/jobs/{job_id}", response_model=GenerationJobResponse)
+async def get_generation_job(
+    job_id: str,
+    api_key: RequireAPIKey,
+) -> GenerationJobResponse:
+    """
+    Get the status and progress of a generation job.
+
+    Only returns jobs submitted with the authenticated API key.
+    """
+    job = await get_job_queue().get(job_id, api_key_id=api_key.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return GenerationJobResponse.model_validate(job.model_dump())
+
+
+@router.get("/jobs/{job_id}/result", response_model=GenerateSlidesResponse)
+async def get_generation_job_result(
+    job_id: str,
+    db: AsyncSessionDep,
+    api_key: RequireAPIKey,
+) -> GenerateSlidesResponse:
+    """
+    Get the presentation produced by a completed generation job.
+
+    Returns 409 while the job is still queued or running, or if it failed.
+    """
+    job = await get_job_queue().get(job_id, api_key_id=api_key.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "completed" or job.presentation_id is None:
+        detail = f"Job failed: {job.error}" if job.status == "failed" else f"Job is {job.status}"
+        raise HTTPException(status_code=409, detail=detail)
+
+    service = PresentationService(db)
+    presentation = await service.get_by_id(job.presentation_id, api_key_id=api_key.id)
+    if not presentation:
+        raise HTTPException(status_code=404, detail="Presentation not found")
+    return GenerateSlidesResponse(presentation=service.to_response(presentation))
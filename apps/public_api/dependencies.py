@@ -40,17 +40,18 @@ async def get_api_key(
     return api_key
 
 
-def require_scope(required_scope: str):
+def require_scope(required_scope: str, allow_wildcard: bool = True):
     """
     Dependency factory that checks if the API key has the required scope.
-    Use '*' in API key scopes to allow all operations.
+    Use '*' in API key scopes to allow all operations, unless allow_wildcard
+    is False (internal routes that customer keys must not reach).
     """
 
     async def check_scope(
         api_key: APIKeyValidation = Depends(get_api_key),
     ) -> APIKeyValidation:
         # Wildcard scope allows everything
-        if "*" in api_key.scopes:
+        if allow_wildcard and "*" in api_key.scopes:
             return api_key
 
         # Check for specific scope
@@ -72,3 +73,6 @@ RequireSlidesWrite = Annotated[APIKeyValidation, Depends(require_scope("slides:w
 RequirePresentationsRead = Annotated[APIKeyValidation, Depends(require_scope("presentations:read"))]
 RequirePresentationsWrite = Annotated[APIKeyValidation, Depends(require_scope("presentations:write"))]
 RequireExport = Annotated[APIKeyValidation, Depends(require_scope("export"))]
+RequireAdminMetrics = Annotated[
+    APIKeyValidation, Depends(require_scope("admin:metrics", allow_wildcard=False))
+]
@@ -3,17 +3,23 @@ Export endpoints for PDF, PPTX, and shareable links
 """
 
 import base64
+from typing import BinaryIO
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from starlette.background import BackgroundTask
 
 from packages.common.core.database import AsyncSessionDep
-from packages.common.models import Presentation
+from packages.common.models import Presentation, Slide
 from packages.common.schemas import PresentationResponse
-from packages.common.services.pptx_export_service import generate_pptx
+from packages.common.services.export_cache import export_cache
+from packages.common.services.export_service import html_to_pdf
+from packages.common.services.pdf_page_cache import pdf_page_cache
+from packages.common.services.pptx_export_service import write_pptx
+from packages.common.services.render_pool import RenderPoolBusyError
 
 router = APIRouter()
 
@@ -57,7 +63,7 @@ async def create_share_link(
 async def export_pdf(
     presentation_id: int,
     db: AsyncSessionDep,
-) -> StreamingResponse:
+) -> FileResponse:
     """
     Export presentation to PDF.
 
@@ -75,21 +81,19 @@ async def export_pdf(
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
 
-    # Generate HTML for slides
-    html_content = _generate_slide_html(presentation)
-
     try:
-        from weasyprint import HTML
-
-        pdf_bytes = HTML(string=html_content).write_pdf()
+        export = await export_cache.render(write_pdf, presentation, "pdf")
 
-        return StreamingResponse(
-            iter([pdf_bytes]),
+        return FileResponse(
+            export.path,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{presentation.title}.pdf"'
             },
+            background=BackgroundTask(export.cleanup),
         )
+    except RenderPoolBusyError as e:
+        raise _busy(e) from None
     except ImportError:
         # WeasyPrint not installed - return error
         raise HTTPException(
@@ -102,7 +106,7 @@ async def export_pdf(
 async def export_pptx(
     presentation_id: int,
     db: AsyncSessionDep,
-) -> StreamingResponse:
+) -> FileResponse:
     """
     Export presentation to PPTX (PowerPoint).
 
@@ -120,63 +124,105 @@ async def export_pptx(
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
 
-    # Generate PPTX bytes
-    pptx_bytes = generate_pptx(presentation)
+    # Generate PPTX file
+    try:
+        export = await export_cache.render(write_pptx, presentation, "pptx")
+    except RenderPoolBusyError as e:
+        raise _busy(e) from None
 
-    return StreamingResponse(
-        iter([pptx_bytes]),
+    return FileResponse(
+        export.path,
         media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
         headers={
             "Content-Disposition": f'attachment; filename="{presentation.title}.pptx"'
         },
+        background=BackgroundTask(export.cleanup),
     )
 
 
+def _busy(error: RenderPoolBusyError) -> HTTPException:
+    """503 with Retry-After for an export the render pool can't take yet"""
+    return HTTPException(
+        status_code=503,
+        detail="Export service is busy, please retry shortly",
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
+def write_pdf(presentation: Presentation, output: BinaryIO) -> None:
+    """Render slides to PDF with WeasyPrint (runs in the render pool)"""
+    if not pdf_page_cache.enabled or not presentation.slides:
+        html_to_pdf(
+            _generate_slide_html(presentation),
+            (),  # Slide images aren't part of this layout
+            output,
+        )
+        return
+
+    def render_pages(slides: list[Slide]) -> list[bytes]:
+        return [
+            html_to_pdf(
+                _generate_document_html(_generate_single_slide_html(slide)),
+                (),  # Slide images aren't part of this layout
+            )
+            for slide in slides
+        ]
+
+    pdf_page_cache.assemble(presentation.slides, render_pages, context=[__name__], output=output)
+
+
 def _generate_slide_html(presentation: Presentation) -> str:
     """Generate HTML representation of slides for PDF export"""
-    slides_html = ""
-
-    for slide in presentation.slides:
-        slide_content = ""
-
-        if slide.type == "title":
-            slide_content = f"""
-                <div class="title-slide">
-                    <h1>{slide.title or ''}</h1>
-                    {f'<p class="subtitle">{slide.subtitle}</p>' if slide.subtitle else ''}
-                </div>
-            """
-        elif slide.type == "bullets" and slide.bullets:
-            bullets = "".join(f"<li>{b}</li>" for b in slide.bullets)
-            slide_content = f"""
-                <div class="bullets-slide">
-                    {f'<h2>{slide.title}</h2>' if slide.title else ''}
-                    <ul>{bullets}</ul>
-                </div>
-            """
-        elif slide.type == "quote":
-            slide_content = f"""
-                <div class="quote-slide">
-                    <blockquote>"{slide.quote or ''}"</blockquote>
-                    {f'<cite>— {slide.attribution}</cite>' if slide.attribution else ''}
-                </div>
-            """
-        elif slide.type == "section":
-            slide_content = f"""
-                <div class="section-slide">
-                    <h2>{slide.title or ''}</h2>
-                </div>
-            """
-        else:
-            slide_content = f"""
-                <div class="content-slide">
-                    {f'<h2>{slide.title}</h2>' if slide.title else ''}
-                    {f'<p>{slide.body}</p>' if slide.body else ''}
-                </div>
-            """
-
-        slides_html += f'<div class="slide">{slide_content}</div>'
+    return _generate_document_html(
+        "".join(_generate_single_slide_html(slide) for slide in presentation.slides)
+    )
+
 
+def _generate_single_slide_html(slide: Slide) -> str:
+    """Generate the page markup for one slide"""
+    slide_content = ""
+
+    if slide.type == "title":
+        slide_content = f"""
+            <div class="title-slide">
+                <h1>{slide.title or ''}</h1>
+                {f'<p class="subtitle">{slide.subtitle}</p>' if slide.subtitle else ''}
+            </div>
+        """
+    elif slide.type == "bullets" and slide.bullets:
+        bullets = "".join(f"<li>{b}</li>" for b in slide.bullets)
+        slide_content = f"""
+            <div class="bullets-slide">
+                {f'<h2>{slide.title}</h2>' if slide.title else ''}
+                <ul>{bullets}</ul>
+            </div>
+        """
+    elif slide.type == "quote":
+        slide_content = f"""
+            <div class="quote-slide">
+                <blockquote>"{slide.quote or ''}"</blockquote>
+                {f'<cite>— {slide.attribution}</cite>' if slide.attribution else ''}
+            </div>
+        """
+    elif slide.type == "section":
+        slide_content = f"""
+            <div class="section-slide">
+                <h2>{slide.title or ''}</h2>
+            </div>
+        """
+    else:
+        slide_content = f"""
+            <div class="content-slide">
+                {f'<h2>{slide.title}</h2>' if slide.title else ''}
+                {f'<p>{slide.body}</p>' if slide.body else ''}
+            </div>
+        """
+
+    return f'<div class="slide">{slide_content}</div>'
+
+
+def _generate_document_html(slides_html: str) -> str:
+    """Wrap slide markup in the export document"""
     return f"""
     <!DOCTYPE html>
     <html>
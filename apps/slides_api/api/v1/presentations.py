@@ -13,6 +13,7 @@ from packages.common.schemas import (
     PresentationUpdate,
     SlideUpdate,
 )
+from packages.common.services.export_cache import export_cache
 
 router = APIRouter()
 
@@ -81,6 +82,7 @@ async def update_presentation(
 
     await db.commit()
     await db.refresh(presentation)
+    await export_cache.invalidate(presentation_id)
 
     return PresentationResponse.model_validate(presentation)
 
@@ -100,6 +102,7 @@ async def delete_presentation(
 
     await db.delete(presentation)
     await db.commit()
+    await export_cache.invalidate(presentation_id)
 
     return {"status": "deleted", "id": str(presentation_id)}
 
@@ -141,5 +144,6 @@ async def update_slide(
 
     await db.commit()
     await db.refresh(presentation)
+    await export_cache.invalidate(presentation_id)
 
     return PresentationResponse.model_validate(presentation)
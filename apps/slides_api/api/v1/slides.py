@@ -3,13 +3,21 @@ Slide generation endpoints
 """
 
 import logging
+from typing import Annotated
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 
 from packages.common.core.database import AsyncSessionDep, async_session_factory
-from packages.common.schemas import GenerateSlidesRequest, GenerateSlidesResponse
+from packages.common.schemas import (
+    GenerateSlidesRequest,
+    GenerateSlidesResponse,
+    GenerationJobResponse,
+    GenerationMode,
+)
 from packages.common.services.file_extractor import file_extractor
+from packages.common.services.jobs import get_job_queue
+from packages.common.services.presentation_service import PresentationService
 from packages.common.services.slide_generator import SlideGeneratorService
 
 logger = logging.getLogger(__name__)
@@ -34,6 +42,8 @@ async def generate_slides(
             slide_count=request.slide_count or 8,
             title=request.title,
             theme=request.theme,
+            mode=request.generation_mode,
+            use_cache=not request.bypass_cache,
         )
         return GenerateSlidesResponse(presentation=presentation)
     except Exception as e:
@@ -49,6 +59,7 @@ async def generate_slides_stream(
 
     Returns Server-Sent Events showing agent progress:
     - thinking: Agent is processing
+    - slide_preview: Partial slide fields parsed while the model is still writing them
     - tool_call: Agent is calling a tool (add_slide, finish_presentation)
     - tool_result: Tool execution completed
     - complete: Generation finished with final presentation
@@ -71,6 +82,8 @@ async def generate_slides_stream(
                     slide_count=request.slide_count or 8,
                     title=request.title,
                     theme=request.theme,
+                    mode=request.generation_mode,
+                    use_cache=not request.bypass_cache,
                 ):
                     logger.info(f"Event received: {event.type}")
                     yield event.to_sse()
@@ -98,6 +111,12 @@ async def generate_slides_from_file(
     slide_count: int = Form(default=8, ge=5, le=15, description="Target number of slides"),
     title: str | None = Form(default=None, max_length=255, description="Optional presentation title"),
     theme: str = Form(default="neobrutalism", description="Presentation theme"),
+    generation_mode: Annotated[
+        GenerationMode, Form(description="Generation strategy: agent, single_shot or outline")
+    ] = "agent",
+    bypass_cache: bool = Form(
+        default=False, description="Always run a fresh generation instead of reusing one"
+    ),
 ) -> GenerateSlidesResponse:
     """
     Generate slides from an uploaded file.
@@ -114,6 +133,8 @@ async def generate_slides_from_file(
             slide_count=slide_count,
             title=title,
             theme=theme,
+            mode=generation_mode,
+            use_cache=not bypass_cache,
         )
         return GenerateSlidesResponse(presentation=presentation)
     except Exception as e:
@@ -126,6 +147,12 @@ async def generate_slides_from_file_stream(
     slide_count: int = Form(default=8, ge=5, le=15, description="Target number of slides"),
     title: str | None = Form(default=None, max_length=255, description="Optional presentation title"),
     theme: str = Form(default="neobrutalism", description="Presentation theme"),
+    generation_mode: Annotated[
+        GenerationMode, Form(description="Generation strategy: agent, single_shot or outline")
+    ] = "agent",
+    bypass_cache: bool = Form(
+        default=False, description="Always run a fresh generation instead of reusing one"
+    ),
 ) -> StreamingResponse:
     """
     Generate slides from an uploaded file with real-time SSE streaming.
@@ -147,6 +174,8 @@ async def generate_slides_from_file_stream(
                     slide_count=slide_count,
                     title=title,
                     theme=theme,
+                    mode=generation_mode,
+                    use_cache=not bypass_cache,
                 ):
                     yield event.to_sse()
             except Exception as e:
@@ -162,3 +191,50 @@ async def generate_slides_from_file_stream(
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@router.post("/jobs", response_model=GenerationJobResponse, status_code=202)
+async def submit_generation_job(
+    request: GenerateSlidesRequest,
+) -> GenerationJobResponse:
+    """
+    Queue a slide generation and return immediately.
+
+    Poll GET /jobs/{job_id} for status and progress, then fetch the
+    presentation from GET /jobs/{job_id}/result once completed.
+    """
+    job = await get_job_queue().submit(request)
+    return GenerationJobResponse.model_validate(job.model_dump())
+
+
+@router.get("/jobs/{job_id}", response_model=GenerationJobResponse)
+async def get_generation_job(job_id: str) -> GenerationJobResponse:
+    """Get the status and progress of a generation job."""
+    job = await get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return GenerationJobResponse.model_validate(job.model_dump())
+
+
+@router.get("/jobs/{job_id}/result", response_model=GenerateSlidesResponse)
+async def get_generation_job_result(
+    job_id: str,
+    db: AsyncSessionDep,
+) -> GenerateSlidesResponse:
+    """
+    Get the presentation produced by a completed generation job.
+
+    Returns 409 while the job is still queued or running, or if it failed.
+    """
+    job = await get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "completed" or job.presentation_id is None:
+        detail = f"Job failed: {job.error}" if job.status == "failed" else f"Job is {job.status}"
+        raise HTTPException(status_code=409, detail=detail)
+
+    service = PresentationService(db)
+    presentation = await service.get_by_id(job.presentation_id)
+    if not presentation:
+        raise HTTPException(status_code=404, detail="Presentation not found")
+    return GenerateSlidesResponse(presentation=service.to_response(presentation))
@@ -175,6 +175,7 @@ async def generate_from_template_stream(
 
     Returns Server-Sent Events showing agent progress:
     - thinking: Agent is processing
+    - slide_preview: Partial slide fields parsed while the model is still writing them
     - tool_call: Agent is calling a tool (add_slide, finish_presentation)
     - tool_result: Tool execution completed
     - complete: Generation finished with final presentation
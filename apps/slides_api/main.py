@@ -11,7 +11,17 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from packages.common.core.config import settings
 from packages.common.core.logging import setup_logging
+from packages.common.core.redis import close_redis
+from packages.common.providers.http_client import close_http_client, get_http_client
+from packages.common.providers.llm.limiter import limiter_stats
+from packages.common.services.export_cache import export_cache
+from packages.common.services.jobs import get_job_queue
+from packages.common.services.pptx_export_service import write_pptx
+from packages.common.services.render_pool import render_pool
+from packages.common.services.slide_generator.cache import generation_cache
+from packages.common.services.slide_generator.singleflight import generation_flights
 
+from apps.slides_api.api.v1.export import write_pdf
 from apps.slides_api.api.v1.router import api_router
 
 
@@ -20,9 +30,17 @@ async def lifespan(app: FastAPI) -> Any:
     """Application lifespan handler"""
     # Startup
     setup_logging()
+    get_http_client()  # Warm the shared outbound connection pool
+    await get_job_queue().start()
+    render_pool.start()
+    export_cache.start_prerender({"pdf": write_pdf, "pptx": write_pptx})
     yield
     # Shutdown
-    pass
+    await get_job_queue().stop()
+    export_cache.stop_prerender()
+    render_pool.stop()
+    await close_http_client()
+    await close_redis()
 
 
 app = FastAPI(
@@ -51,3 +69,16 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 async def health_check() -> dict[str, str]:
     """Health check endpoint"""
     return {"status": "healthy", "service": "decksnap-api"}
+
+
+@app.get("/metrics")
+async def metrics() -> dict[str, Any]:
+    """Runtime counters for caches and queues"""
+    return {
+        "generation_cache": generation_cache.stats(),
+        "generation_flights": generation_flights.stats(),
+        "generation_jobs": await get_job_queue().stats(),
+        "llm_limiters": limiter_stats(),
+        "render_pool": render_pool.stats(),
+        "export_cache": export_cache.stats(),
+    }
@@ -3,6 +3,8 @@ Decksnap Configuration
 Using Pydantic Settings for environment variable management
 """
 
+import os
+import tempfile
 from functools import lru_cache
 from typing import Literal
 
@@ -30,6 +32,87 @@ class Settings(BaseSettings):
     # Unsplash API (for stock images)
     unsplash_access_key: str = ""
 
+    # Shared outbound HTTP client pool (Unsplash, OpenRouter)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 30.0
+    http2_enabled: bool = True  # Only used if the h2 package is installed (http2 extra)
+
+    # Slide generation
+    generation_compact_history: bool = True  # Summarize earlier agent turns
+    generation_cache_enabled: bool = True
+    generation_cache_max_entries: int = 256
+    generation_cache_ttl_seconds: int = 3600
+    idempotency_key_ttl_seconds: int = 86400
+    generation_outline_concurrency: int = 6  # Slides written at once in outline mode
+    generation_outline_context_chars: int = 6000  # Source text sent with each outlined slide
+    generation_condense_threshold_tokens: int = 12000  # Longer inputs are condensed first
+    generation_condense_budget_tokens: int = 6000  # Target size of the condensed brief
+    generation_condense_chunk_tokens: int = 4000  # Chunk size for the map step
+    generation_condense_concurrency: int = 6
+
+    # Background generation jobs
+    job_backend: Literal["memory", "redis"] = "memory"  # redis: queue and idempotency keys shared across nodes
+    job_workers: int = 4  # Concurrent generations per process
+    job_ttl_seconds: int = 86400  # How long finished jobs stay queryable
+
+    # LLM concurrency (adaptive limiter around OpenRouter calls)
+    llm_concurrency_initial: int = 8
+    llm_concurrency_min: int = 1
+    llm_concurrency_max: int = 32
+    llm_concurrency_per_model: dict[str, int] = {}  # Max concurrency by model name
+    llm_latency_target_seconds: float = 90.0  # Slower calls count as congestion
+    llm_max_retries: int = 4  # Re-queue attempts after 429s or connection errors
+    llm_global_concurrency: int = 0  # >0: cap in-flight calls across workers via Redis
+
+    # Export rendering (worker process pool)
+    render_workers: int = 2
+    render_queue_limit: int = 8  # Exports allowed to wait for a worker before 503s
+    render_retry_after_seconds: int = 5
+    pdf_chart_renderer: Literal["svg", "matplotlib"] = "svg"  # matplotlib embeds PNGs
+    pptx_fast_writer_enabled: bool = True  # Write chart-free decks as OOXML directly, not via python-pptx
+
+    # Export cache (rendered files keyed by content digest)
+    export_cache_enabled: bool = True
+    export_cache_dir: str = os.path.join(tempfile.gettempdir(), "decksnap", "exports")
+    export_cache_max_bytes: int = 1024 * 1024 * 1024  # LRU eviction above this
+    export_prerender_enabled: bool = False  # Render PDF/PPTX in the background after generation
+    bulk_export_concurrency: int = 2  # Exports rendering or waiting to be sent, per bulk ZIP request
+
+    # PDF page cache (one-page PDFs per slide, merged into each export)
+    pdf_page_cache_enabled: bool = True
+    pdf_page_cache_dir: str = os.path.join(tempfile.gettempdir(), "decksnap", "pages")
+    pdf_page_cache_max_bytes: int = 512 * 1024 * 1024
+
+    # Chart render cache (per-worker memory LRU over a shared disk LRU)
+    chart_cache_enabled: bool = True
+    chart_cache_dir: str = os.path.join(tempfile.gettempdir(), "decksnap", "charts")
+    chart_cache_memory_entries: int = 256
+    chart_cache_max_bytes: int = 256 * 1024 * 1024
+
+    # Export image cache (downloaded slide images, shared on disk)
+    image_cache_enabled: bool = True
+    image_cache_dir: str = os.path.join(tempfile.gettempdir(), "decksnap", "images")
+    image_cache_max_bytes: int = 512 * 1024 * 1024
+    image_cache_ttl_seconds: int = 7 * 86400
+    image_fetch_concurrency: int = 8
+    image_fetch_timeout: float = 10.0
+    image_fetch_max_bytes: int = 15 * 1024 * 1024  # Larger images are skipped
+    export_image_normalize: bool = True  # Downscale and recompress embedded images
+    export_image_dpi: int = 150
+    export_image_quality: int = 80
+
+    # API key validation cache (public API)
+    api_key_cache_enabled: bool = True
+    api_key_cache_ttl_seconds: float = 60.0  # Longest a key change can go unnoticed without Redis
+    api_key_cache_max_entries: int = 10000
+    api_key_last_used_flush_seconds: float = 5.0  # Batch interval for last_used_at writes
+    api_key_invalidation: Literal["local", "redis"] = "local"  # redis: key changes reach every worker
+
+    # Redis (job queue, cross-worker LLM limit and API key invalidation)
+    redis_url: str = "redis://localhost:6379/0"
+
     # Application
     debug: bool = True
     cors_origins: list[str] = ["http://localhost:13000"]
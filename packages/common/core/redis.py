@@ -0,0 +1,39 @@
+"""
+Shared Redis connection
+Used by the Redis job queue, the cross-worker LLM concurrency limit and
+API key cache invalidation. redis-py is only required when one of those
+features is enabled.
+"""
+
+from typing import Any
+
+from packages.common.core.config import settings
+
+_client: Any = None
+
+
+def get_redis() -> Any:
+    """
+    Get the process-wide async Redis client, creating it on first use.
+
+    Raises:
+        RuntimeError: If redis-py is not installed
+    """
+    global _client
+    if _client is None:
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError(
+                "This feature requires redis-py. Install with: poetry install -E redis"
+            ) from None
+        _client = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,54 @@
+"""
+Shared HTTP client
+One long-lived httpx.AsyncClient per process so outbound calls reuse pooled
+keep-alive connections instead of paying TCP+TLS setup on every request.
+"""
+
+import httpx
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx requires the optional h2 package."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Pool limits come from Settings. The client is closed by
+    close_http_client() from the FastAPI lifespan shutdown.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        http2 = settings.http2_enabled and _http2_available()
+        _client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(settings.http_timeout),
+        )
+        logger.debug(f"Created shared HTTP client (http2={http2})")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -1,4 +1,4 @@
 # LLM providers
-from packages.common.providers.llm.openrouter import OpenRouterProvider
+from packages.common.providers.llm.openrouter import OpenRouterProvider, get_openrouter_provider
 
-__all__ = ["OpenRouterProvider"]
+__all__ = ["OpenRouterProvider", "get_openrouter_provider"]
@@ -0,0 +1,212 @@
+"""
+Adaptive LLM concurrency limiter
+Bounds in-flight completions per model with an AIMD limit: the limit grows
+by about one per window of fast successful calls and halves on a rate limit
+(429) or a call slower than the latency target. Callers over the limit wait
+in FIFO order instead of failing. With llm_global_concurrency set, in-flight
+calls are additionally capped across all workers through Redis.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.core.redis import get_redis
+
+logger = get_logger(__name__)
+
+# Minimum spacing between multiplicative decreases, so one burst of 429s
+# from calls that were all in flight together only halves the limit once
+DECREASE_COOLDOWN_SECONDS = 5.0
+
+GLOBAL_POLL_SECONDS = 0.1
+GLOBAL_LEASE_TTL_SECONDS = 600  # Leases left by crashed workers expire after this
+
+
+class Lease:
+    """A granted concurrency slot; release it exactly once when the call ends."""
+
+    def __init__(self, limiter: "AdaptiveLimiter", global_token: str | None = None):
+        self._limiter = limiter
+        self._global_token = global_token
+        self._granted_at = time.monotonic()
+        self._released = False
+
+    async def release(self, throttled: bool = False) -> None:
+        """
+        Return the slot to the limiter.
+
+        Args:
+            throttled: The call was rate limited (triggers a decrease)
+        """
+        if self._released:
+            return
+        self._released = True
+        self._limiter._release(time.monotonic() - self._granted_at, throttled)
+        if self._global_token:
+            await self._limiter._release_global(self._global_token)
+
+
+class AdaptiveLimiter:
+    """FIFO-fair AIMD concurrency limiter for one model."""
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        global_limit: int = 0,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.latency_target = latency_target
+        self.global_limit = global_limit
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = 0.0
+
+        # Metrics
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> Lease:
+        """Wait for a slot (FIFO) and return its lease."""
+        started = time.monotonic()
+
+        if self._waiters or self._in_flight >= int(self.limit):
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just as we were cancelled; hand the slot on
+                    self._release(0.0, False, record=False)
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self._in_flight += 1
+
+        global_token = None
+        if self.global_limit > 0:
+            try:
+                global_token = await self._acquire_global()
+            except BaseException:
+                self._release(0.0, False, record=False)
+                raise
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return Lease(self, global_token)
+
+    def _release(self, latency: float, throttled: bool, record: bool = True) -> None:
+        self._in_flight -= 1
+        if record:
+            if throttled:
+                self.throttled += 1
+                self._decrease("rate limited")
+            elif latency > self.latency_target:
+                self._decrease(f"slow call ({latency:.1f}s)")
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit / 2)
+        logger.warning(f"LLM limiter {self.name}: {reason}, limit now {int(self.limit)}")
+
+    def _wake(self) -> None:
+        """Grant slots to waiters in arrival order while under the limit."""
+        while self._waiters and self._in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    async def _acquire_global(self) -> str:
+        """
+        Take one of global_limit cross-worker slots.
+
+        Slots are a Redis sorted set ordered by request time: a request holds
+        a slot once it ranks within the first global_limit entries, which
+        keeps waiting workers in FIFO order.
+        """
+        redis = get_redis()
+        key = f"decksnap:llm:{self.name}:leases"
+        token = uuid.uuid4().hex
+        requested_at = time.time()
+
+        try:
+            while True:
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.zremrangebyscore(key, 0, time.time() - GLOBAL_LEASE_TTL_SECONDS)
+                    pipe.zadd(key, {token: requested_at}, nx=True)
+                    pipe.zrank(key, token)
+                    pipe.expire(key, GLOBAL_LEASE_TTL_SECONDS)
+                    _, _, rank, _ = await pipe.execute()
+                if rank is not None and rank < self.global_limit:
+                    return token
+                await asyncio.sleep(GLOBAL_POLL_SECONDS)
+        except BaseException:
+            await self._release_global(token)
+            raise
+
+    async def _release_global(self, token: str) -> None:
+        try:
+            await get_redis().zrem(f"decksnap:llm:{self.name}:leases", token)
+        except Exception as e:
+            logger.warning(f"Failed to release global LLM lease: {e}")
+
+    def stats(self) -> dict[str, float]:
+        """Limiter counters for metrics."""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "avg_wait_seconds": round(self.total_wait / self.acquired, 3) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(model: str) -> AdaptiveLimiter:
+    """Get the process-wide limiter for a model, configured from settings."""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        limiter = AdaptiveLimiter(
+            name=model,
+            initial=settings.llm_concurrency_initial,
+            min_limit=settings.llm_concurrency_min,
+            max_limit=settings.llm_concurrency_per_model.get(model, settings.llm_concurrency_max),
+            latency_target=settings.llm_latency_target_seconds,
+            global_limit=settings.llm_global_concurrency,
+        )
+        _limiters[model] = limiter
+    return limiter
+
+
+def limiter_stats() -> dict[str, dict[str, float]]:
+    """Metrics for every model limiter created so far."""
+    return {model: limiter.stats() for model, limiter in _limiters.items()}
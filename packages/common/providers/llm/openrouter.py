@@ -3,15 +3,21 @@ OpenRouter LLM Provider
 Provides access to multiple LLM models through OpenRouter API
 """
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion
-from tenacity import retry, stop_after_attempt, wait_exponential
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from packages.common.core.config import settings
 from packages.common.core.logging import get_logger
+from packages.common.providers.http_client import get_http_client
+from packages.common.providers.llm.limiter import AdaptiveLimiter, get_limiter
 
 logger = get_logger(__name__)
 
@@ -37,29 +43,75 @@ class OpenRouterProvider:
         if not self.api_key:
             logger.warning("OpenRouter API key not configured")
 
-        # OpenAI SDK client for tool calling
+        # OpenAI SDK client for tool calling, bound to the shared HTTP pool
         self._openai_client: AsyncOpenAI | None = None
+        self._openai_http_client: httpx.AsyncClient | None = None
 
     @property
     def openai_client(self) -> AsyncOpenAI:
         """Lazy-initialized OpenAI client configured for OpenRouter."""
-        if self._openai_client is None:
+        http_client = get_http_client()
+        # Rebuild if the shared pool was closed and recreated (e.g. app restart)
+        if self._openai_client is None or self._openai_http_client is not http_client:
+            self._openai_http_client = http_client
             self._openai_client = AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
                 timeout=httpx.Timeout(connect=30.0, read=120.0, write=30.0, pool=120.0),
-                max_retries=2,
+                max_retries=0,  # Retried by _completion so the limiter sees 429s
                 default_headers={
                     "HTTP-Referer": "https://decksnap.app",
                     "X-Title": "Decksnap",
                 },
+                http_client=http_client,
             )
         return self._openai_client
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """Concurrency limiter shared by all calls to this provider's model."""
+        return get_limiter(self.model)
+
+    @asynccontextmanager
+    async def _completion(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Create a chat completion while holding a concurrency slot.
+
+        Rate-limited (429), connection and 5xx failures give the slot back,
+        back off and queue again, up to llm_max_retries times. The slot is
+        held until the block exits, so streams keep it while being read.
+
+        Yields:
+            ChatCompletion, or the chunk stream when stream=True
+        """
+        for attempt in range(settings.llm_max_retries + 1):
+            lease = await self.limiter.acquire()
+            try:
+                response = await self.openai_client.chat.completions.create(
+                    model=self.model, **kwargs
+                )
+            except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                throttled = isinstance(e, RateLimitError)
+                await lease.release(throttled=throttled)
+                if attempt == settings.llm_max_retries:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"OpenRouter call failed ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                await lease.release()
+                raise
+
+            try:
+                yield response
+            finally:
+                await lease.release()
+            return
+
     async def complete(
         self,
         messages: list[dict[str, str]],
@@ -82,35 +134,21 @@ class OpenRouterProvider:
         if not self.api_key:
             raise ValueError("OpenRouter API key not configured")
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://decksnap.app",
-            "X-Title": "Decksnap",
-        }
-
-        payload: dict = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
+        kwargs: dict[str, Any] = {}
         if response_format:
-            payload["response_format"] = response_format
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+            kwargs["response_format"] = response_format
+
+        async with self._completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=60.0,
+            **kwargs,
+        ) as response:
+            pass
 
-        completion = data["choices"][0]["message"]["content"]
-        usage = data.get("usage", {})
+        completion = response.choices[0].message.content
+        usage = response.usage.model_dump(exclude_none=True) if response.usage else {}
 
         logger.debug(
             f"OpenRouter completion: model={self.model}, "
@@ -154,14 +192,14 @@ class OpenRouterProvider:
         logger.info(f"Base URL: {self.base_url}")
 
         try:
-            response = await self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=messages,  # type: ignore
-                tools=tools,  # type: ignore
+            async with self._completion(
+                messages=messages,
+                tools=tools,
                 tool_choice="auto",
                 temperature=temperature,
                 max_tokens=max_tokens,
-            )
+            ) as response:
+                pass
             logger.info(f"=== OPENROUTER REQUEST SUCCESS ===")
         except Exception as e:
             logger.error(f"=== OPENROUTER REQUEST FAILED ===: {e}", exc_info=True)
@@ -175,3 +213,131 @@ class OpenRouterProvider:
             )
 
         return response
+
+    async def complete_json(
+        self,
+        messages: list[dict[str, Any]],
+        schema: dict[str, Any],
+        schema_name: str,
+        temperature: float = 0.7,
+        max_tokens: int = 16384,
+    ) -> dict:
+        """
+        Generate a completion constrained to a JSON schema (structured output).
+
+        Args:
+            messages: List of message dicts (system, user)
+            schema: JSON schema the response must follow
+            schema_name: Name reported to the API for the schema
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Dict with 'data' (parsed JSON), 'usage' and 'model'
+
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        if not self.api_key:
+            raise ValueError("OpenRouter API key not configured")
+
+        logger.info(f"OpenRouter structured request: model={self.model}, schema={schema_name}")
+
+        async with self._completion(
+            messages=messages,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": schema_name, "schema": schema},
+            },
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ) as response:
+            pass
+
+        content = response.choices[0].message.content or ""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Structured response is not valid JSON: {e}") from e
+
+        if response.usage:
+            logger.info(
+                f"OpenRouter structured completion: model={self.model}, "
+                f"tokens={response.usage.total_tokens}"
+            )
+
+        return {
+            "data": data,
+            "usage": response.usage,
+            "model": self.model,
+        }
+
+    async def stream_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Streaming variant of complete_with_tools (stream=True).
+
+        Yields raw chunks as tokens arrive; tool call names and JSON arguments
+        come through as deltas that the caller accumulates. The final chunk
+        carries token usage.
+
+        Args:
+            messages: List of message dicts (system, user, assistant, tool)
+            tools: List of tool definitions in OpenAI format
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            ChatCompletionChunk objects
+        """
+        if not self.api_key:
+            raise ValueError("OpenRouter API key not configured")
+
+        logger.info(
+            f"OpenRouter streaming request: model={self.model}, "
+            f"messages={len(messages)}, tools={len(tools)}"
+        )
+
+        try:
+            async with self._completion(
+                messages=messages,
+                tools=tools,
+                tool_choice="auto",
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+            ) as stream:
+                async for chunk in stream:
+                    if chunk.usage:
+                        logger.info(
+                            f"OpenRouter streamed tool completion: model={self.model}, "
+                            f"tokens={chunk.usage.total_tokens}"
+                        )
+                    yield chunk
+        except Exception as e:
+            logger.error(f"=== OPENROUTER STREAM FAILED ===: {e}", exc_info=True)
+            raise
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Backoff before retrying: the server's Retry-After if given, else exponential."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), 60.0)
+        except ValueError:
+            pass
+    return min(2.0**attempt, 30.0)
+
+
+@lru_cache
+def get_openrouter_provider() -> OpenRouterProvider:
+    """Get the process-wide OpenRouter provider (one AsyncOpenAI client per process)"""
+    return OpenRouterProvider()
@@ -2,9 +2,9 @@
 Unsplash Provider - fetches stock images based on keywords
 """
 
-import httpx
 from packages.common.core.config import settings
 from packages.common.core.logging import get_logger
+from packages.common.providers.http_client import get_http_client
 
 logger = get_logger(__name__)
 
@@ -36,33 +36,33 @@ class UnsplashProvider:
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search/photos",
-                    params={
-                        "query": query,
-                        "orientation": orientation,
-                        "per_page": 1,
-                    },
-                    headers={
-                        "Authorization": f"Client-ID {self.access_key}",
-                    },
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get("results") and len(data["results"]) > 0:
-                    photo = data["results"][0]
-                    return {
-                        "url": photo["urls"]["regular"],  # 1080px wide
-                        "thumb_url": photo["urls"]["small"],  # 400px wide
-                        "alt": photo.get("alt_description") or photo.get("description") or query,
-                        "photographer": photo["user"]["name"],
-                        "photographer_url": photo["user"]["links"]["html"],
-                        "unsplash_url": photo["links"]["html"],
-                    }
-                return None
+            client = get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/search/photos",
+                params={
+                    "query": query,
+                    "orientation": orientation,
+                    "per_page": 1,
+                },
+                headers={
+                    "Authorization": f"Client-ID {self.access_key}",
+                },
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get("results") and len(data["results"]) > 0:
+                photo = data["results"][0]
+                return {
+                    "url": photo["urls"]["regular"],  # 1080px wide
+                    "thumb_url": photo["urls"]["small"],  # 400px wide
+                    "alt": photo.get("alt_description") or photo.get("description") or query,
+                    "photographer": photo["user"]["name"],
+                    "photographer_url": photo["user"]["links"]["html"],
+                    "unsplash_url": photo["links"]["html"],
+                }
+            return None
 
         except Exception as e:
             # Log error but don't fail slide generation
@@ -84,29 +84,29 @@ class UnsplashProvider:
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/photos/random",
-                    params={
-                        "query": query,
-                        "orientation": orientation,
-                    },
-                    headers={
-                        "Authorization": f"Client-ID {self.access_key}",
-                    },
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                photo = response.json()
-
-                return {
-                    "url": photo["urls"]["regular"],
-                    "thumb_url": photo["urls"]["small"],
-                    "alt": photo.get("alt_description") or photo.get("description") or query,
-                    "photographer": photo["user"]["name"],
-                    "photographer_url": photo["user"]["links"]["html"],
-                    "unsplash_url": photo["links"]["html"],
-                }
+            client = get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/photos/random",
+                params={
+                    "query": query,
+                    "orientation": orientation,
+                },
+                headers={
+                    "Authorization": f"Client-ID {self.access_key}",
+                },
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            photo = response.json()
+
+            return {
+                "url": photo["urls"]["regular"],
+                "thumb_url": photo["urls"]["small"],
+                "alt": photo.get("alt_description") or photo.get("description") or query,
+                "photographer": photo["user"]["name"],
+                "photographer_url": photo["user"]["links"]["html"],
+                "unsplash_url": photo["links"]["html"],
+            }
 
         except Exception as e:
             logger.error(f"Unsplash API error for random image '{query}': {e}")
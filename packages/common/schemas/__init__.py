@@ -7,6 +7,15 @@ from packages.common.schemas.api_key_schema import (
     APIKeyUpdate,
     APIKeyValidation,
 )
+from packages.common.schemas.export_schema import (
+    BulkExportRequest,
+    ExportFormat,
+)
+from packages.common.schemas.job_schema import (
+    GenerationJobProgress,
+    GenerationJobResponse,
+    JobStatus,
+)
 from packages.common.schemas.slide_schema import (
     SlideBase,
     SlideCreate,
@@ -16,6 +25,7 @@ from packages.common.schemas.slide_schema import (
 from packages.common.schemas.presentation_schema import (
     GenerateSlidesRequest,
     GenerateSlidesResponse,
+    GenerationMode,
     PresentationBase,
     PresentationCreate,
     PresentationResponse,
@@ -54,6 +64,13 @@ __all__ = [
     "APIKeyResponse",
     "APIKeyUpdate",
     "APIKeyValidation",
+    # Exports
+    "BulkExportRequest",
+    "ExportFormat",
+    # Generation jobs
+    "GenerationJobProgress",
+    "GenerationJobResponse",
+    "JobStatus",
     # Slides
     "SlideBase",
     "SlideCreate",
@@ -62,6 +79,7 @@ __all__ = [
     # Presentations
     "GenerateSlidesRequest",
     "GenerateSlidesResponse",
+    "GenerationMode",
     "PresentationBase",
     "PresentationCreate",
     "PresentationResponse",
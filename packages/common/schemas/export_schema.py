@@ -0,0 +1,23 @@
+"""
+Export schemas
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+ExportFormat = Literal["pdf", "pptx"]
+
+MAX_BULK_EXPORT_PRESENTATIONS = 500
+
+
+class BulkExportRequest(BaseModel):
+    """Request to export many presentations as one ZIP archive"""
+
+    presentation_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_EXPORT_PRESENTATIONS,
+        description="Presentations to export, owned by the calling API key",
+    )
+    format: ExportFormat = Field(default="pptx", description="File format of every export")
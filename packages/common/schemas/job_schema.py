@@ -0,0 +1,30 @@
+"""
+Background generation job schemas
+"""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+JobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+class GenerationJobProgress(BaseModel):
+    """Progress of a running generation job"""
+
+    message: str | None = None
+    slides_created: int = 0
+    slide_count: int = Field(..., description="Target number of slides")
+
+
+class GenerationJobResponse(BaseModel):
+    """Status of a background generation job"""
+
+    id: str
+    status: JobStatus
+    progress: GenerationJobProgress
+    presentation_id: int | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
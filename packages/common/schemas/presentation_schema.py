@@ -3,6 +3,7 @@ Presentation schemas for API request/response validation
 """
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -55,6 +56,11 @@ class PresentationListResponse(BaseModel):
 
 # Generation schemas
 
+# agent: incremental tool-calling loop (one LLM round trip per slide)
+# single_shot: whole deck in one structured-output call, agent loop as fallback
+# outline: outline call, then every slide written concurrently, agent loop as fallback
+GenerationMode = Literal["agent", "single_shot", "outline"]
+
 
 class SalesContext(BaseModel):
     """Context for sales-focused slide generation"""
@@ -108,6 +114,17 @@ class GenerateSlidesRequest(BaseModel):
         default=None,
         description="Optional sales context for generating sales-focused content",
     )
+    generation_mode: GenerationMode = Field(
+        default="agent",
+        description=(
+            "Generation strategy: agent (tool-calling loop), single_shot (whole deck in one call) "
+            "or outline (outline first, then all slides in parallel)"
+        ),
+    )
+    bypass_cache: bool = Field(
+        default=False,
+        description="Always run a fresh generation instead of reusing an identical earlier one",
+    )
 
 
 class GenerateSlidesResponse(BaseModel):
@@ -0,0 +1,221 @@
+"""
+API key validation cache
+Keeps recently validated API keys in memory for a short TTL so most public
+API requests authenticate without touching the database, and batches the
+last_used_at updates into one statement every few seconds. Changes to a key
+drop it from the cache; with api_key_invalidation = "redis" they are
+broadcast so every worker process drops it too.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import case, func, literal, update
+
+from packages.common.core.config import settings
+from packages.common.core.database import async_session_factory
+from packages.common.core.logging import get_logger
+from packages.common.core.redis import get_redis
+from packages.common.models.api_key import APIKey
+from packages.common.schemas.api_key_schema import APIKeyValidation
+
+logger = get_logger(__name__)
+
+INVALIDATION_CHANNEL = "decksnap:api_keys:invalidate"
+RESUBSCRIBE_DELAY_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class CachedKey:
+    """A validated key as cached: what handlers see plus when the key expires."""
+
+    validation: APIKeyValidation
+    expires_at: datetime | None
+    cached_at: float
+
+
+class APIKeyCache:
+    """
+    In-process TTL cache of validated API keys, keyed by key hash.
+
+    Only valid keys are cached. Entries live for ttl_seconds at most, so a
+    change that misses the invalidation (e.g. made directly in the
+    database) is picked up within that time.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        flush_interval: float,
+        broadcast: bool = False,
+        enabled: bool = True,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.broadcast = broadcast
+        self.enabled = enabled
+        self._entries: OrderedDict[str, CachedKey] = OrderedDict()
+        self._hash_by_id: dict[int, str] = {}
+        self._generation = 0  # Bumped on every invalidation
+        self._last_used: dict[int, datetime] = {}  # Pending last_used_at writes
+        self._tasks: list[asyncio.Task] = []
+        self.hits = 0
+        self.misses = 0
+        self.flushed = 0
+
+    @property
+    def generation(self) -> int:
+        """Take before loading a key from the database and pass to put()."""
+        return self._generation
+
+    def get(self, key_hash: str) -> CachedKey | None:
+        """Return the cached key for a hash, or None if not cached or stale."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key_hash)
+        if entry is None or time.monotonic() - entry.cached_at > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key_hash)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key_hash: str,
+        validation: APIKeyValidation,
+        expires_at: datetime | None,
+        generation: int,
+    ) -> None:
+        """
+        Cache a validated key.
+
+        Skipped if any key was invalidated since generation was taken, so a
+        lookup racing a revoke can't cache the revoked key.
+        """
+        if not self.enabled or generation != self._generation:
+            return
+        self._entries[key_hash] = CachedKey(validation, expires_at, time.monotonic())
+        self._entries.move_to_end(key_hash)
+        self._hash_by_id[validation.id] = key_hash
+        while len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._hash_by_id.pop(evicted.validation.id, None)
+
+    def touch(self, key_id: int) -> None:
+        """Record a use of a key; written to last_used_at by the next flush."""
+        self._last_used[key_id] = datetime.now(UTC)
+
+    async def invalidate(self, key_id: int) -> None:
+        """Drop a key after it was changed, on every worker when broadcasting."""
+        self._drop(key_id)
+        if self.broadcast:
+            try:
+                await get_redis().publish(INVALIDATION_CHANNEL, str(key_id))
+            except Exception as e:
+                logger.warning(f"Failed to broadcast API key invalidation: {e}")
+
+    def _drop(self, key_id: int) -> None:
+        self._generation += 1
+        key_hash = self._hash_by_id.pop(key_id, None)
+        if key_hash is not None:
+            self._entries.pop(key_hash, None)
+
+    def clear(self) -> None:
+        """Drop every cached key."""
+        self._generation += 1
+        self._entries.clear()
+        self._hash_by_id.clear()
+
+    async def start(self) -> None:
+        """Start the last_used_at flusher and, when broadcasting, the invalidation listener."""
+        if not self.enabled:
+            return
+        if self.broadcast:
+            await get_redis().ping()
+            logger.info("Broadcasting API key invalidations through Redis")
+        self._tasks = [asyncio.create_task(self._flush_loop(), name="api-key-last-used-flusher")]
+        if self.broadcast:
+            self._tasks.append(asyncio.create_task(self._listen(), name="api-key-invalidation"))
+
+    async def stop(self) -> None:
+        """Stop the background tasks and write any pending last_used_at values."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending last_used_at values in a single UPDATE."""
+        if not self._last_used:
+            return
+        pending, self._last_used = self._last_used, {}
+        used_at_by_id = case(
+            {key_id: literal(used_at, APIKey.last_used_at.type) for key_id, used_at in pending.items()},
+            value=APIKey.id,
+        )
+
+        try:
+            async with async_session_factory() as db:
+                await db.execute(
+                    update(APIKey)
+                    .where(APIKey.id.in_(pending))
+                    # GREATEST skips NULL and keeps a newer value written by another worker
+                    .values(last_used_at=func.greatest(APIKey.last_used_at, used_at_by_id))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+            self.flushed += len(pending)
+        except Exception as e:
+            logger.warning(f"Failed to update last_used_at for {len(pending)} API keys: {e}")
+            for key_id, used_at in pending.items():
+                # Retry next time unless a newer use was recorded meanwhile
+                if key_id not in self._last_used:
+                    self._last_used[key_id] = used_at
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _listen(self) -> None:
+        """Drop keys invalidated by other workers; clear everything after a reconnect."""
+        while True:
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.clear()  # Messages may have been missed while not subscribed
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._drop(int(message["data"]))
+            except Exception as e:
+                logger.warning(f"API key invalidation listener failed, retrying: {e}")
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters for metrics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending_last_used": len(self._last_used),
+            "flushed_last_used": self.flushed,
+        }
+
+
+# Singleton instance
+api_key_cache = APIKeyCache(
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    max_entries=settings.api_key_cache_max_entries,
+    flush_interval=settings.api_key_last_used_flush_seconds,
+    broadcast=settings.api_key_invalidation == "redis",
+    enabled=settings.api_key_cache_enabled,
+)
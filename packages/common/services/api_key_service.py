@@ -4,7 +4,7 @@ API Key Service - handles API key creation, validation, and management
 
 import hashlib
 import secrets
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +17,7 @@ from packages.common.schemas.api_key_schema import (
     APIKeyUpdate,
     APIKeyValidation,
 )
+from packages.common.services.api_key_cache import api_key_cache
 
 
 class APIKeyService:
@@ -96,10 +97,22 @@ class APIKeyService:
         Validate an API key and return its data if valid.
         Updates last_used_at timestamp.
         Returns None if key is invalid, inactive, or expired.
+
+        Valid keys are served from the API key cache for a short TTL, and
+        last_used_at is written in batches by its flusher. With the cache
+        disabled every call reads the key and updates last_used_at directly.
         """
         key_hash = self.hash_key(raw_key)
 
+        cached = api_key_cache.get(key_hash)
+        if cached:
+            if cached.expires_at and cached.expires_at < datetime.now(UTC):
+                return None
+            api_key_cache.touch(cached.validation.id)
+            return cached.validation
+
         # Find the key
+        generation = api_key_cache.generation
         result = await db.execute(select(APIKey).where(APIKey.key_hash == key_hash))
         api_key = result.scalar_one_or_none()
 
@@ -111,27 +124,33 @@ class APIKeyService:
             return None
 
         # Check if expired
-        if api_key.expires_at and api_key.expires_at < datetime.now(timezone.utc):
+        if api_key.expires_at and api_key.expires_at < datetime.now(UTC):
             return None
 
-        # Update last_used_at
-        await db.execute(
-            update(APIKey)
-            .where(APIKey.id == api_key.id)
-            .values(last_used_at=datetime.now(timezone.utc))
-        )
-        await db.commit()
-
         # Parse scopes
         scopes = [s.strip() for s in api_key.scopes.split(",") if s.strip()]
 
-        return APIKeyValidation(
+        validation = APIKeyValidation(
             id=api_key.id,
             name=api_key.name,
             scopes=scopes,
             is_active=api_key.is_active,
         )
 
+        if api_key_cache.enabled:
+            api_key_cache.put(key_hash, validation, api_key.expires_at, generation)
+            api_key_cache.touch(api_key.id)
+        else:
+            # Update last_used_at
+            await db.execute(
+                update(APIKey)
+                .where(APIKey.id == api_key.id)
+                .values(last_used_at=datetime.now(UTC))
+            )
+            await db.commit()
+
+        return validation
+
     async def get_key(self, db: AsyncSession, key_id: int) -> APIKeyResponse | None:
         """Get an API key by ID"""
         result = await db.execute(select(APIKey).where(APIKey.id == key_id))
@@ -180,6 +199,7 @@ class APIKeyService:
             setattr(api_key, field, value)
 
         await db.commit()
+        await api_key_cache.invalidate(key_id)
         await db.refresh(api_key)
 
         return APIKeyResponse.model_validate(api_key)
@@ -194,6 +214,7 @@ class APIKeyService:
 
         api_key.is_active = False
         await db.commit()
+        await api_key_cache.invalidate(key_id)
 
         return True
 
@@ -207,6 +228,7 @@ class APIKeyService:
 
         await db.delete(api_key)
         await db.commit()
+        await api_key_cache.invalidate(key_id)
 
         return True
 
@@ -0,0 +1,137 @@
+"""
+Bulk export
+Renders many presentations with bounded parallelism and streams them as one
+ZIP archive, adding each file as soon as it is ready, so neither the
+archive nor the set of exports is ever held in memory.
+"""
+
+import asyncio
+import re
+import time
+import zipfile
+from collections.abc import AsyncIterator, Sequence
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.models import Presentation
+from packages.common.services.export_cache import ExportFile, Writer, export_cache
+from packages.common.services.render_pool import PresentationSnapshot, RenderPoolBusyError
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+MAX_BUSY_RETRIES = 3  # Retries of a render rejected because the pool is full
+
+
+class _ChunkSink:
+    """Write-only, unseekable stream collecting what ZipFile writes until drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _archive_name(snapshot: PresentationSnapshot, fmt: str) -> str:
+    title = re.sub(r"[^\w\- ]+", "", snapshot.title or "").strip()[:80] or "presentation"
+    return f"{snapshot.id}-{title}.{fmt}"
+
+
+async def _render(writer: Writer, snapshot: PresentationSnapshot, fmt: str) -> ExportFile:
+    """Render through the export cache, waiting out a busy render pool."""
+    attempt = 0
+    while True:
+        try:
+            return await export_cache.render(writer, snapshot, fmt)
+        except RenderPoolBusyError as e:
+            if attempt >= MAX_BUSY_RETRIES:
+                raise
+            attempt += 1
+            await asyncio.sleep(e.retry_after)
+
+
+def stream_export_zip(
+    presentations: Sequence[Presentation],
+    fmt: str,
+    writer: Writer,
+) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive of presentation exports.
+
+    The presentations are snapshotted immediately, so the database session
+    may close before streaming starts. At most bulk_export_concurrency
+    exports are rendering or rendered and waiting to be sent at once, so
+    a slow client holds back rendering instead of letting finished files
+    pile up on disk. Exports that fail are listed in errors.txt instead
+    of aborting the archive.
+
+    Args:
+        presentations: Presentations with slides loaded
+        fmt: File extension of the exports (pdf, pptx)
+        writer: Picklable writer used by the single-file export route
+    """
+    snapshots = [PresentationSnapshot.from_model(p) for p in presentations]
+    return _stream_zip(snapshots, fmt, writer)
+
+
+async def _stream_zip(
+    snapshots: list[PresentationSnapshot],
+    fmt: str,
+    writer: Writer,
+) -> AsyncIterator[bytes]:
+    # Taken before a render starts and released once its file is in the archive
+    slots = asyncio.Semaphore(settings.bulk_export_concurrency)
+
+    async def render(snapshot: PresentationSnapshot) -> tuple[PresentationSnapshot, ExportFile | None, str | None]:
+        await slots.acquire()
+        try:
+            return snapshot, await _render(writer, snapshot, fmt), None
+        except Exception as e:
+            logger.warning(f"Bulk export of presentation {snapshot.id} failed: {e!r}")
+            return snapshot, None, str(e) or type(e).__name__
+
+    tasks = [asyncio.create_task(render(snapshot)) for snapshot in snapshots]
+    sink = _ChunkSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+    errors: list[str] = []
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            snapshot, export, error = await next_done
+            if export is None:
+                errors.append(f"{snapshot.id}\t{error}")
+                slots.release()
+                continue
+            try:
+                info = zipfile.ZipInfo(_archive_name(snapshot, fmt), date_time=time.localtime()[:6])
+                info.file_size = export.path.stat().st_size  # Lets zipfile pick zip64 up front
+                with export.path.open("rb") as source, archive.open(info, mode="w") as entry:
+                    while chunk := await asyncio.to_thread(source.read, CHUNK_SIZE):
+                        entry.write(chunk)
+                        yield sink.drain()
+                yield sink.drain()
+            finally:
+                export.cleanup()
+                slots.release()
+
+        if errors:
+            archive.writestr("errors.txt", "presentation_id\terror\n" + "\n".join(errors) + "\n")
+        archive.close()
+        yield sink.drain()
+    finally:
+        # Client went away or something failed: stop rendering, drop unsent files
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.result()[1] is not None:
+                task.result()[1].cleanup()
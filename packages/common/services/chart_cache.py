@@ -0,0 +1,103 @@
+"""
+Chart render cache
+Memoizes rendered chart images by chart content and theme colors in a small
+in-memory LRU backed by a size-bounded disk LRU, so repeated exports and
+decks sharing charts skip matplotlib entirely.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.services.export_cache import DiskLRU
+
+logger = get_logger(__name__)
+
+
+class ChartCache:
+    """
+    Two-level LRU cache of rendered chart images.
+
+    The memory level is per process (each render worker keeps its own);
+    the disk level is a DiskLRU of at most max_disk_bytes shared by every
+    worker on the host.
+    """
+
+    def __init__(self, root: str, max_memory_entries: int, max_disk_bytes: int, enabled: bool = True):
+        self.disk = DiskLRU(root, max_disk_bytes)
+        self.max_memory_entries = max_memory_entries
+        self.enabled = enabled
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Content hash of everything that determines a chart image."""
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        """Return the cached image for key, rendering and storing it on a miss."""
+        if not self.enabled:
+            return render()
+
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+
+        data = self._read_disk(key)
+        if data is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            data = render()
+            self._write_disk(key, data)
+
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+        return data
+
+    def _read_disk(self, key: str) -> bytes | None:
+        try:
+            return self.disk.read(f"{key[:2]}/{key}")
+        except OSError as e:
+            logger.warning(f"Chart cache read failed: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        try:
+            self.disk.write(f"{key[:2]}/{key}", data)
+        except OSError as e:
+            logger.warning(f"Chart cache write failed: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters for metrics."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance
+chart_cache = ChartCache(
+    root=settings.chart_cache_dir,
+    max_memory_entries=settings.chart_cache_memory_entries,
+    max_disk_bytes=settings.chart_cache_max_bytes,
+    enabled=settings.chart_cache_enabled,
+)
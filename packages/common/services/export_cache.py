@@ -0,0 +1,474 @@
+"""
+Export artifact cache
+Stores rendered PDF/PPTX files keyed by a digest of the presentation's
+content, theme and renderer, so unchanged decks are not re-rendered.
+Exports are handed to routes as files, so they can be streamed from disk
+instead of being held in memory.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from packages.common.core.config import settings
+from packages.common.core.database import async_session_factory
+from packages.common.core.logging import get_logger
+from packages.common.models import Presentation
+from packages.common.services.render_pool import PresentationSnapshot, render_pool
+
+logger = get_logger(__name__)
+
+# Bump when renderer output changes so previously cached files are ignored
+RENDERER_VERSION = "3"
+
+# Share of a DiskLRU's max_bytes a process writes before rescanning the
+# directory for what other processes have written
+RESCAN_FRACTION = 0.1
+
+
+Writer = Callable[[PresentationSnapshot, BinaryIO], None]
+
+
+@dataclass
+class ExportFile:
+    """A rendered export on local disk, owned by the request serving it."""
+
+    path: Path
+
+    def cleanup(self) -> None:
+        """Delete the file once the response has been sent."""
+        self.path.unlink(missing_ok=True)
+
+
+def export_key(snapshot: PresentationSnapshot, fmt: str, renderer: Writer) -> str:
+    """Digest of everything that determines an export's bytes."""
+    payload = json.dumps(
+        {
+            "version": RENDERER_VERSION,
+            "format": fmt,
+            "renderer": f"{renderer.__module__}.{renderer.__qualname__}",
+            "chart_renderer": settings.pdf_chart_renderer,
+            "pptx_fast_writer": settings.pptx_fast_writer_enabled,
+            "images": [
+                settings.export_image_normalize,
+                settings.export_image_dpi,
+                settings.export_image_quality,
+            ],
+            "title": snapshot.title,
+            "theme": snapshot.theme,
+            "slides": [
+                {k: v for k, v in asdict(slide).items() if k != "id"}
+                for slide in sorted(snapshot.slides, key=lambda s: s.order)
+            ],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return f"{hashlib.sha256(payload.encode()).hexdigest()}.{fmt}"
+
+
+class ExportStore(ABC):
+    """Storage backend for rendered exports, grouped by presentation."""
+
+    @abstractmethod
+    async def fetch(self, presentation_id: int, key: str, dest: Path) -> bool:
+        """Copy a stored export to dest; return False if it is not stored."""
+
+    @abstractmethod
+    async def exists(self, presentation_id: int, key: str) -> bool:
+        """Whether an export is stored."""
+
+    @abstractmethod
+    async def put(self, presentation_id: int, key: str, source: Path) -> None:
+        """Store a copy of the export at source."""
+
+    @abstractmethod
+    async def invalidate(self, presentation_id: int) -> None:
+        """Drop every stored export of a presentation."""
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hard link source to dest (no data copied), copying across filesystems."""
+    try:
+        os.link(source, dest)
+    except FileNotFoundError:
+        raise
+    except OSError:  # e.g. EXDEV, or no hard link support
+        shutil.copyfile(source, dest)
+
+
+class DiskLRU:
+    """
+    Size-bounded cache directory shared by every process on the host.
+
+    Files live at <root>/<name>, where name is "<directory>/<file>". They
+    are written atomically, and once the total size passes max_bytes the
+    least recently used are deleted. A file's mtime records its last use.
+    With ttl_seconds set, mtime is instead the write time: older files read
+    as missing and are evicted first, and the atime records last use.
+
+    Each process tallies its own writes on top of the directory size it
+    last scanned, and rescans after writing RESCAN_FRACTION of max_bytes,
+    so other processes' writes are seen too: the directory exceeds
+    max_bytes by at most that fraction per writing process.
+    """
+
+    def __init__(self, root: str, max_bytes: int, ttl_seconds: float | None = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._total: int | None = None  # Size at the last scan plus our writes since
+        self._unscanned = 0  # Bytes written by this process since the last scan
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def read(self, name: str) -> bytes | None:
+        """Return a file's bytes, or None if it is missing or expired."""
+        path = self.path(name)
+        try:
+            if self._expired(path):
+                return None
+            data = path.read_bytes()
+            self._touch(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def link(self, name: str, dest: Path) -> bool:
+        """Hard link (or copy) a file to dest; return False if it is missing or expired."""
+        path = self.path(name)
+        try:
+            if self._expired(path):
+                return False
+            _link_or_copy(path, dest)
+            self._touch(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def exists(self, name: str) -> bool:
+        path = self.path(name)
+        try:
+            return path.exists() and not self._expired(path)
+        except FileNotFoundError:
+            return False
+
+    def write(self, name: str, data: bytes) -> None:
+        """Store bytes under name."""
+        self._store(name, lambda tmp_path: tmp_path.write_bytes(data))
+
+    def put(self, name: str, source: Path) -> None:
+        """Store a copy of the file at source under name, hard linked where possible."""
+        self._store(name, lambda tmp_path: _link_or_copy(source, tmp_path))
+
+    def remove(self, directory: str) -> None:
+        """Delete a directory of files."""
+        with self._lock:
+            shutil.rmtree(self.root / directory, ignore_errors=True)
+            self._total = None  # Recount on next write
+
+    def _store(self, name: str, fill: Callable[[Path], object]) -> None:
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            fill(tmp_path)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)  # Atomic, so readers never see partial files
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._unscanned += size
+            if self._total is None or self._unscanned > self.max_bytes * RESCAN_FRACTION:
+                self._total = sum(size for _, size, _ in self._files())
+                self._unscanned = 0
+            else:
+                self._total += size
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _expired(self, path: Path) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return time.time() - path.stat().st_mtime > self.ttl_seconds
+
+    def _touch(self, path: Path) -> None:
+        """Mark a file as recently used."""
+        if self.ttl_seconds is None:
+            os.utime(path)
+        else:
+            os.utime(path, (time.time(), path.stat().st_mtime))  # Keep the write time
+
+    def _files(self) -> list[tuple[float, int, Path]]:
+        files = []
+        for path in self.root.glob("*/*"):
+            if path.name.startswith(".") or path.parent.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            last_used = stat.st_mtime if self.ttl_seconds is None else stat.st_atime
+            files.append((last_used, stat.st_size, path))
+        return files
+
+    def _evict(self) -> None:
+        """Delete expired files, then least recently used ones, until under the size limit."""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        if self.ttl_seconds is not None:
+            unexpired = []
+            for entry in files:
+                _, size, path = entry
+                try:
+                    expired = self._expired(path)
+                except FileNotFoundError:
+                    expired = True
+                if expired:
+                    path.unlink(missing_ok=True)
+                    total -= size
+                else:
+                    unexpired.append(entry)
+            files = unexpired
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+        self._unscanned = 0
+
+
+class LocalDiskExportStore(ExportStore):
+    """
+    Exports on local disk under <root>/<presentation_id>/<key>.
+
+    Files are handed out as hard links, so eviction or invalidation never
+    cuts off a download in progress.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.files = DiskLRU(root, max_bytes)
+
+    async def fetch(self, presentation_id: int, key: str, dest: Path) -> bool:
+        return await asyncio.to_thread(self.files.link, f"{presentation_id}/{key}", dest)
+
+    async def exists(self, presentation_id: int, key: str) -> bool:
+        return await asyncio.to_thread(self.files.exists, f"{presentation_id}/{key}")
+
+    async def put(self, presentation_id: int, key: str, source: Path) -> None:
+        await asyncio.to_thread(self.files.put, f"{presentation_id}/{key}", source)
+
+    async def invalidate(self, presentation_id: int) -> None:
+        await asyncio.to_thread(self.files.remove, str(presentation_id))
+
+
+class ExportCache:
+    """
+    Serves exports from a store, rendering in the render pool on a miss.
+
+    With prerendering on, newly generated decks are rendered in the
+    background at low priority so the first export request is a hit.
+    """
+
+    def __init__(self, store: ExportStore, tmp_dir: str, enabled: bool = True, prerender: bool = False):
+        self.store = store
+        self.tmp_dir = Path(tmp_dir)
+        self.enabled = enabled
+        self.prerender_enabled = prerender
+        self._writers: dict[str, Writer] = {}
+        self._prerenders: dict[int, asyncio.Task[None]] = {}
+        self._warming: dict[str, asyncio.Future[None]] = {}  # Started background renders by key
+        self.hits = 0
+        self.misses = 0
+        self.prerendered = 0
+
+    async def render(
+        self,
+        writer: Writer,
+        presentation: Presentation | PresentationSnapshot,
+        fmt: str,
+    ) -> ExportFile:
+        """
+        Get the export of a presentation as a file, from cache when its content is unchanged.
+
+        The caller owns the returned file and must call cleanup() after
+        serving it.
+
+        Args:
+            writer: Picklable function writing the export to a binary file,
+                run in the render pool on a miss
+            presentation: Presentation with slides loaded, or a snapshot of one
+            fmt: File extension of the export (pdf, pptx)
+        """
+        snapshot = PresentationSnapshot.from_model(presentation)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        export = ExportFile(self.tmp_dir / f"{uuid.uuid4().hex}.{fmt}")
+
+        try:
+            if not self.enabled:
+                await render_pool.render_to_file(writer, snapshot, str(export.path))
+                return export
+
+            key = export_key(snapshot, fmt, writer)
+            if await self._fetch(snapshot.id, key, export.path):
+                self.hits += 1
+                return export
+
+            warming = self._warming.get(key)
+            if warming is not None:
+                # A background render of this export is running; wait for it
+                await asyncio.wait([warming])
+                if await self._fetch(snapshot.id, key, export.path):
+                    self.hits += 1
+                    return export
+
+            self.misses += 1
+            await render_pool.render_to_file(writer, snapshot, str(export.path))
+            try:
+                await self.store.put(snapshot.id, key, export.path)
+            except OSError as e:
+                logger.warning(f"Export cache write failed: {e}")
+            return export
+        except BaseException:
+            export.cleanup()
+            raise
+
+    async def _fetch(self, presentation_id: int, key: str, dest: Path) -> bool:
+        try:
+            return await self.store.fetch(presentation_id, key, dest)
+        except OSError as e:
+            logger.warning(f"Export cache read failed: {e}")
+            return False
+
+    def start_prerender(self, writers: dict[str, Writer]) -> None:
+        """
+        Set the writers used to prerender new decks, by file extension.
+
+        They must be the writers the export routes use, since the writer is
+        part of the cache key. Prerendering stays off with a single render
+        worker, which is kept for interactive exports.
+        """
+        if self.prerender_enabled and not render_pool.background_workers:
+            logger.warning("Export prerendering needs at least 2 render workers; disabled")
+            return
+        self._writers = dict(writers)
+
+    def stop_prerender(self) -> None:
+        """Cancel background renders on shutdown."""
+        for task in self._prerenders.values():
+            task.cancel()
+        self._prerenders.clear()
+
+    def prerender(self, presentation: Presentation) -> None:
+        """Render a freshly committed presentation's exports in the background."""
+        if not (self.enabled and self.prerender_enabled and self._writers):
+            return
+        snapshot = PresentationSnapshot.from_model(presentation)
+        self._cancel_prerender(snapshot.id)
+        task = asyncio.create_task(self._prerender(snapshot))
+        self._prerenders[snapshot.id] = task
+        task.add_done_callback(functools.partial(self._prerender_done, snapshot.id))
+
+    def _prerender_done(self, presentation_id: int, task: asyncio.Task[None]) -> None:
+        if self._prerenders.get(presentation_id) is task:
+            del self._prerenders[presentation_id]
+
+    def _cancel_prerender(self, presentation_id: int) -> None:
+        task = self._prerenders.pop(presentation_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _prerender(self, snapshot: PresentationSnapshot) -> None:
+        for fmt, writer in self._writers.items():
+            key = export_key(snapshot, fmt, writer)
+            try:
+                if await self.store.exists(snapshot.id, key):
+                    continue
+                # Low priority: only start once a worker is idle
+                await render_pool.wait_for_idle_worker()
+                await self._warm(snapshot, fmt, key, writer)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Prerendering {fmt} for presentation {snapshot.id} failed: {e}")
+
+    async def _warm(self, snapshot: PresentationSnapshot, fmt: str, key: str, writer: Writer) -> None:
+        """Render and store one export, letting interactive requests for it wait on the result."""
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._warming[key] = done
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        path = self.tmp_dir / f"{uuid.uuid4().hex}.{fmt}"
+        try:
+            await render_pool.render_to_file(writer, snapshot, str(path), background=True)
+            if not await self._is_current(snapshot.id, fmt, key, writer):
+                # Edited or deleted meanwhile, possibly in another process
+                # whose invalidate() couldn't cancel this render
+                logger.info(f"Discarding stale {fmt} prerender for presentation {snapshot.id}")
+                return
+            await self.store.put(snapshot.id, key, path)
+            self.prerendered += 1
+        finally:
+            done.set_result(None)
+            if self._warming.get(key) is done:
+                del self._warming[key]
+            path.unlink(missing_ok=True)
+
+    async def _is_current(self, presentation_id: int, fmt: str, key: str, writer: Writer) -> bool:
+        """Whether the presentation still exists with the content that key was computed from."""
+        async with async_session_factory() as db:
+            result = await db.execute(
+                select(Presentation)
+                .where(Presentation.id == presentation_id)
+                .options(selectinload(Presentation.slides))
+            )
+            presentation = result.scalar_one_or_none()
+            if presentation is None:
+                return False
+            return export_key(PresentationSnapshot.from_model(presentation), fmt, writer) == key
+
+    async def invalidate(self, presentation_id: int) -> None:
+        """Drop cached exports after a presentation is edited or deleted."""
+        self._cancel_prerender(presentation_id)
+        if not self.enabled:
+            return
+        try:
+            await self.store.invalidate(presentation_id)
+        except OSError as e:
+            logger.warning(f"Export cache invalidation failed: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters for metrics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "prerendered": self.prerendered,
+            "prerendering": len(self._prerenders),
+        }
+
+
+# Singleton instance
+export_cache = ExportCache(
+    LocalDiskExportStore(settings.export_cache_dir, settings.export_cache_max_bytes),
+    tmp_dir=os.path.join(settings.export_cache_dir, ".responses"),
+    enabled=settings.export_cache_enabled,
+    prerender=settings.export_prerender_enabled,
+)
@@ -4,43 +4,174 @@ DRY: Used by both slides_api and public_api
 """
 
 import base64
+import mimetypes
+from collections.abc import Callable, Iterable
 from io import BytesIO
+from typing import Any, BinaryIO
+from urllib.parse import urlparse
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import numpy as np
-
+from packages.common.core.config import settings
 from packages.common.models import Presentation, Slide
+from packages.common.services.chart_cache import chart_cache
+from packages.common.services.image_processing import fetch_export_images
+from packages.common.services.pdf_page_cache import pdf_page_cache
 from packages.common.services.pptx_export_service import generate_pptx as _generate_pptx
+from packages.common.services.pptx_export_service import write_pptx as _write_pptx
+from packages.common.services.svg_charts import render_svg_chart
 from packages.common.themes import get_theme
 
+# Bump when chart rendering changes so cached chart images are not reused
+CHART_RENDERER_VERSION = "2"
+
+# Largest box a slide image is laid out in (.slide-image img), in CSS px
+IMAGE_BOX_PX = (540, 400)
+CSS_PX_PER_INCH = 96
+
 
 def generate_pptx(presentation: Presentation) -> bytes:
     """Generate PPTX bytes from a presentation"""
     return _generate_pptx(presentation)
 
 
+def write_pptx(presentation: Presentation, output: BinaryIO) -> None:
+    """Write a PPTX file for a presentation to a binary file"""
+    _write_pptx(presentation, output)
+
+
 def generate_pdf(presentation: Presentation) -> bytes:
     """Generate PDF bytes from a presentation using WeasyPrint"""
+    buffer = BytesIO()
+    write_pdf(presentation, buffer)
+    return buffer.getvalue()
+
+
+def write_pdf(presentation: Presentation, output: BinaryIO) -> None:
+    """
+    Write a PDF for a presentation to a binary file using WeasyPrint.
+
+    Each slide is laid out as its own page and cached, so only slides
+    changed since the last export go through WeasyPrint.
+    """
+    if not pdf_page_cache.enabled or not presentation.slides:
+        html_to_pdf(
+            _generate_slide_html(presentation),
+            (s.image_url for s in presentation.slides if s.image_url),
+            output,
+        )
+        return
+
+    theme_colors = _theme_colors(presentation)
+
+    def render_pages(slides: list[Slide]) -> list[bytes]:
+        images = _fetch_pdf_images(s.image_url for s in slides if s.image_url)
+        return [
+            _render_pdf(
+                _generate_document_html(_generate_single_slide_html(slide, theme_colors), theme_colors),
+                images,
+            )
+            for slide in slides
+        ]
+
+    pdf_page_cache.assemble(
+        sorted(presentation.slides, key=lambda s: s.order),
+        render_pages,
+        context=[__name__, CHART_RENDERER_VERSION, theme_colors],
+        output=output,
+    )
+
+
+def html_to_pdf(html_content: str, image_urls: Iterable[str], output: BinaryIO | None = None) -> bytes | None:
+    """
+    Render HTML to PDF with WeasyPrint, serving images from the image cache.
+
+    Returns the PDF bytes, or None when written to output.
+
+    The images are downloaded concurrently and scaled down to their
+    display size before layout starts, so WeasyPrint never waits on the
+    network for them.
+    """
+    return _render_pdf(html_content, _fetch_pdf_images(image_urls), output)
+
+
+def _fetch_pdf_images(image_urls: Iterable[str]) -> dict[str, bytes]:
+    """Prefetch slide images normalized for the PDF image box"""
+    return fetch_export_images(
+        image_urls,
+        IMAGE_BOX_PX[0] / CSS_PX_PER_INCH,
+        IMAGE_BOX_PX[1] / CSS_PX_PER_INCH,
+    )
+
+
+def _render_pdf(html_content: str, images: dict[str, bytes], output: BinaryIO | None = None) -> bytes | None:
+    """Lay out HTML with WeasyPrint, loading images from the prefetched ones"""
     from weasyprint import HTML
 
-    html_content = _generate_slide_html(presentation)
-    return HTML(string=html_content).write_pdf()
+    return HTML(string=html_content, url_fetcher=_cached_url_fetcher(images)).write_pdf(target=output)
+
+
+def _cached_url_fetcher(images: dict[str, bytes]) -> Callable[..., dict[str, Any]]:
+    """WeasyPrint url_fetcher answering from prefetched images"""
+    from weasyprint import default_url_fetcher
+
+    def fetcher(url: str, timeout: float = 10, ssl_context: Any = None) -> dict[str, Any]:
+        if url in images:
+            data = images[url]
+            mime_type = mimetypes.guess_type(urlparse(url).path)[0]
+            if mime_type is None and b"<svg" in data[:1024]:
+                mime_type = "image/svg+xml"
+            return {"string": data, "mime_type": mime_type, "redirected_url": url}
+        if urlparse(url).scheme in ("http", "https"):
+            # Failed or oversized in the prefetch; don't retry during layout
+            raise ValueError(f"Image not available: {url}")
+        return default_url_fetcher(url, timeout=settings.image_fetch_timeout, ssl_context=ssl_context)
+
+    return fetcher
+
+
+def _generate_chart_html(slide: Slide, theme_colors: dict) -> str:
+    """Generate the chart markup for a slide: inline SVG, or a PNG from matplotlib"""
+    if settings.pdf_chart_renderer == "svg":
+        return render_svg_chart(slide.chart_type, slide.chart_data, theme_colors)
+
+    chart_img = _generate_chart_image(slide, theme_colors)
+    return f'<img src="{chart_img}" alt="Chart" class="chart-image" />'
 
 
 def _generate_chart_image(slide: Slide, theme_colors: dict) -> str:
-    """Generate a chart image as base64 encoded PNG using matplotlib"""
+    """Generate a chart image as a base64 PNG data URI, reusing cached renders"""
     if not slide.chart_data or not slide.chart_type:
         return ""
 
+    key = chart_cache.make_key(
+        CHART_RENDERER_VERSION,
+        slide.chart_type,
+        slide.chart_data,
+        slide.chart_config,
+        theme_colors,
+    )
+    png = chart_cache.get_or_render(
+        key, lambda: _render_chart_png(slide.chart_type, slide.chart_data, theme_colors)
+    )
+
+    # Encode as base64
+    img_base64 = base64.b64encode(png).decode('utf-8')
+    return f'data:image/png;base64,{img_base64}'
+
+
+def _render_chart_png(chart_type: str, chart_data: list[dict], theme_colors: dict) -> bytes:
+    """Render a chart as PNG bytes using matplotlib"""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     # Extract data
-    labels = [point.get("label", "") for point in slide.chart_data]
-    values = [point.get("value", 0) for point in slide.chart_data]
+    labels = [point.get("label", "") for point in chart_data]
+    values = [point.get("value", 0) for point in chart_data]
 
     # Get colors from chart_data or use theme accent
     colors = []
-    for i, point in enumerate(slide.chart_data):
+    for i, point in enumerate(chart_data):
         if "color" in point:
             colors.append(point["color"])
         else:
@@ -51,8 +182,6 @@ def _generate_chart_image(slide: Slide, theme_colors: dict) -> str:
     fig, ax = plt.subplots(figsize=(10, 5), facecolor=theme_colors.get("background", "#f4f4f0"))
     ax.set_facecolor(theme_colors.get("background", "#f4f4f0"))
 
-    chart_type = slide.chart_type
-
     if chart_type == "bar":
         bars = ax.bar(labels, values, color=colors, edgecolor=theme_colors.get("text", "#0f0f0f"), linewidth=1.5)
         ax.set_ylabel("Value", fontsize=12, color=theme_colors.get("text", "#0f0f0f"))
@@ -137,101 +266,110 @@ def _generate_chart_image(slide: Slide, theme_colors: dict) -> str:
     plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight',
                 facecolor=theme_colors.get("background", "#f4f4f0"),
                 edgecolor='none')
-    buffer.seek(0)
     plt.close(fig)
 
-    # Encode as base64
-    img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-    return f'data:image/png;base64,{img_base64}'
+    return buffer.getvalue()
 
 
 def _generate_slide_html(presentation: Presentation) -> str:
     """Generate HTML representation of slides for PDF export"""
-    # Get theme colors
+    theme_colors = _theme_colors(presentation)
+    slides_html = "".join(
+        _generate_single_slide_html(slide, theme_colors)
+        for slide in sorted(presentation.slides, key=lambda s: s.order)
+    )
+    return _generate_document_html(slides_html, theme_colors)
+
+
+def _theme_colors(presentation: Presentation) -> dict:
+    """Colors of the presentation's theme used by the export CSS and charts"""
     theme = get_theme(presentation.theme or "neobrutalism")
-    theme_colors = {
+    return {
         "background": theme.colors.background,
         "accent": theme.colors.accent,
         "text": theme.colors.text_primary,
         "muted": theme.colors.text_secondary,
     }
 
-    slides_html = ""
-
-    for slide in sorted(presentation.slides, key=lambda s: s.order):
-        slide_content = ""
 
-        if slide.type == "title":
-            slide_content = f"""
-                <div class="title-slide">
-                    <h1>{slide.title or ''}</h1>
-                    {f'<p class="subtitle">{slide.subtitle}</p>' if slide.subtitle else ''}
+def _generate_single_slide_html(slide: Slide, theme_colors: dict) -> str:
+    """Generate the page markup for one slide"""
+    slide_content = ""
+
+    if slide.type == "title":
+        slide_content = f"""
+            <div class="title-slide">
+                <h1>{slide.title or ''}</h1>
+                {f'<p class="subtitle">{slide.subtitle}</p>' if slide.subtitle else ''}
+            </div>
+        """
+    elif slide.type == "bullets" and slide.bullets:
+        bullets = "".join(f"<li>{b}</li>" for b in slide.bullets)
+        image_html = ""
+        if slide.image_url:
+            image_html = f"""
+                <div class="slide-image">
+                    <img src="{slide.image_url}" alt="{slide.image_alt or ''}" />
+                    {f'<p class="image-credit">{slide.image_credit}</p>' if slide.image_credit else ''}
                 </div>
             """
-        elif slide.type == "bullets" and slide.bullets:
-            bullets = "".join(f"<li>{b}</li>" for b in slide.bullets)
-            image_html = ""
-            if slide.image_url:
-                image_html = f"""
-                    <div class="slide-image">
-                        <img src="{slide.image_url}" alt="{slide.image_alt or ''}" />
-                        {f'<p class="image-credit">{slide.image_credit}</p>' if slide.image_credit else ''}
-                    </div>
-                """
-            slide_content = f"""
-                <div class="bullets-slide {'with-image' if slide.image_url else ''}">
-                    <div class="text-content">
-                        {f'<h2>{slide.title}</h2>' if slide.title else ''}
-                        <ul>{bullets}</ul>
-                    </div>
-                    {image_html}
+        slide_content = f"""
+            <div class="bullets-slide {'with-image' if slide.image_url else ''}">
+                <div class="text-content">
+                    {f'<h2>{slide.title}</h2>' if slide.title else ''}
+                    <ul>{bullets}</ul>
                 </div>
-            """
-        elif slide.type == "quote":
-            slide_content = f"""
-                <div class="quote-slide">
-                    <blockquote>"{slide.quote or ''}"</blockquote>
-                    {f'<cite>— {slide.attribution}</cite>' if slide.attribution else ''}
+                {image_html}
+            </div>
+        """
+    elif slide.type == "quote":
+        slide_content = f"""
+            <div class="quote-slide">
+                <blockquote>"{slide.quote or ''}"</blockquote>
+                {f'<cite>— {slide.attribution}</cite>' if slide.attribution else ''}
+            </div>
+        """
+    elif slide.type == "section":
+        slide_content = f"""
+            <div class="section-slide">
+                <h2>{slide.title or ''}</h2>
+            </div>
+        """
+    elif slide.type == "chart" and slide.chart_data:
+        # Generate chart markup
+        chart_html = _generate_chart_html(slide, theme_colors)
+        slide_content = f"""
+            <div class="chart-slide">
+                {f'<h2>{slide.title}</h2>' if slide.title else ''}
+                <div class="chart-container">
+                    {chart_html}
                 </div>
-            """
-        elif slide.type == "section":
-            slide_content = f"""
-                <div class="section-slide">
-                    <h2>{slide.title or ''}</h2>
+            </div>
+        """
+    else:
+        image_html = ""
+        if slide.image_url:
+            image_html = f"""
+                <div class="slide-image">
+                    <img src="{slide.image_url}" alt="{slide.image_alt or ''}" />
+                    {f'<p class="image-credit">{slide.image_credit}</p>' if slide.image_credit else ''}
                 </div>
             """
-        elif slide.type == "chart" and slide.chart_data:
-            # Generate chart image
-            chart_img = _generate_chart_image(slide, theme_colors)
-            slide_content = f"""
-                <div class="chart-slide">
+        slide_content = f"""
+            <div class="content-slide {'with-image' if slide.image_url else ''}">
+                <div class="text-content">
                     {f'<h2>{slide.title}</h2>' if slide.title else ''}
-                    <div class="chart-container">
-                        <img src="{chart_img}" alt="Chart" class="chart-image" />
-                    </div>
+                    {f'<p>{slide.body}</p>' if slide.body else ''}
                 </div>
-            """
-        else:
-            image_html = ""
-            if slide.image_url:
-                image_html = f"""
-                    <div class="slide-image">
-                        <img src="{slide.image_url}" alt="{slide.image_alt or ''}" />
-                        {f'<p class="image-credit">{slide.image_credit}</p>' if slide.image_credit else ''}
-                    </div>
-                """
-            slide_content = f"""
-                <div class="content-slide {'with-image' if slide.image_url else ''}">
-                    <div class="text-content">
-                        {f'<h2>{slide.title}</h2>' if slide.title else ''}
-                        {f'<p>{slide.body}</p>' if slide.body else ''}
-                    </div>
-                    {image_html}
-                </div>
-            """
+                {image_html}
+            </div>
+        """
+
+    return f'<div class="slide" style="background: {theme_colors["background"]};">{slide_content}</div>'
 
-        slides_html += f'<div class="slide" style="background: {theme_colors["background"]};">{slide_content}</div>'
 
+def _generate_document_html(slides_html: str, theme_colors: dict) -> str:
+    """Wrap slide markup in the export document with the theme's CSS"""
     return f"""
     <!DOCTYPE html>
     <html>
@@ -331,6 +469,10 @@ def _generate_slide_html(presentation: Presentation) -> str:
                 max-height: 450px;
                 object-fit: contain;
             }}
+            svg.chart-image {{
+                width: 100%;
+                height: 450px;
+            }}
             /* Image slides layout */
             .with-image {{
                 display: flex;
@@ -0,0 +1,125 @@
+"""
+Export image cache
+Downloads slide images for exports concurrently and keeps them in an
+on-disk cache keyed by URL, shared by every render worker on the host,
+so later exports of any deck reuse the bytes instead of refetching.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.services.export_cache import DiskLRU
+
+logger = get_logger(__name__)
+
+
+class ImageCache:
+    """
+    Disk cache of downloaded images with TTL expiry and LRU eviction.
+
+    Backed by a DiskLRU with ttl_seconds: a file's mtime is its download
+    time and its atime its last use.
+    """
+
+    def __init__(self, root: str, max_bytes: int, ttl_seconds: float, enabled: bool = True):
+        self.files = DiskLRU(root, max_bytes, ttl_seconds=ttl_seconds)
+        self.enabled = enabled
+
+    def _name(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return f"{digest[:2]}/{digest}"
+
+    def get(self, url: str) -> bytes | None:
+        """Return cached bytes for a URL, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        try:
+            return self.files.read(self._name(url))
+        except OSError as e:
+            logger.warning(f"Image cache read failed: {e}")
+            return None
+
+    def put(self, url: str, data: bytes) -> None:
+        """Store downloaded bytes for a URL."""
+        if not self.enabled:
+            return
+        try:
+            self.files.write(self._name(url), data)
+        except OSError as e:
+            logger.warning(f"Image cache write failed: {e}")
+
+    def fetch_all(self, urls: Iterable[str]) -> dict[str, bytes]:
+        """
+        Get the bytes of every URL, downloading cache misses concurrently.
+
+        At most image_fetch_concurrency downloads run at once over one
+        pooled client, each bounded by image_fetch_timeout and
+        image_fetch_max_bytes. Failed downloads are logged and left out of
+        the result so the export can continue without that image.
+        """
+        images: dict[str, bytes] = {}
+        missing = []
+        for url in dict.fromkeys(urls):
+            data = self.get(url)
+            if data is not None:
+                images[url] = data
+            else:
+                missing.append(url)
+
+        if not missing:
+            return images
+
+        with httpx.Client(timeout=settings.image_fetch_timeout, follow_redirects=True) as client:
+
+            def download(url: str) -> tuple[str, bytes | None]:
+                try:
+                    data = _download(client, url, settings.image_fetch_max_bytes)
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning(f"Failed to download image {url}: {e}")
+                    return url, None
+                self.put(url, data)
+                return url, data
+
+            workers = min(settings.image_fetch_concurrency, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for url, data in executor.map(download, missing):
+                    if data is not None:
+                        images[url] = data
+
+        return images
+
+
+def _download(client: httpx.Client, url: str, max_bytes: int) -> bytes:
+    """
+    Download a URL, giving up once the body passes max_bytes.
+
+    Raises:
+        httpx.HTTPError: Request failed or returned an error status
+        ValueError: Response is larger than max_bytes
+    """
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+        if int(response.headers.get("content-length") or 0) > max_bytes:
+            raise ValueError(f"image larger than {max_bytes} bytes")
+        chunks = []
+        size = 0
+        for chunk in response.iter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"image larger than {max_bytes} bytes")
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+# Singleton instance
+image_cache = ImageCache(
+    root=settings.image_cache_dir,
+    max_bytes=settings.image_cache_max_bytes,
+    ttl_seconds=settings.image_cache_ttl_seconds,
+    enabled=settings.image_cache_enabled,
+)
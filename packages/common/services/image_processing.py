@@ -0,0 +1,105 @@
+"""
+Export image normalization
+Downscales slide images to the size they are displayed at in an export,
+at export_image_dpi, and recompresses them, so decks don't embed
+full-resolution photos. Normalized variants are kept in the image cache.
+"""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.services.image_cache import image_cache
+
+logger = get_logger(__name__)
+
+# Bump when normalization output changes so cached variants are not reused
+NORMALIZE_VERSION = "1"
+
+
+def normalize_image(data: bytes, width_in: float, height_in: float, dpi: int, quality: int) -> bytes:
+    """
+    Resize an image to cover a display box and recompress it.
+
+    Aspect ratio is kept and images are never upscaled. Opaque images are
+    written as JPEG, images with transparency as PNG. The original bytes
+    are returned when they can't be decoded (e.g. SVG) or when they are
+    already smaller than the result.
+
+    Args:
+        data: Encoded image
+        width_in: Display width in inches
+        height_in: Display height in inches
+        dpi: Target pixel density
+        quality: JPEG quality (1-95)
+    """
+    target_w, target_h = width_in * dpi, height_in * dpi
+    try:
+        image = Image.open(BytesIO(data))
+        if image.format == "JPEG":
+            # Decode at a reduced scale; square so an EXIF rotation still covers the box
+            side = round(max(target_w, target_h))
+            image.draft("RGB", (side, side))
+        image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, OSError, ValueError) as e:
+        logger.debug(f"Leaving image as is: {e}")
+        return data
+
+    scale = max(target_w / image.width, target_h / image.height)
+    if scale < 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+    buffer = BytesIO()
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image.save(buffer, format="PNG", optimize=True)
+    else:
+        image.convert("RGB").save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+
+    output = buffer.getvalue()
+    return output if len(output) < len(data) else data
+
+
+def fetch_export_images(urls: Iterable[str], width_in: float, height_in: float) -> dict[str, bytes]:
+    """
+    Get every image URL normalized for a display box, from cache when possible.
+
+    Misses are downloaded through the image cache, normalized and stored
+    as variants keyed by URL, box, DPI and quality.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not settings.export_image_normalize:
+        return image_cache.fetch_all(urls)
+
+    dpi, quality = settings.export_image_dpi, settings.export_image_quality
+
+    def variant_key(url: str) -> str:
+        return f"{url}#v{NORMALIZE_VERSION}:{width_in:g}x{height_in:g}in@{dpi}dpi:q{quality}"
+
+    images: dict[str, bytes] = {}
+    missing = []
+    for url in urls:
+        data = image_cache.get(variant_key(url))
+        if data is not None:
+            images[url] = data
+        else:
+            missing.append(url)
+
+    def normalize(item: tuple[str, bytes]) -> tuple[str, bytes]:
+        url, original = item
+        data = normalize_image(original, width_in, height_in, dpi, quality)
+        image_cache.put(variant_key(url), data)
+        return url, data
+
+    originals = image_cache.fetch_all(missing)
+    if originals:
+        # Pillow releases the GIL while decoding and encoding
+        with ThreadPoolExecutor(max_workers=min(len(originals), os.cpu_count() or 1)) as executor:
+            images.update(executor.map(normalize, originals.items()))
+
+    return images
@@ -0,0 +1,19 @@
+# Background generation jobs
+from functools import lru_cache
+
+from packages.common.core.config import settings
+from packages.common.services.jobs.base import GenerationJob, JobQueue
+from packages.common.services.jobs.memory import InProcessJobQueue
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue for the configured backend"""
+    if settings.job_backend == "redis":
+        from packages.common.services.jobs.redis_queue import RedisJobQueue
+
+        return RedisJobQueue(workers=settings.job_workers, ttl_seconds=settings.job_ttl_seconds)
+    return InProcessJobQueue(workers=settings.job_workers, ttl_seconds=settings.job_ttl_seconds)
+
+
+__all__ = ["GenerationJob", "InProcessJobQueue", "JobQueue", "get_job_queue"]
@@ -0,0 +1,241 @@
+"""
+Generation job queue
+Runs slide generations in a bounded pool of background workers so API
+requests only submit work and poll for it.
+"""
+
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.schemas import (
+    GenerateSlidesRequest,
+    GenerationJobProgress,
+    GenerationJobResponse,
+)
+from packages.common.services.slide_generator import SlideGeneratorService
+from packages.common.services.slide_generator.idempotency import get_idempotency_store
+
+logger = get_logger(__name__)
+
+MAX_JOB_ATTEMPTS = 3  # Runs interrupted by a worker crash before the job is failed
+
+# Fields that change while a job runs; backends can store them apart from
+# the (large) request params so progress updates stay small
+STATE_FIELDS = {"status", "progress", "presentation_id", "error", "updated_at", "attempts"}
+
+
+class GenerationJob(GenerationJobResponse):
+    """A job record as stored by a queue backend"""
+
+    params: dict[str, Any]
+    api_key_id: int | None = None
+    attempts: int = 0
+
+    def touch(self) -> None:
+        self.updated_at = datetime.now(UTC)
+
+
+class JobQueue(ABC):
+    """
+    Base class for job queue backends.
+
+    Backends provide storage and a FIFO of job IDs; the worker loop that
+    runs SlideGeneratorService and records progress is shared. A dequeued
+    job stays in flight until it is acknowledged, so a backend shared
+    between processes can hand a job whose worker died to another one.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @abstractmethod
+    async def _save(self, job: GenerationJob) -> None:
+        """Store (or overwrite) a whole job record."""
+
+    @abstractmethod
+    async def _save_state(self, job: GenerationJob) -> None:
+        """Store a job's STATE_FIELDS after they change."""
+
+    @abstractmethod
+    async def _load(self, job_id: str) -> GenerationJob | None:
+        """Fetch a job record, or None if unknown or expired."""
+
+    @abstractmethod
+    async def _enqueue(self, job_id: str) -> None:
+        """Append a job ID to the queue."""
+
+    @abstractmethod
+    async def _dequeue(self) -> str | None:
+        """Wait for the next job ID and mark it in flight; may return None on timeout."""
+
+    @abstractmethod
+    async def _ack(self, job_id: str) -> None:
+        """Drop a job that has finished running (or can't run) from the in-flight set."""
+
+    @abstractmethod
+    async def _connect(self) -> None:
+        """Open backend connections before workers start."""
+
+    @abstractmethod
+    async def _close(self) -> None:
+        """Close backend connections after workers stop."""
+
+    @abstractmethod
+    async def stats(self) -> dict[str, int]:
+        """Queue counters for metrics."""
+
+    async def submit(
+        self,
+        request: GenerateSlidesRequest,
+        api_key_id: int | None = None,
+        template_prompt: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> GenerationJob:
+        """
+        Queue a generation and return its job record immediately.
+
+        Args:
+            request: The generation request
+            api_key_id: Owning API key (for public API jobs)
+            template_prompt: Optional template structure guidance for AI
+            idempotency_key: Client-supplied key; retries with the same key
+                return the original job instead of queueing another
+        """
+        now = datetime.now(UTC)
+        slide_count = request.slide_count or 8
+        job = GenerationJob(
+            id=uuid.uuid4().hex,
+            status="queued",
+            progress=GenerationJobProgress(message="Queued", slide_count=slide_count),
+            created_at=now,
+            updated_at=now,
+            api_key_id=api_key_id,
+            params={
+                "text": request.text,
+                "slide_count": slide_count,
+                "title": request.title,
+                "theme": request.theme,
+                "template_prompt": template_prompt,
+                "mode": request.generation_mode,
+                "use_cache": not request.bypass_cache,
+            },
+        )
+        if idempotency_key:
+            store = get_idempotency_store()
+            key = f"job:{api_key_id}:{idempotency_key}"
+            existing_id = await store.claim(key, job.id, settings.idempotency_key_ttl_seconds)
+            if existing_id is not None:
+                existing = await self._load(existing_id)
+                if existing is not None:
+                    logger.info(f"Idempotent retry, returning job {existing.id}")
+                    return existing
+                # The original job has expired; this one takes over the key
+                await store.put(key, job.id)
+
+        await self._save(job)
+        await self._enqueue(job.id)
+        logger.info(f"Queued generation job {job.id}")
+        return job
+
+    async def get(self, job_id: str, api_key_id: int | None = None) -> GenerationJob | None:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job ID returned by submit
+            api_key_id: If set, only return the job if this key submitted it
+        """
+        job = await self._load(job_id)
+        if job is None or (api_key_id is not None and job.api_key_id != api_key_id):
+            return None
+        return job
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        await self._connect()
+        self._tasks = [
+            asyncio.create_task(self._worker(n), name=f"generation-worker-{n}")
+            for n in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} generation workers ({type(self).__name__})")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and release backend resources."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self._close()
+
+    async def _worker(self, n: int) -> None:
+        while True:
+            try:
+                job_id = await self._dequeue()
+                if job_id is None:
+                    continue
+                try:
+                    job = await self._load(job_id)
+                    if job is None:
+                        logger.warning(f"Worker {n}: job {job_id} expired before it ran")
+                    else:
+                        await self._run(job)
+                except asyncio.CancelledError:
+                    raise  # Left in flight so the backend can hand it to another worker
+                except Exception as e:
+                    logger.error(f"Worker {n} failed to process job {job_id}: {e}", exc_info=True)
+                await self._ack(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {n} failed to fetch a job: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    async def _run(self, job: GenerationJob) -> None:
+        """Run one generation, recording progress from its event stream."""
+        job.attempts += 1
+        if job.attempts > MAX_JOB_ATTEMPTS:
+            logger.error(f"Generation job {job.id} was interrupted {MAX_JOB_ATTEMPTS} times")
+            await self._fail(job, "Generation was interrupted too many times")
+            return
+
+        job.status = "running"
+        job.progress.message = "Starting generation"
+        job.touch()
+        await self._save_state(job)
+
+        try:
+            generator = SlideGeneratorService()
+            async for event in generator.generate_stream(**job.params, api_key_id=job.api_key_id):
+                if event.type == "thinking":
+                    job.progress.message = event.data.get("message")
+                elif event.type == "tool_call" and event.data.get("tool") == "add_slide":
+                    job.progress.slides_created = event.data["slide_number"]
+                    job.progress.message = f"Created slide {event.data['slide_number']}"
+                elif event.type == "complete":
+                    job.status = "completed"
+                    job.presentation_id = event.data["presentation_id"]
+                    job.progress.slides_created = event.data["slide_count"]
+                    job.progress.message = "Done"
+                else:
+                    continue
+                job.touch()
+                await self._save_state(job)
+        except Exception as e:
+            logger.error(f"Generation job {job.id} failed: {e}", exc_info=True)
+            await self._fail(job, str(e))
+            return
+
+        if job.status != "completed":
+            await self._fail(job, "Generation ended without a presentation")
+
+    async def _fail(self, job: GenerationJob, error: str) -> None:
+        job.status = "failed"
+        job.error = error
+        job.touch()
+        await self._save_state(job)
@@ -0,0 +1,64 @@
+"""
+In-process job queue
+Keeps jobs in memory and runs them on this process's event loop.
+Suitable for development and single-process deployments.
+"""
+
+import asyncio
+import time
+
+from packages.common.services.jobs.base import GenerationJob, JobQueue
+
+
+class InProcessJobQueue(JobQueue):
+    """Job queue backed by an asyncio.Queue and a dict of job records."""
+
+    def __init__(self, workers: int, ttl_seconds: float):
+        super().__init__(workers)
+        self.ttl_seconds = ttl_seconds
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._jobs: dict[str, GenerationJob] = {}
+
+    async def _connect(self) -> None:
+        pass  # Nothing to connect to; jobs live in this process
+
+    async def _close(self) -> None:
+        pass
+
+    async def _save(self, job: GenerationJob) -> None:
+        self._jobs[job.id] = job
+        self._prune()
+
+    async def _save_state(self, job: GenerationJob) -> None:
+        self._jobs[job.id] = job
+
+    async def _load(self, job_id: str) -> GenerationJob | None:
+        return self._jobs.get(job_id)
+
+    async def _enqueue(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+
+    async def _dequeue(self) -> str | None:
+        return await self._queue.get()
+
+    async def _ack(self, job_id: str) -> None:
+        self._queue.task_done()
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status in ("completed", "failed") and job.updated_at.timestamp() < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "running": sum(1 for job in self._jobs.values() if job.status == "running"),
+            "jobs": len(self._jobs),
+            "workers": len(self._tasks),
+        }
@@ -0,0 +1,171 @@
+"""
+Redis job queue
+Job records and the pending-job list live in Redis, so any API process
+(on any node) can submit, poll or run a job.
+
+A worker moves a job from the pending list to an in-flight list (BLMOVE)
+and holds a lease on it while it runs. Jobs left in flight without a
+lease, because their worker crashed or was stopped, are moved back to
+the front of the pending list.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from packages.common.core.logging import get_logger
+from packages.common.core.redis import get_redis
+from packages.common.services.jobs.base import STATE_FIELDS, GenerationJob, JobQueue
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "decksnap:jobs"
+QUEUE_KEY = f"{KEY_PREFIX}:queue"
+IN_FLIGHT_KEY = f"{KEY_PREFIX}:in_flight"
+DEQUEUE_TIMEOUT_SECONDS = 5  # BLMOVE timeout, so workers notice shutdown
+LEASE_SECONDS = 60  # In-flight jobs whose lease lapses are requeued
+LEASE_REFRESH_SECONDS = 15  # Also how often stale in-flight jobs are looked for
+
+# Requeue an in-flight job only if its lease is still missing
+_REQUEUE_SCRIPT = """
+if redis.call('exists', KEYS[3]) == 0 and redis.call('lrem', KEYS[1], 1, ARGV[1]) > 0 then
+    redis.call('lpush', KEYS[2], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Job queue backed by Redis lists and JSON job records with TTL."""
+
+    def __init__(self, workers: int, ttl_seconds: int):
+        super().__init__(workers)
+        self.ttl_seconds = ttl_seconds
+        self._held: set[str] = set()  # Jobs this process is running
+        self._unleased: set[str] = set()  # In-flight jobs seen without a lease last time
+        self._lease_task: asyncio.Task[None] | None = None
+
+    @property
+    def redis(self) -> Any:
+        return get_redis()
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{KEY_PREFIX}:job:{job_id}"
+
+    def _state_key(self, job_id: str) -> str:
+        return f"{KEY_PREFIX}:job:{job_id}:state"
+
+    def _lease_key(self, job_id: str) -> str:
+        return f"{KEY_PREFIX}:lease:{job_id}"
+
+    async def _connect(self) -> None:
+        await self.redis.ping()
+        self._lease_task = asyncio.create_task(self._maintain_leases(), name="generation-leases")
+        logger.info("Connected to Redis job queue")
+
+    async def _close(self) -> None:
+        if self._lease_task:
+            self._lease_task.cancel()
+            await asyncio.gather(self._lease_task, return_exceptions=True)
+            self._lease_task = None
+        # Unfinished jobs keep their in-flight entry; once the leases lapse
+        # another process requeues them
+        self._held.clear()
+
+    async def _save(self, job: GenerationJob) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                self._job_key(job.id),
+                job.model_dump_json(exclude=STATE_FIELDS),
+                ex=self.ttl_seconds,
+            )
+            pipe.set(
+                self._state_key(job.id),
+                job.model_dump_json(include=STATE_FIELDS),
+                ex=self.ttl_seconds,
+            )
+            await pipe.execute()
+
+    async def _save_state(self, job: GenerationJob) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                self._state_key(job.id),
+                job.model_dump_json(include=STATE_FIELDS),
+                ex=self.ttl_seconds,
+            )
+            pipe.expire(self._job_key(job.id), self.ttl_seconds)
+            await pipe.execute()
+
+    async def _load(self, job_id: str) -> GenerationJob | None:
+        record, state = await self.redis.mget(self._job_key(job_id), self._state_key(job_id))
+        if not record:
+            return None
+        return GenerationJob.model_validate({**json.loads(record), **json.loads(state or "{}")})
+
+    async def _enqueue(self, job_id: str) -> None:
+        await self.redis.rpush(QUEUE_KEY, job_id)
+
+    async def _dequeue(self) -> str | None:
+        job_id = await self.redis.blmove(
+            QUEUE_KEY, IN_FLIGHT_KEY, DEQUEUE_TIMEOUT_SECONDS, "LEFT", "RIGHT"
+        )
+        if job_id:
+            self._held.add(job_id)
+            await self.redis.set(self._lease_key(job_id), "1", ex=LEASE_SECONDS)
+        return job_id
+
+    async def _ack(self, job_id: str) -> None:
+        self._held.discard(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(IN_FLIGHT_KEY, 1, job_id)
+            pipe.delete(self._lease_key(job_id))
+            await pipe.execute()
+
+    async def _maintain_leases(self) -> None:
+        while True:
+            try:
+                await self._renew_leases()
+                await self._requeue_stale()
+            except Exception as e:
+                logger.warning(f"Failed to maintain generation job leases: {e}")
+            await asyncio.sleep(LEASE_REFRESH_SECONDS)
+
+    async def _renew_leases(self) -> None:
+        if not self._held:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in self._held:
+                pipe.set(self._lease_key(job_id), "1", ex=LEASE_SECONDS)
+            await pipe.execute()
+
+    async def _requeue_stale(self) -> None:
+        """Move in-flight jobs whose worker stopped back to the front of the queue."""
+        in_flight = await self.redis.lrange(IN_FLIGHT_KEY, 0, -1)
+        if not in_flight:
+            self._unleased = set()
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in in_flight:
+                pipe.exists(self._lease_key(job_id))
+            leased = await pipe.execute()
+        unleased = {
+            job_id for job_id, exists in zip(in_flight, leased, strict=True) if not exists
+        }
+
+        # Only jobs seen without a lease on two passes in a row: a worker
+        # takes its lease just after BLMOVE, so one pass could catch it between the two
+        for job_id in unleased & self._unleased:
+            requeued = await self.redis.eval(
+                _REQUEUE_SCRIPT, 3, IN_FLIGHT_KEY, QUEUE_KEY, self._lease_key(job_id), job_id
+            )
+            if requeued:
+                logger.warning(f"Requeued generation job {job_id} after its worker stopped")
+        self._unleased = unleased
+
+    async def stats(self) -> dict[str, int]:
+        return {
+            "queued": await self.redis.llen(QUEUE_KEY),
+            "in_flight": await self.redis.llen(IN_FLIGHT_KEY),
+            "workers": len(self._tasks),
+        }
@@ -0,0 +1,134 @@
+"""
+PDF page cache
+Keeps each slide rendered as its own PDF, keyed by the slide's content and
+everything else that changes its page, and assembles export documents by
+merging those pages. After a one-slide edit only that slide goes back
+through WeasyPrint.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import fields
+from typing import Any, BinaryIO
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.models import Slide
+from packages.common.services.export_cache import DiskLRU
+from packages.common.services.render_pool import SlideSnapshot
+
+logger = get_logger(__name__)
+
+# Bump when page assembly changes so cached pages are not reused
+PAGE_RENDERER_VERSION = "1"
+
+# Slide fields that make up its page; id and order don't change how it looks
+_CONTENT_FIELDS = [field.name for field in fields(SlideSnapshot) if field.name not in ("id", "order")]
+
+
+class PdfPageCache:
+    """Disk LRU cache of single-slide PDFs, shared by every render worker on the host."""
+
+    def __init__(self, root: str, max_bytes: int, enabled: bool = True):
+        self.files = DiskLRU(root, max_bytes)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def page_key(slide: Slide, context: Any) -> str:
+        """Digest of a slide's content plus the context it is rendered in."""
+        payload = json.dumps(
+            {
+                "version": PAGE_RENDERER_VERSION,
+                "context": context,
+                "chart_renderer": settings.pdf_chart_renderer,
+                "images": [
+                    settings.export_image_normalize,
+                    settings.export_image_dpi,
+                    settings.export_image_quality,
+                ],
+                "slide": {name: getattr(slide, name, None) for name in _CONTENT_FIELDS},
+            },
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def assemble(
+        self,
+        slides: Sequence[Slide],
+        render_pages: Callable[[list[Slide]], list[bytes]],
+        context: Any,
+        output: BinaryIO,
+    ) -> None:
+        """
+        Write a PDF of the slides, in order, reusing cached pages.
+
+        Args:
+            slides: Slides in document order
+            render_pages: Renders slides to one standalone PDF each; called
+                once with every slide whose page isn't cached
+            context: JSON-serializable renderer identity and theme, part of
+                every page key
+            output: Binary file the merged PDF is written to
+        """
+        import fitz  # PyMuPDF
+
+        keys = [self.page_key(slide, context) for slide in slides]
+        pages: dict[str, bytes] = {}
+        for key in dict.fromkeys(keys):
+            data = self._read(key)
+            if data is not None:
+                pages[key] = data
+
+        # Identical slides share a key and are rendered once
+        missing = {key: slide for key, slide in zip(keys, slides, strict=True) if key not in pages}
+        self.hits += len(pages)
+        self.misses += len(missing)
+        if missing:
+            rendered = render_pages(list(missing.values()))
+            for key, data in zip(missing, rendered, strict=True):
+                pages[key] = data
+                self._write(key, data)
+
+        document = fitz.open()
+        try:
+            for key in keys:
+                with fitz.open(stream=pages[key], filetype="pdf") as page:
+                    document.insert_pdf(page)
+            # garbage=3 merges objects repeated across pages, like identical images
+            document.save(output, garbage=3, deflate=True)
+        finally:
+            document.close()
+
+    def _read(self, key: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        try:
+            return self.files.read(f"{key[:2]}/{key}")
+        except OSError as e:
+            logger.warning(f"PDF page cache read failed: {e}")
+            return None
+
+    def _write(self, key: str, data: bytes) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.files.write(f"{key[:2]}/{key}", data)
+        except OSError as e:
+            logger.warning(f"PDF page cache write failed: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters for metrics."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Singleton instance
+pdf_page_cache = PdfPageCache(
+    root=settings.pdf_page_cache_dir,
+    max_bytes=settings.pdf_page_cache_max_bytes,
+    enabled=settings.pdf_page_cache_enabled,
+)
@@ -3,9 +3,8 @@ PPTX Export Service - generates editable PowerPoint presentations
 """
 
 from io import BytesIO
-from typing import TypedDict
+from typing import BinaryIO, TypedDict
 
-import httpx
 from pptx import Presentation as PptxPresentation
 from pptx.chart.data import CategoryChartData
 from pptx.dml.color import RGBColor
@@ -13,9 +12,14 @@ from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
 
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
 from packages.common.models import Presentation, Slide
+from packages.common.services.image_processing import fetch_export_images
 from packages.common.themes import get_theme
 
+logger = get_logger(__name__)
+
 
 class ThemeColors(TypedDict):
     """Colors used for PPTX export"""
@@ -41,6 +45,10 @@ MARGIN_TOP = Inches(1)
 CONTENT_WIDTH = Inches(11.333)
 CONTENT_HEIGHT = Inches(5.5)
 
+# Image box on bullet and content slides
+IMAGE_WIDTH = Inches(5.5)
+IMAGE_HEIGHT = Inches(5)
+
 
 def generate_pptx(presentation: Presentation) -> bytes:
     """
@@ -52,6 +60,19 @@ def generate_pptx(presentation: Presentation) -> bytes:
     Returns:
         bytes: The PPTX file as bytes
     """
+    buffer = BytesIO()
+    write_pptx(presentation, buffer)
+    return buffer.getvalue()
+
+
+def write_pptx(presentation: Presentation, output: BinaryIO) -> None:
+    """
+    Write a PPTX file for a presentation to a binary file object.
+
+    Args:
+        presentation: The presentation model with slides
+        output: Seekable file opened for binary writing
+    """
     # Get theme colors
     theme = get_theme(presentation.theme or "neobrutalism")
     colors: ThemeColors = {
@@ -61,29 +82,46 @@ def generate_pptx(presentation: Presentation) -> bytes:
         "muted": _hex_to_rgb(theme.colors.text_secondary),
     }
 
+    # Sort slides by order
+    sorted_slides = sorted(presentation.slides, key=lambda s: s.order)
+
+    # Download every image up front, concurrently and through the cache,
+    # scaled down to the size it is shown at
+    images = fetch_export_images(
+        (s.image_url for s in sorted_slides if s.image_url),
+        IMAGE_WIDTH.inches,
+        IMAGE_HEIGHT.inches,
+    )
+
+    if settings.pptx_fast_writer_enabled:
+        # Imported here: the fast writer shares this module's layout constants
+        from packages.common.services import pptx_ooxml_writer
+
+        if pptx_ooxml_writer.can_write(sorted_slides):
+            pptx_ooxml_writer.write_pptx(sorted_slides, colors, images, output)
+            return
+
     prs = PptxPresentation()
     prs.slide_width = SLIDE_WIDTH
     prs.slide_height = SLIDE_HEIGHT
 
-    # Sort slides by order
-    sorted_slides = sorted(presentation.slides, key=lambda s: s.order)
-
     for slide in sorted_slides:
-        _add_slide(prs, slide, colors)
+        _add_slide(prs, slide, colors, images)
 
-    # Write to bytes
-    buffer = BytesIO()
-    prs.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    prs.save(output)
 
 
-def _add_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None:
+def _add_slide(
+    prs: PptxPresentation,
+    slide: Slide,
+    colors: ThemeColors,
+    images: dict[str, bytes],
+) -> None:
     """Add a slide to the presentation based on its type"""
     if slide.type == "title":
         _add_title_slide(prs, slide, colors)
     elif slide.type == "bullets":
-        _add_bullets_slide(prs, slide, colors)
+        _add_bullets_slide(prs, slide, colors, images)
     elif slide.type == "quote":
         _add_quote_slide(prs, slide, colors)
     elif slide.type == "section":
@@ -91,7 +129,7 @@ def _add_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None
     elif slide.type == "chart":
         _add_chart_slide(prs, slide, colors)
     else:
-        _add_content_slide(prs, slide, colors)
+        _add_content_slide(prs, slide, colors, images)
 
 
 def _add_title_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None:
@@ -135,26 +173,25 @@ def _add_title_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -
         sub_para.alignment = PP_ALIGN.CENTER
 
 
-def _add_slide_image(pptx_slide, slide: Slide, left, top, width, height) -> None:
-    """Add an image to a slide by downloading from URL"""
-    if not slide.image_url:
+def _add_slide_image(pptx_slide, slide: Slide, images: dict[str, bytes], left, top, width, height) -> None:
+    """Add a slide's prefetched image"""
+    image_bytes = images.get(slide.image_url) if slide.image_url else None
+    if not image_bytes:
         return
 
     try:
-        # Download image
-        with httpx.Client() as client:
-            response = client.get(slide.image_url, timeout=10.0)
-            response.raise_for_status()
-            image_data = BytesIO(response.content)
-
-        # Add image to slide
-        pptx_slide.shapes.add_picture(image_data, left, top, width, height)
+        pptx_slide.shapes.add_picture(BytesIO(image_bytes), left, top, width, height)
     except Exception as e:
         # Log error but don't fail the export
-        print(f"Failed to add image to slide: {e}")
+        logger.warning(f"Failed to add image to slide: {e}")
 
 
-def _add_bullets_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None:
+def _add_bullets_slide(
+    prs: PptxPresentation,
+    slide: Slide,
+    colors: ThemeColors,
+    images: dict[str, bytes],
+) -> None:
     """Add a slide with title and bullet points"""
     blank_layout = prs.slide_layouts[6]
     pptx_slide = prs.slides.add_slide(blank_layout)
@@ -201,10 +238,15 @@ def _add_bullets_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors)
 
     # Add image if present
     if has_image:
-        _add_slide_image(pptx_slide, slide, Inches(7), Inches(1.5), Inches(5.5), Inches(5))
+        _add_slide_image(pptx_slide, slide, images, Inches(7), Inches(1.5), IMAGE_WIDTH, IMAGE_HEIGHT)
 
 
-def _add_content_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None:
+def _add_content_slide(
+    prs: PptxPresentation,
+    slide: Slide,
+    colors: ThemeColors,
+    images: dict[str, bytes],
+) -> None:
     """Add a slide with title and body text"""
     blank_layout = prs.slide_layouts[6]
     pptx_slide = prs.slides.add_slide(blank_layout)
@@ -246,7 +288,7 @@ def _add_content_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors)
 
     # Add image if present
     if has_image:
-        _add_slide_image(pptx_slide, slide, Inches(7), Inches(1.5), Inches(5.5), Inches(5))
+        _add_slide_image(pptx_slide, slide, images, Inches(7), Inches(1.5), IMAGE_WIDTH, IMAGE_HEIGHT)
 
 
 def _add_quote_slide(prs: PptxPresentation, slide: Slide, colors: ThemeColors) -> None:
@@ -0,0 +1,455 @@
+"""
+Direct OOXML PPTX writer
+Fast path for PPTX export that fills precompiled slide XML templates with
+escaped text and writes the parts straight into the zip, instead of
+building python-pptx shape objects. The package skeleton (master, layouts,
+theme) is taken from python-pptx's default template once per process.
+
+The output matches what pptx_export_service builds with python-pptx.
+Slides it can't write (charts) make the export fall back to python-pptx;
+tests/test_pptx_parity.py compares the two.
+"""
+
+import hashlib
+import re
+import zipfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import Image, UnidentifiedImageError
+from pptx import Presentation as PptxPresentation
+from pptx.util import Inches, Length, Pt
+
+from packages.common.core.logging import get_logger
+from packages.common.models import Slide
+from packages.common.services.pptx_export_service import (
+    CONTENT_WIDTH,
+    IMAGE_HEIGHT,
+    IMAGE_WIDTH,
+    MARGIN_LEFT,
+    MARGIN_TOP,
+    SLIDE_HEIGHT,
+    SLIDE_WIDTH,
+    ThemeColors,
+)
+
+logger = get_logger(__name__)
+
+_XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+
+# Same subset python-pptx accepts for pictures (pptx.parts.image.Image.ext)
+_IMAGE_EXTENSIONS = {"BMP": "bmp", "GIF": "gif", "JPEG": "jpg", "PNG": "png", "TIFF": "tiff", "WMF": "wmf"}
+_IMAGE_CONTENT_TYPES = {
+    "bmp": "image/bmp",
+    "gif": "image/gif",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "tiff": "image/tiff",
+    "wmf": "image/x-wmf",
+}
+_PRECOMPRESSED_EXTENSIONS = (".jpg", ".png", ".gif")
+
+# python-pptx escapes control characters other than tab and line feed like this
+_CONTROL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+_SLIDE = (
+    _XML_DECLARATION
+    + f'<p:sld xmlns:a="{_NS_A}" xmlns:p="{_NS_P}" xmlns:r="{_NS_R}"><p:cSld>'
+    + '<p:bg><p:bgPr><a:solidFill><a:srgbClr val="{bg}"/></a:solidFill><a:effectLst/></p:bgPr></p:bg>'
+    + '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    + "{shapes}</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+)
+_TEXTBOX = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {n}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    "<p:txBody>{body_pr}<a:lstStyle/>{paragraphs}</p:txBody></p:sp>"
+)
+_RECTANGLE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rectangle {n}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+_PICTURE = (
+    '<p:pic><p:nvPicPr><p:cNvPr id="{id}" name="Picture {n}" descr="image.{ext}"/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+)
+_RELATIONSHIPS = (
+    _XML_DECLARATION
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{}</Relationships>'
+)
+_RELATIONSHIP = '<Relationship Id="{id}" Type="{type}" Target="{target}"/>'
+
+# Text box bodies: python-pptx's default, with word_wrap = True, and with auto_size = None too
+_NO_WRAP = '<a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr>'
+_WRAP = '<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>'
+_WRAP_FIXED = '<a:bodyPr wrap="square"/>'
+
+
+def can_write(slides: Sequence[Slide]) -> bool:
+    """Whether every slide is supported by the fast writer (charts are not)."""
+    return not any(s.type == "chart" and s.chart_data and s.chart_type for s in slides)
+
+
+def preload() -> None:
+    """Build the package skeleton now rather than during the first export."""
+    _skeleton()
+
+
+def write_pptx(
+    slides: Sequence[Slide],
+    colors: ThemeColors,
+    images: dict[str, bytes],
+    output: BinaryIO,
+) -> None:
+    """
+    Write a PPTX file for slides the fast writer supports.
+
+    Args:
+        slides: Slides in presentation order, all passing can_write()
+        colors: Theme colors, as for the python-pptx writer
+        images: Prefetched image bytes by URL
+        output: File opened for binary writing
+    """
+    skeleton = _skeleton()
+    styles = _styles(str(colors["bg"]), str(colors["text"]), str(colors["muted"]), str(colors["accent"]))
+    package = _Package(skeleton)
+
+    for slide in slides:
+        package.add_slide(slide, styles, images)
+
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in skeleton.parts.items():
+            archive.writestr(name, data)
+        for name, data in package.parts():
+            # Compressed image formats don't shrink further; skip deflating them
+            stored = name.startswith("ppt/media/") and name.endswith(_PRECOMPRESSED_EXTENSIONS)
+            archive.writestr(name, data, compress_type=zipfile.ZIP_STORED if stored else None)
+
+
+@dataclass(frozen=True)
+class _Skeleton:
+    """Parts of an empty python-pptx presentation, split where slides are added."""
+
+    parts: dict[str, bytes]  # Copied verbatim
+    content_types: tuple[list[tuple[str, str]], list[tuple[str, str]]]  # Defaults, overrides
+    presentation_head: str  # presentation.xml up to where sldIdLst goes
+    presentation_tail: str
+    presentation_rels: list[str]  # Existing Relationship elements
+    next_rel_id: int
+    layout_target: str  # Blank layout, relative to a slide
+
+
+@lru_cache(maxsize=1)
+def _skeleton() -> _Skeleton:
+    """Save python-pptx's default template once and split it into reusable parts."""
+    prs = PptxPresentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    layout_name = prs.slide_layouts[6].part.partname.filename  # Blank layout
+
+    buffer = BytesIO()
+    prs.save(buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+
+    content_types = parts.pop("[Content_Types].xml").decode()
+    defaults = re.findall(r'<Default Extension="([^"]+)" ContentType="([^"]+)"/>', content_types)
+    overrides = re.findall(r'<Override PartName="([^"]+)" ContentType="([^"]+)"/>', content_types)
+
+    presentation = parts.pop("ppt/presentation.xml").decode()
+    head, tail = presentation.split("</p:sldMasterIdLst>", 1)
+
+    rels = re.findall(r"<Relationship [^>]*/>", parts.pop("ppt/_rels/presentation.xml.rels").decode())
+    rel_ids = [int(i) for rel in rels for i in re.findall(r'Id="rId(\d+)"', rel)]
+
+    return _Skeleton(
+        parts=parts,
+        content_types=(defaults, overrides),
+        presentation_head=head + "</p:sldMasterIdLst>",
+        presentation_tail=tail,
+        presentation_rels=rels,
+        next_rel_id=max(rel_ids) + 1,
+        layout_target=f"../slideLayouts/{layout_name}",
+    )
+
+
+@dataclass(frozen=True)
+class _Styles:
+    """Paragraph property templates for one theme."""
+
+    bg: str
+    accent: str
+    title: str
+    subtitle: str
+    heading: str
+    bullet: str
+    body: str
+    quote: str
+    attribution: str
+    section: str
+    message: str
+
+
+def _paragraph_properties(
+    size: Length,
+    color: str,
+    bold: bool = False,
+    italic: bool = False,
+    centered: bool = False,
+    line_spacing: float | None = None,
+    space_after: Length | None = None,
+) -> str:
+    attrs = f' sz="{size.centipoints}"' + (' b="1"' if bold else "") + (' i="1"' if italic else "")
+    spacing = ""
+    if line_spacing is not None:
+        spacing += f'<a:lnSpc><a:spcPct val="{round(line_spacing * 100000)}"/></a:lnSpc>'
+    if space_after is not None:
+        spacing += f'<a:spcAft><a:spcPts val="{space_after.centipoints}"/></a:spcAft>'
+    align = ' algn="ctr"' if centered else ""
+    return (
+        f"<a:pPr{align}>{spacing}"
+        f'<a:defRPr{attrs}><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr>'
+    )
+
+
+@lru_cache(maxsize=32)
+def _styles(bg: str, text: str, muted: str, accent: str) -> _Styles:
+    """Compile the paragraph templates for a theme; mirrors the fonts set in pptx_export_service."""
+    return _Styles(
+        bg=bg,
+        accent=accent,
+        title=_paragraph_properties(Pt(60), text, bold=True, centered=True),
+        subtitle=_paragraph_properties(Pt(28), muted, centered=True),
+        heading=_paragraph_properties(Pt(40), text, bold=True),
+        bullet=_paragraph_properties(Pt(24), text, space_after=Pt(16)),
+        body=_paragraph_properties(Pt(24), text, line_spacing=1.5),
+        quote=_paragraph_properties(Pt(32), text, italic=True),
+        attribution=_paragraph_properties(Pt(20), muted),
+        section=_paragraph_properties(Pt(48), text, bold=True, centered=True),
+        message=_paragraph_properties(Pt(20), muted, centered=True),
+    )
+
+
+def _paragraph(properties: str, text: str) -> str:
+    """A paragraph with python-pptx's text setter semantics: newlines become a:br."""
+    content = []
+    for i, part in enumerate(re.split("\n|\v", text)):
+        if i > 0:
+            content.append("<a:br/>")
+        if part:
+            part = _CONTROL_CHARS.sub(lambda m: f"_x{ord(m.group(1)):04X}_", part)
+            content.append(f"<a:r><a:t>{escape(part)}</a:t></a:r>")
+    return f"<a:p>{properties}{''.join(content)}</a:p>"
+
+
+class _SlideXml:
+    """Shapes and relationships of one slide, numbered like python-pptx numbers them."""
+
+    def __init__(self, layout_target: str):
+        self.shapes: list[str] = []
+        self.rels = [
+            _RELATIONSHIP.format(id="rId1", type=f"{_RT}/slideLayout", target=layout_target)
+        ]
+
+    def _next_id(self) -> int:
+        return len(self.shapes) + 2
+
+    def textbox(self, x: int, y: int, cx: int, cy: int, body_pr: str, paragraphs: list[str]) -> None:
+        shape_id = self._next_id()
+        self.shapes.append(
+            _TEXTBOX.format(
+                id=shape_id, n=shape_id - 1, x=x, y=y, cx=cx, cy=cy,
+                body_pr=body_pr, paragraphs="".join(paragraphs),
+            )
+        )
+
+    def rectangle(self, x: int, y: int, cx: int, cy: int, fill: str) -> None:
+        shape_id = self._next_id()
+        self.shapes.append(_RECTANGLE.format(id=shape_id, n=shape_id - 1, x=x, y=y, cx=cx, cy=cy, fill=fill))
+
+    def picture(self, x: int, y: int, cx: int, cy: int, target: str, ext: str) -> None:
+        shape_id = self._next_id()
+        rid = f"rId{len(self.rels) + 1}"
+        self.rels.append(_RELATIONSHIP.format(id=rid, type=f"{_RT}/image", target=target))
+        self.shapes.append(
+            _PICTURE.format(id=shape_id, n=shape_id - 1, ext=ext, rid=rid, x=x, y=y, cx=cx, cy=cy)
+        )
+
+
+class _Package:
+    """Collects the slide and media parts of one export."""
+
+    def __init__(self, skeleton: _Skeleton):
+        self.skeleton = skeleton
+        self.slides: list[tuple[bytes, bytes]] = []
+        self.media: dict[str, tuple[str, bytes]] = {}  # sha1 -> (part name, bytes)
+
+    def add_slide(self, slide: Slide, styles: _Styles, images: dict[str, bytes]) -> None:
+        xml = _SlideXml(self.skeleton.layout_target)
+        if slide.type == "title":
+            _title_slide(xml, slide, styles)
+        elif slide.type == "bullets":
+            _bullets_slide(xml, slide, styles)
+            self._add_image(xml, slide, images)
+        elif slide.type == "quote":
+            _quote_slide(xml, slide, styles)
+        elif slide.type == "section":
+            _section_slide(xml, slide, styles)
+        elif slide.type == "chart":
+            _chart_placeholder_slide(xml, slide, styles)  # can_write() rules out chart data
+        else:
+            _content_slide(xml, slide, styles)
+            self._add_image(xml, slide, images)
+
+        self.slides.append(
+            (
+                _SLIDE.format(bg=styles.bg, shapes="".join(xml.shapes)).encode(),
+                _RELATIONSHIPS.format("".join(xml.rels)).encode(),
+            )
+        )
+
+    def _add_image(self, xml: _SlideXml, slide: Slide, images: dict[str, bytes]) -> None:
+        """Embed a slide's image like python-pptx's add_picture, sharing identical images."""
+        data = images.get(slide.image_url) if slide.image_url else None
+        if not data:
+            return
+        sha1 = hashlib.sha1(data).hexdigest()
+        if sha1 not in self.media:
+            try:
+                with Image.open(BytesIO(data)) as image:
+                    image_format = image.format
+            except (UnidentifiedImageError, OSError) as e:
+                logger.warning(f"Failed to add image to slide: {e}")
+                return
+            ext = _IMAGE_EXTENSIONS.get(image_format)
+            if ext is None:
+                logger.warning(f"Failed to add image to slide: unsupported image format {image_format!r}")
+                return
+            self.media[sha1] = (f"ppt/media/image{len(self.media) + 1}.{ext}", data)
+
+        name = self.media[sha1][0]
+        xml.picture(
+            Inches(7), Inches(1.5), IMAGE_WIDTH, IMAGE_HEIGHT,
+            target=f"../media/{name.rsplit('/', 1)[1]}", ext=name.rsplit(".", 1)[1],
+        )
+
+    def parts(self) -> list[tuple[str, bytes]]:
+        """Every part that depends on the slides, including the rewritten package parts."""
+        skeleton = self.skeleton
+        parts = []
+        slide_ids = []
+        rels = list(skeleton.presentation_rels)
+        overrides = list(skeleton.content_types[1])
+
+        for number, (slide_xml, rels_xml) in enumerate(self.slides, start=1):
+            rid = f"rId{skeleton.next_rel_id + number - 1}"
+            parts.append((f"ppt/slides/slide{number}.xml", slide_xml))
+            parts.append((f"ppt/slides/_rels/slide{number}.xml.rels", rels_xml))
+            slide_ids.append(f'<p:sldId id="{255 + number}" r:id="{rid}"/>')
+            rels.append(_RELATIONSHIP.format(id=rid, type=f"{_RT}/slide", target=f"slides/slide{number}.xml"))
+            overrides.append((f"/ppt/slides/slide{number}.xml", _CT_SLIDE))
+
+        defaults = dict(skeleton.content_types[0])
+        for name, data in self.media.values():
+            ext = name.rsplit(".", 1)[1]
+            defaults.setdefault(ext, _IMAGE_CONTENT_TYPES[ext])
+            parts.append((name, data))
+
+        id_list = f"<p:sldIdLst>{''.join(slide_ids)}</p:sldIdLst>" if slide_ids else ""
+        parts.append(
+            (
+                "ppt/presentation.xml",
+                (skeleton.presentation_head + id_list + skeleton.presentation_tail).encode(),
+            )
+        )
+        parts.append(("ppt/_rels/presentation.xml.rels", _RELATIONSHIPS.format("".join(rels)).encode()))
+        parts.append(("[Content_Types].xml", _content_types(defaults, overrides)))
+        return parts
+
+
+def _content_types(defaults: dict[str, str], overrides: list[tuple[str, str]]) -> bytes:
+    entries = [
+        f"<Default Extension={quoteattr(ext)} ContentType={quoteattr(ct)}/>"
+        for ext, ct in sorted(defaults.items())
+    ] + [
+        f"<Override PartName={quoteattr(name)} ContentType={quoteattr(ct)}/>"
+        for name, ct in sorted(overrides)
+    ]
+    return (
+        _XML_DECLARATION
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        + "".join(entries)
+        + "</Types>"
+    ).encode()
+
+
+def _title_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    if slide.title:
+        xml.textbox(MARGIN_LEFT, Inches(2.5), CONTENT_WIDTH, Inches(1.5), _WRAP_FIXED,
+                    [_paragraph(styles.title, slide.title)])
+    if slide.subtitle:
+        xml.textbox(MARGIN_LEFT, Inches(4.2), CONTENT_WIDTH, Inches(1), _WRAP,
+                    [_paragraph(styles.subtitle, slide.subtitle)])
+
+
+def _bullets_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    text_width = Inches(5.5) if slide.image_url else CONTENT_WIDTH
+    if slide.title:
+        xml.textbox(MARGIN_LEFT, MARGIN_TOP, text_width, Inches(1), _NO_WRAP,
+                    [_paragraph(styles.heading, slide.title)])
+    if slide.bullets:
+        xml.textbox(MARGIN_LEFT, Inches(2.2), text_width, Inches(4.5), _WRAP,
+                    [_paragraph(styles.bullet, f"• {bullet}") for bullet in slide.bullets])
+
+
+def _content_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    text_width = Inches(5.5) if slide.image_url else CONTENT_WIDTH
+    if slide.title:
+        xml.textbox(MARGIN_LEFT, MARGIN_TOP, text_width, Inches(1), _NO_WRAP,
+                    [_paragraph(styles.heading, slide.title)])
+    if slide.body:
+        xml.textbox(MARGIN_LEFT, Inches(2.2), text_width, Inches(4.5), _WRAP,
+                    [_paragraph(styles.body, slide.body)])
+
+
+def _quote_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    xml.rectangle(Inches(1), Inches(2.5), Inches(0.08), Inches(2.5), styles.accent)
+    if slide.quote:
+        xml.textbox(Inches(1.4), Inches(2.5), Inches(10), Inches(2), _WRAP,
+                    [_paragraph(styles.quote, f'"{slide.quote}"')])
+    if slide.attribution:
+        xml.textbox(Inches(1.4), Inches(5), Inches(10), Inches(0.5), _NO_WRAP,
+                    [_paragraph(styles.attribution, f"— {slide.attribution}")])
+
+
+def _section_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    if slide.title:
+        xml.textbox(MARGIN_LEFT, Inches(3), CONTENT_WIDTH, Inches(1.5), _WRAP,
+                    [_paragraph(styles.section, slide.title)])
+
+
+def _chart_placeholder_slide(xml: _SlideXml, slide: Slide, styles: _Styles) -> None:
+    if slide.title:
+        xml.textbox(MARGIN_LEFT, MARGIN_TOP, CONTENT_WIDTH, Inches(1), _NO_WRAP,
+                    [_paragraph(styles.heading, slide.title)])
+    xml.textbox(MARGIN_LEFT, Inches(3.5), CONTENT_WIDTH, Inches(1), _NO_WRAP,
+                [_paragraph(styles.message, "[Chart data not available]")])
@@ -13,6 +13,7 @@ from packages.common.schemas import (
     PresentationUpdate,
     SlideUpdate,
 )
+from packages.common.services.export_cache import export_cache
 
 
 class PresentationService:
@@ -43,6 +44,28 @@ class PresentationService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_many(
+        self,
+        presentation_ids: list[int],
+        api_key_id: int | None = None,
+    ) -> list[Presentation]:
+        """
+        Get several presentations by ID with slides loaded, in one query.
+        If api_key_id provided, only returns those owned by that key.
+        """
+        query = (
+            select(Presentation)
+            .options(selectinload(Presentation.slides))
+            .where(Presentation.id.in_(presentation_ids))
+        )
+
+        # Scope to API key if provided
+        if api_key_id is not None:
+            query = query.where(Presentation.api_key_id == api_key_id)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
     async def list(
         self,
         skip: int = 0,
@@ -80,12 +103,15 @@ class PresentationService:
 
         await self.db.commit()
         await self.db.refresh(presentation)
+        await export_cache.invalidate(presentation.id)
         return presentation
 
     async def delete(self, presentation: Presentation) -> None:
         """Delete a presentation and all its slides"""
+        presentation_id = presentation.id
         await self.db.delete(presentation)
         await self.db.commit()
+        await export_cache.invalidate(presentation_id)
 
     async def update_slide(
         self,
@@ -114,6 +140,7 @@ class PresentationService:
 
         await self.db.commit()
         await self.db.refresh(presentation)
+        await export_cache.invalidate(presentation.id)
         return presentation, slide
 
     def to_response(self, presentation: Presentation) -> PresentationResponse:
@@ -0,0 +1,252 @@
+"""
+Export render pool
+Runs PDF/PPTX rendering (WeasyPrint, matplotlib, python-pptx) in a bounded
+pool of worker processes so exports never block the event loop.
+"""
+
+import asyncio
+import contextlib
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, BinaryIO, TypeVar
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.models import Presentation, Slide
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RenderPoolBusyError(Exception):
+    """The render queue is full; the caller should retry after retry_after seconds."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Export service is busy, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class SlideSnapshot:
+    """Picklable copy of a Slide's content, attribute-compatible with the model."""
+
+    id: int | None
+    type: str
+    title: str | None
+    subtitle: str | None
+    body: str | None
+    bullets: list[str] | None
+    quote: str | None
+    attribution: str | None
+    chart_type: str | None
+    chart_data: list[dict[str, Any]] | None
+    chart_config: dict[str, Any] | None
+    image_url: str | None
+    image_alt: str | None
+    image_credit: str | None
+    stats: list[dict[str, Any]] | None
+    big_number_value: str | None
+    big_number_label: str | None
+    big_number_context: str | None
+    comparison_columns: list[dict[str, Any]] | None
+    timeline_items: list[dict[str, Any]] | None
+    layout: str
+    order: int
+
+    @classmethod
+    def from_model(cls, slide: Slide) -> "SlideSnapshot":
+        return cls(**{field.name: getattr(slide, field.name) for field in fields(cls)})
+
+
+@dataclass(frozen=True)
+class PresentationSnapshot:
+    """Picklable copy of a Presentation and its slides for the renderers."""
+
+    id: int
+    title: str
+    theme: str
+    slides: list[SlideSnapshot]
+
+    @classmethod
+    def from_model(cls, presentation: Presentation) -> "PresentationSnapshot":
+        return cls(
+            id=presentation.id,
+            title=presentation.title,
+            theme=presentation.theme,
+            slides=[SlideSnapshot.from_model(slide) for slide in presentation.slides],
+        )
+
+
+def _warm_worker() -> None:
+    """Import the heavy rendering libraries once per worker process."""
+    import pptx  # noqa: F401
+
+    if settings.pptx_fast_writer_enabled:
+        from packages.common.services import pptx_ooxml_writer
+
+        pptx_ooxml_writer.preload()
+
+    if settings.pdf_chart_renderer == "matplotlib":
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot  # noqa: F401
+
+    # PDF exports report a missing WeasyPrint when requested
+    with contextlib.suppress(ImportError, OSError):
+        import weasyprint  # noqa: F401
+
+
+def _write_file(
+    writer: Callable[[PresentationSnapshot, BinaryIO], None],
+    snapshot: PresentationSnapshot,
+    path: str,
+) -> None:
+    """Run a renderer in a worker, streaming its output into a file."""
+    with open(path, "wb") as output:
+        writer(snapshot, output)
+
+
+def _noop() -> None:
+    """Submitted at startup so every worker process is spawned and warmed."""
+
+
+class RenderPool:
+    """
+    Bounded process pool for export rendering.
+
+    At most `workers` renders run at once and at most `max_queue` more
+    wait; beyond that, run() fails fast with RenderPoolBusyError.
+    Background renders only start when a worker is idle and never take the
+    last worker, so interactive exports are not queued behind them; with a
+    single worker there are no background renders.
+    """
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._background = 0
+        self._background_waiters: list[asyncio.Future[None]] = []
+        self.completed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """Spawn and warm the worker processes."""
+        if self._executor is not None:
+            return
+        # spawn: forking a process that runs an event loop and DB pools is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        for _ in range(self.workers):
+            self._executor.submit(_noop)
+        logger.info(f"Started export render pool with {self.workers} workers")
+
+    def stop(self) -> None:
+        """Shut the workers down, dropping queued renders."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[..., T], *args: Any, background: bool = False) -> T:
+        """
+        Run a picklable function in the pool.
+
+        Args:
+            fn: Module-level function to run in a worker
+            background: Low priority; wait for an idle worker instead of queueing
+
+        Raises:
+            RenderPoolBusyError: The queue is full, or background rendering is
+                requested from a single-worker pool
+        """
+        if background:
+            if not self.background_workers:
+                raise RenderPoolBusyError(self.retry_after)
+            await self.wait_for_idle_worker()
+        elif self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise RenderPoolBusyError(self.retry_after)
+
+        self.start()
+        assert self._executor is not None
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(fn, *args)
+        self._pending += 1
+        if background:
+            self._background += 1
+
+        def on_done(_: Any) -> None:
+            # Counted until the worker is done, not until the caller stops
+            # waiting: a cancelled request leaves its render running
+            with contextlib.suppress(RuntimeError):  # Event loop already closed
+                loop.call_soon_threadsafe(self._render_done, background)
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def _render_done(self, background: bool) -> None:
+        self._pending -= 1
+        if background:
+            self._background -= 1
+        self.completed += 1
+        self._wake_background()
+
+    @property
+    def background_workers(self) -> int:
+        """Workers background renders may use: all but one."""
+        return self.workers - 1
+
+    async def wait_for_idle_worker(self) -> None:
+        """Wait until a worker is idle and background renders leave one worker free."""
+        while self._pending >= self.workers or self._background >= self.background_workers:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._background_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._background_waiters:
+                    self._background_waiters.remove(waiter)
+
+    def _wake_background(self) -> None:
+        """Let waiting background renders re-check for an idle worker."""
+        for waiter in self._background_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._background_waiters.clear()
+
+    async def render_to_file(
+        self,
+        writer: Callable[[PresentationSnapshot, BinaryIO], None],
+        snapshot: PresentationSnapshot,
+        path: str,
+        background: bool = False,
+    ) -> None:
+        """Render a presentation snapshot in the pool straight to a file."""
+        await self.run(_write_file, writer, snapshot, path, background=background)
+
+    def stats(self) -> dict[str, int]:
+        """Pool counters for metrics."""
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "background": self._background,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+# Singleton instance
+render_pool = RenderPool(
+    workers=settings.render_workers,
+    max_queue=settings.render_queue_limit,
+    retry_after=settings.render_retry_after_seconds,
+)
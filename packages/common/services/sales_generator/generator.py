@@ -6,7 +6,7 @@ Transforms structured sales input into presentation-ready content
 from dataclasses import dataclass
 
 from packages.common.core.logging import get_logger
-from packages.common.providers.llm import OpenRouterProvider
+from packages.common.providers.llm import get_openrouter_provider
 from packages.common.schemas.sales_schema import SalesPitchInput
 
 from .prompts import SALES_SYSTEM_PROMPT
@@ -33,7 +33,7 @@ class SalesContentGenerator:
     """
 
     def __init__(self):
-        self.llm = OpenRouterProvider()
+        self.llm = get_openrouter_provider()
 
     async def generate(self, pitch: SalesPitchInput) -> GeneratedSalesContent:
         """
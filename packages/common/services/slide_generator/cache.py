@@ -0,0 +1,115 @@
+"""
+Generation Cache
+Content-addressed, in-process cache of generated slide sets so identical
+requests can be served by cloning a previous deck instead of calling the LLM.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+from packages.common.schemas import PresentationResponse
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedDeck:
+    """A generated deck stored without database ids."""
+
+    title: str
+    slides: list[dict[str, Any]]
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class GenerationCache:
+    """
+    LRU cache of generated decks with TTL expiry.
+
+    Keys are a hash of everything that determines the LLM output:
+    input text, title, slide count, theme, template prompt, model and mode.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, CachedDeck] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        text: str,
+        title: str | None,
+        slide_count: int,
+        theme: str,
+        template_prompt: str | None,
+        model: str,
+        mode: str,
+    ) -> str:
+        """Content hash identifying a generation request."""
+        payload = json.dumps(
+            [text, title, slide_count, theme, template_prompt, model, mode],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> CachedDeck | None:
+        """Return a cached deck and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry.created_at > self.ttl_seconds:
+            del self._entries[key]
+            self.evictions += 1
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, presentation: PresentationResponse) -> None:
+        """Store a generated presentation's slides under the given key."""
+        if not presentation.slides or self.max_entries <= 0:
+            return
+
+        self._entries[key] = CachedDeck(
+            title=presentation.title,
+            slides=[
+                slide.model_dump(exclude={"id"}, exclude_none=True)
+                for slide in presentation.slides
+            ],
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached decks."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters for metrics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Singleton instance
+generation_cache = GenerationCache(
+    max_entries=settings.generation_cache_max_entries,
+    ttl_seconds=settings.generation_cache_ttl_seconds,
+)
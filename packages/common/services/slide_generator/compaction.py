@@ -0,0 +1,124 @@
+"""
+Conversation compaction for the agentic loop
+Keeps the messages resent on every iteration roughly constant in size by
+collapsing acknowledged tool-call turns into a short progress summary.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class TokenUsage:
+    """Token usage accumulated across agent iterations."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    # Prompt tokens not resent thanks to compaction, estimated from the
+    # provider-reported prompt_tokens per character actually sent
+    tokens_saved: int = 0
+
+    def record(self, usage: Any, sent_chars: int, full_chars: int) -> None:
+        """Add one completion's usage and the savings of that request."""
+        if not usage:
+            return
+
+        self.prompt_tokens += usage.prompt_tokens or 0
+        self.completion_tokens += usage.completion_tokens or 0
+        self.total_tokens += usage.total_tokens or 0
+
+        if sent_chars and full_chars > sent_chars:
+            tokens_per_char = (usage.prompt_tokens or 0) / sent_chars
+            self.tokens_saved += int((full_chars - sent_chars) * tokens_per_char)
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+@dataclass
+class ConversationHistory:
+    """
+    Message history for the tool-calling loop.
+
+    With compaction enabled, only the system prompt, the user's text, a
+    "slides created so far" summary and the most recent turn (assistant
+    tool calls + their results) are sent. Without it, every turn is resent.
+    """
+
+    system_content: str
+    user_content: str
+    compact: bool = True
+    _turns: list[list[dict[str, Any]]] = field(default_factory=list)
+    _slides: list[str] = field(default_factory=list)
+    _theme_info: str | None = None
+
+    def add_assistant(self, message: dict[str, Any]) -> None:
+        """Start a new turn with the assistant's tool-call message."""
+        self._turns.append([message])
+
+    def add_tool_result(self, tool_call: Any, result: str, slide_order: int) -> None:
+        """
+        Append a tool result to the current turn and remember what the call
+        did, so the turn can later be replaced by the progress summary.
+        """
+        self._turns[-1].append(
+            {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "content": result,
+            }
+        )
+
+        name = tool_call.function.name
+        if result.startswith("Error"):
+            return
+        if name == "get_current_theme":
+            self._theme_info = result
+        elif name == "add_slide":
+            try:
+                args = json.loads(tool_call.function.arguments)
+            except json.JSONDecodeError:
+                return
+            title = args.get("title") or "(untitled)"
+            self._slides.append(f"{slide_order + 1}. [{args.get('slide_type', 'content')}] {title}")
+
+    def messages(self) -> list[dict[str, Any]]:
+        """Messages to send on the next iteration."""
+        if not self.compact or len(self._turns) <= 1:
+            return self.full_messages()
+
+        return self._base() + [{"role": "user", "content": self._summary()}] + self._turns[-1]
+
+    def full_messages(self) -> list[dict[str, Any]]:
+        """Messages an uncompacted loop would send, for measuring savings."""
+        return self._base() + [message for turn in self._turns for message in turn]
+
+    def _base(self) -> list[dict[str, Any]]:
+        return [
+            {"role": "system", "content": self.system_content},
+            {"role": "user", "content": self.user_content},
+        ]
+
+    def _summary(self) -> str:
+        lines = ["PROGRESS SO FAR (earlier tool calls were applied successfully):"]
+        if self._slides:
+            lines.append(f"Slides created so far ({len(self._slides)}):")
+            lines.extend(self._slides)
+        else:
+            lines.append("No slides created yet.")
+        if self._theme_info:
+            lines.append(f"Current theme:\n{self._theme_info}")
+        lines.append("Continue with the next slide, or call finish_presentation when done.")
+        return "\n".join(lines)
+
+
+def message_chars(messages: list[dict[str, Any]]) -> int:
+    """Serialized size of a message list."""
+    return len(json.dumps(messages))
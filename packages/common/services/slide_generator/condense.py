@@ -0,0 +1,106 @@
+"""
+Map-reduce condensing for long inputs
+Long documents are split into chunks, each chunk is summarized
+concurrently, and the summaries are merged into a brief that fits the
+configured token budget. The brief replaces the raw text in LLM prompts.
+"""
+
+import asyncio
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.core.logging import get_logger
+
+from .outline import split_passages
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4  # Rough estimate, good enough for budgeting
+MAX_REDUCE_ROUNDS = 3
+
+MAP_PROMPT = """You are condensing part {part} of {parts} of a long document so a presentation can be built from it.
+Summarize the text in at most {max_words} words. Keep every concrete fact: numbers, metrics, dates,
+names, product features, claims and memorable quotes. Drop repetition, boilerplate and formatting.
+Write plain prose or short bullet lines, no preamble."""
+
+REDUCE_PROMPT = """You are merging section summaries of one long document into a single brief for a presentation.
+Write at most {max_words} words. Preserve the document's structure and order, and keep the most
+important facts, numbers, names and quotes. Remove overlap between sections. No preamble."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+class DocumentCondenser:
+    """Condenses long inputs with concurrent chunk summaries and a reduce step."""
+
+    def __init__(self, llm: Any):
+        self.llm = llm
+
+    async def condense(self, text: str) -> str:
+        """
+        Return a brief of text sized to generation_condense_budget_tokens.
+
+        Inputs under generation_condense_threshold_tokens are returned as is.
+        """
+        tokens = estimate_tokens(text)
+        if tokens <= settings.generation_condense_threshold_tokens:
+            return text
+
+        budget = settings.generation_condense_budget_tokens
+        brief = text
+        for round_number in range(MAX_REDUCE_ROUNDS):
+            if estimate_tokens(brief) <= budget:
+                break
+            brief = await self._reduce_round(brief, budget, final=round_number > 0)
+
+        logger.info(f"Condensed input from ~{tokens} to ~{estimate_tokens(brief)} tokens")
+        return brief
+
+    async def _reduce_round(self, text: str, budget: int, final: bool) -> str:
+        """
+        One map-reduce pass: summarize chunks concurrently, then merge them.
+
+        The merge call is skipped when the joined summaries already fit the
+        budget, or when they are still too long for one call (the next round
+        condenses them again).
+        """
+        chunk_chars = settings.generation_condense_chunk_tokens * CHARS_PER_TOKEN
+        chunks = split_passages(text, passage_chars=chunk_chars)
+        per_chunk_words = max(budget * 3 // 4 // len(chunks), 80)
+
+        semaphore = asyncio.Semaphore(settings.generation_condense_concurrency)
+
+        async def summarize(index: int, chunk: str) -> str:
+            async with semaphore:
+                return await self._complete(
+                    MAP_PROMPT.format(part=index + 1, parts=len(chunks), max_words=per_chunk_words),
+                    chunk,
+                    max_words=per_chunk_words,
+                )
+
+        summaries = await asyncio.gather(
+            *(summarize(i, chunk) for i, chunk in enumerate(chunks))
+        )
+        joined = "\n\n".join(summaries)
+
+        if estimate_tokens(joined) <= budget:
+            return joined
+        if not final and estimate_tokens(joined) > settings.generation_condense_chunk_tokens:
+            return joined
+
+        max_words = budget * 3 // 4
+        return await self._complete(REDUCE_PROMPT.format(max_words=max_words), joined, max_words)
+
+    async def _complete(self, system_prompt: str, text: str, max_words: int) -> str:
+        response = await self.llm.complete(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            temperature=0.2,
+            max_tokens=max_words * 2,
+        )
+        return (response["completion"] or "").strip()
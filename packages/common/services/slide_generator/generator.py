@@ -3,7 +3,9 @@ Slide Generation Service
 Transforms raw text into structured slide presentations using LLM with tool calling
 """
 
+import asyncio
 import json
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Literal
 
@@ -12,25 +14,46 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from packages.common.core.config import settings
+from packages.common.core.database import async_session_factory
 from packages.common.core.logging import get_logger
 from packages.common.models import Presentation, Slide
-from packages.common.providers.llm import OpenRouterProvider
+from packages.common.providers.llm import get_openrouter_provider
 from packages.common.providers.unsplash import unsplash_provider
-from packages.common.schemas import PresentationResponse
+from packages.common.schemas import GenerationMode, PresentationResponse
+from packages.common.services.export_cache import export_cache
 from packages.common.themes import Theme, get_theme
 
-from .tools import SLIDE_TOOLS, SYSTEM_PROMPT
+from .cache import CachedDeck, GenerationCache, generation_cache
+from .compaction import ConversationHistory, TokenUsage, message_chars
+from .condense import DocumentCondenser, estimate_tokens
+from .idempotency import PENDING, PENDING_TTL_SECONDS, get_idempotency_store
+from .outline import select_context, slide_prompt, split_passages
+from .singleflight import generation_flights
+from .streaming import ToolCallAccumulator
+from .tools import (
+    ADD_SLIDE_PARAMETERS,
+    DECK_SCHEMA,
+    DECK_SYSTEM_PROMPT,
+    OUTLINE_SCHEMA,
+    OUTLINE_SYSTEM_PROMPT,
+    SLIDE_SYSTEM_PROMPT,
+    SLIDE_TOOLS,
+    SLIDE_TYPES,
+    SYSTEM_PROMPT,
+)
 
 logger = get_logger(__name__)
 
 MAX_ITERATIONS = 25  # Safety limit for agentic loop
+IDEMPOTENCY_POLL_SECONDS = 1.0  # How often a retry checks on a generation running elsewhere
 
 
 @dataclass
 class AgentEvent:
     """Event emitted during slide generation for real-time UI updates."""
 
-    type: Literal["thinking", "tool_call", "tool_result", "complete", "error"]
+    type: Literal["thinking", "slide_preview", "tool_call", "tool_result", "complete", "error"]
     data: dict[str, Any]
 
     def to_sse(self) -> str:
@@ -46,10 +69,21 @@ class SlideGeneratorService:
     then persists to database.
     """
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self.llm = OpenRouterProvider()
+    def __init__(self, db: AsyncSession | None = None):
+        # generate_stream() opens its own sessions, so streaming callers can omit db
+        self._db = db
+        self.llm = get_openrouter_provider()
         self.current_theme: Theme | None = None
+        # Unsplash lookups started by add_slide, attached before the final commit
+        self._image_tasks: list[tuple[Slide, asyncio.Task[dict | None]]] = []
+        # Slides built by add_slide, written in one batch when the deck is saved
+        self._pending_slides: list[Slide] = []
+
+    @property
+    def db(self) -> AsyncSession:
+        if self._db is None:
+            raise RuntimeError("SlideGeneratorService was created without a database session")
+        return self._db
 
     async def generate(
         self,
@@ -59,6 +93,9 @@ class SlideGeneratorService:
         theme: str = "neobrutalism",
         api_key_id: int | None = None,
         template_prompt: str | None = None,
+        mode: GenerationMode = "agent",
+        use_cache: bool = True,
+        idempotency_key: str | None = None,
     ) -> PresentationResponse:
         """
         Generate a presentation from input text using tool calling.
@@ -70,37 +107,227 @@ class SlideGeneratorService:
             theme: Presentation theme name
             api_key_id: Optional API key ID (for public API tracking)
             template_prompt: Optional template structure guidance for AI
+            mode: "agent" for the tool-calling loop, "single_shot" for one
+                structured call, "outline" for an outline then concurrent
+                per-slide calls (both fall back to the agent loop on failure)
+            use_cache: Serve identical earlier requests from the generation cache
+            idempotency_key: Client-supplied key; retries with the same key
+                return the original presentation instead of generating again
 
         Returns:
             PresentationResponse with generated slides
         """
+        cache_key = self._cache_key(text, title, slide_count, theme, template_prompt, mode)
+        use_cache = use_cache and settings.generation_cache_enabled
+
+        if idempotency_key:
+            idempotency_key = f"generate:{api_key_id}:{idempotency_key}"
+            presentation_id = await get_idempotency_store().get(idempotency_key)
+            if presentation_id is not None and presentation_id != PENDING:
+                logger.info(f"Idempotent retry, returning presentation {presentation_id}")
+                return await self._load_presentation(int(presentation_id))
+
+        if use_cache:
+            cached = generation_cache.get(cache_key)
+            if cached:
+                logger.info(f"Generation cache hit, cloning {len(cached.slides)} cached slides")
+                return await self._clone_cached(cached, text, theme, api_key_id)
+
+        async def run() -> PresentationResponse:
+            # Runs detached from this request, so it needs its own session
+            async with async_session_factory() as db:
+                service = SlideGeneratorService(db)
+                service.llm = self.llm
+
+                async def generate() -> PresentationResponse:
+                    try:
+                        result = await service._generate_uncached(
+                            text=text,
+                            slide_count=slide_count,
+                            title=title,
+                            theme=theme,
+                            api_key_id=api_key_id,
+                            template_prompt=template_prompt,
+                            mode=mode,
+                        )
+                    finally:
+                        await service._cancel_images()
+                    if use_cache:
+                        generation_cache.put(cache_key, result)
+                    return result
+
+                if idempotency_key:
+                    return await service._generate_once(idempotency_key, generate)
+                return await generate()
+
+        # Identical requests (or retries with the same idempotency key) from
+        # the same caller share one in-flight generation; it keeps running if
+        # the request that started it goes away. A caller bypassing the cache
+        # gets a generation of its own.
+        if idempotency_key:
+            return await generation_flights.do(f"idem:{idempotency_key}", run)
+        if not use_cache:
+            return await run()
+        return await generation_flights.do(f"{api_key_id}:{cache_key}", run)
+
+    async def generate_stream(
+        self,
+        text: str,
+        slide_count: int = 8,
+        title: str | None = None,
+        theme: str = "neobrutalism",
+        template_prompt: str | None = None,
+        mode: GenerationMode = "agent",
+        use_cache: bool = True,
+        api_key_id: int | None = None,
+    ) -> AsyncGenerator[AgentEvent, None]:
+        """
+        Generate a presentation with real-time event streaming.
+
+        Yields AgentEvent objects for UI updates as the agent works.
+        On a generation cache hit the cached deck is cloned and its events
+        are replayed without calling the LLM. Uses its own database
+        sessions rather than self.db.
+        """
+        cache_key = self._cache_key(text, title, slide_count, theme, template_prompt, mode)
+        use_cache = use_cache and settings.generation_cache_enabled
+
+        if use_cache:
+            cached = generation_cache.get(cache_key)
+            if cached:
+                logger.info(f"Generation cache hit, replaying {len(cached.slides)} cached slides")
+                async with async_session_factory() as db:
+                    service = SlideGeneratorService(db)
+                    async for event in service._replay_cached(cached, text, theme, api_key_id):
+                        yield event
+                return
+
+        async def run() -> AsyncGenerator[AgentEvent, None]:
+            # Runs detached from this request, so it needs its own session
+            async with async_session_factory() as db:
+                service = SlideGeneratorService(db)
+                service.llm = self.llm
+                try:
+                    async for event in service._generate_stream_uncached(
+                        text=text,
+                        slide_count=slide_count,
+                        title=title,
+                        theme=theme,
+                        api_key_id=api_key_id,
+                        template_prompt=template_prompt,
+                        mode=mode,
+                    ):
+                        if use_cache and event.type == "complete":
+                            generation_cache.put(
+                                cache_key,
+                                PresentationResponse.model_validate(event.data["presentation"]),
+                            )
+                        yield event
+                finally:
+                    await service._cancel_images()
+
+        if not use_cache:
+            async for event in run():
+                yield event
+            return
+
+        # Identical concurrent streams share one generation; late joiners
+        # replay its events from the start and a disconnect doesn't cancel it
+        async for event in generation_flights.stream(f"stream:{api_key_id}:{cache_key}", run):
+            yield event
+
+    async def _generate_once(
+        self,
+        idempotency_key: str,
+        generate: Callable[[], Awaitable[PresentationResponse]],
+    ) -> PresentationResponse:
+        """
+        Run generate under an idempotency key.
+
+        If another process already claimed the key, wait for its
+        presentation instead; if that generation fails, the key is released
+        and the next claim runs it here.
+        """
+        store = get_idempotency_store()
+        while True:
+            existing = await store.claim(idempotency_key, PENDING, PENDING_TTL_SECONDS)
+            if existing is None:
+                break
+            if existing != PENDING:
+                logger.info(f"Idempotent retry, returning presentation {existing}")
+                return await self._load_presentation(int(existing))
+            await asyncio.sleep(IDEMPOTENCY_POLL_SECONDS)
+
+        try:
+            result = await generate()
+        except BaseException:
+            await store.release(idempotency_key, PENDING)
+            raise
+        await store.put(idempotency_key, str(result.id))
+        return result
+
+    async def _generate_uncached(
+        self,
+        text: str,
+        slide_count: int,
+        title: str | None,
+        theme: str,
+        api_key_id: int | None,
+        template_prompt: str | None,
+        mode: GenerationMode,
+    ) -> PresentationResponse:
+        """Run a generation end to end (agent loop or single-shot)."""
         logger.info(f"Generating presentation with {slide_count} slides using tool calling")
 
         # Set current theme for tool calls
         self.current_theme = get_theme(theme)
 
-        # Create presentation shell
+        # Presentation shell; it and its slides are only written once the
+        # deck is complete, so no connection is held while the LLM works
         presentation = Presentation(
             title=title or "Untitled Presentation",
             input_text=text,
             theme=theme,
             api_key_id=api_key_id,
         )
-        self.db.add(presentation)
-        await self.db.flush()  # Get presentation.id
+
+        # Long documents are condensed into a brief for the prompts;
+        # the presentation keeps the original input_text
+        text = await self._condense_input(text)
+
+        if mode != "agent":
+            try:
+                if mode == "outline":
+                    deck_title, slide_args = await self._generate_outlined_deck(
+                        text, slide_count, template_prompt
+                    )
+                else:
+                    deck_title, slide_args = await self._generate_deck(
+                        text, slide_count, template_prompt
+                    )
+            except Exception as e:
+                logger.warning(f"{mode} generation failed, using agent loop: {e}")
+                deck_title, slide_args = None, []
+
+            if slide_args:
+                await self._insert_deck(deck_title, slide_args, presentation)
+                logger.info(
+                    f"Created presentation {presentation.id} with {len(slide_args)} slides "
+                    f"({mode} mode)"
+                )
+                return await self._load_presentation(presentation.id)
 
         # Build initial messages
         system_content = SYSTEM_PROMPT.format(slide_count=slide_count)
         if template_prompt:
             system_content += f"\n\n{template_prompt}"
 
-        messages: list[dict[str, Any]] = [
-            {
-                "role": "system",
-                "content": system_content,
-            },
-            {"role": "user", "content": text},
-        ]
+        history = ConversationHistory(
+            system_content=system_content,
+            user_content=text,
+            compact=settings.generation_compact_history,
+        )
+        usage = TokenUsage()
 
         slide_order = 0
 
@@ -108,11 +335,15 @@ class SlideGeneratorService:
         for iteration in range(MAX_ITERATIONS):
             logger.debug(f"Tool calling iteration {iteration + 1}")
 
+            messages = history.messages()
             response = await self.llm.complete_with_tools(
                 messages=messages,
                 tools=SLIDE_TOOLS,
                 temperature=0.7,
             )
+            usage.record(
+                response.usage, message_chars(messages), message_chars(history.full_messages())
+            )
 
             assistant_message = response.choices[0].message
             tool_calls = assistant_message.tool_calls
@@ -123,7 +354,7 @@ class SlideGeneratorService:
                 break
 
             # Add assistant message with tool calls to context
-            messages.append(
+            history.add_assistant(
                 {
                     "role": "assistant",
                     "content": assistant_message.content or "",
@@ -147,46 +378,40 @@ class SlideGeneratorService:
                     tool_call, presentation, slide_order
                 )
 
-                # Add tool result to messages
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": result,
-                    }
-                )
+                # Add tool result to context
+                history.add_tool_result(tool_call, result, slide_order)
 
                 if tool_call.function.name == "add_slide":
                     slide_order += 1
 
                 if finished:
-                    await self.db.commit()
+                    await self._save_presentation(presentation)
                     logger.info(
-                        f"Created presentation {presentation.id} with {slide_order} slides"
+                        f"Created presentation {presentation.id} with {slide_order} slides "
+                        f"(usage: {usage.to_dict()})"
                     )
                     return await self._load_presentation(presentation.id)
 
         # Loop ended without finish_presentation - commit what we have
-        await self.db.commit()
+        await self._save_presentation(presentation)
         logger.warning(
             f"Loop ended without finish_presentation. "
-            f"Created presentation {presentation.id} with {slide_order} slides"
+            f"Created presentation {presentation.id} with {slide_order} slides "
+            f"(usage: {usage.to_dict()})"
         )
         return await self._load_presentation(presentation.id)
 
-    async def generate_stream(
+    async def _generate_stream_uncached(
         self,
         text: str,
-        slide_count: int = 8,
-        title: str | None = None,
-        theme: str = "neobrutalism",
-        template_prompt: str | None = None,
+        slide_count: int,
+        title: str | None,
+        theme: str,
+        api_key_id: int | None,
+        template_prompt: str | None,
+        mode: GenerationMode,
     ) -> AsyncGenerator[AgentEvent, None]:
-        """
-        Generate a presentation with real-time event streaming.
-
-        Yields AgentEvent objects for UI updates as the agent works.
-        """
+        """Run a streaming generation end to end (agent loop or single-shot)."""
         logger.info(f"=== STREAM START === slide_count={slide_count}, theme={theme}")
         logger.info(f"Text length: {len(text)} chars")
         if template_prompt:
@@ -204,17 +429,120 @@ class SlideGeneratorService:
         )
         logger.info("First event yielded successfully")
 
-        # Create presentation shell
-        logger.info("Creating presentation shell...")
+        # Presentation shell, saved with its slides once the deck is complete
         presentation = Presentation(
             title=title or "Untitled Presentation",
             input_text=text,
             theme=theme,
+            api_key_id=api_key_id,
         )
-        self.db.add(presentation)
-        logger.info("Flushing to database...")
-        await self.db.flush()
-        logger.info(f"Presentation created with ID: {presentation.id}")
+
+        # Long documents are condensed into a brief for the prompts;
+        # the presentation keeps the original input_text
+        if estimate_tokens(text) > settings.generation_condense_threshold_tokens:
+            yield AgentEvent(
+                type="thinking",
+                data={"message": "Condensing a long document..."},
+            )
+            text = await self._condense_input(text)
+
+        if mode == "single_shot":
+            yield AgentEvent(
+                type="thinking",
+                data={"message": "Writing the whole deck in one pass..."},
+            )
+            try:
+                deck_title, slide_args = await self._generate_deck(
+                    text, slide_count, template_prompt
+                )
+            except Exception as e:
+                logger.warning(f"Single-shot generation failed, using agent loop: {e}")
+                deck_title, slide_args = None, []
+
+            if slide_args:
+                for order, args in enumerate(slide_args):
+                    yield AgentEvent(
+                        type="tool_call",
+                        data={
+                            "tool": "add_slide",
+                            "args": args,
+                            "slide_number": order + 1,
+                            "slide": self._slide_preview(args, order),
+                        },
+                    )
+                await self._insert_deck(deck_title, slide_args, presentation)
+                final = await self._load_presentation(presentation.id)
+                yield AgentEvent(
+                    type="complete",
+                    data={
+                        "presentation_id": presentation.id,
+                        "title": final.title,
+                        "slide_count": len(final.slides),
+                        "presentation": final.model_dump(mode="json"),
+                    },
+                )
+                return
+
+            yield AgentEvent(
+                type="thinking",
+                data={"message": "Switching to step-by-step generation..."},
+            )
+
+        if mode == "outline":
+            yield AgentEvent(
+                type="thinking",
+                data={"message": "Outlining the deck..."},
+            )
+            try:
+                deck_title, outline = await self._generate_outline(
+                    text, slide_count, template_prompt
+                )
+            except Exception as e:
+                logger.warning(f"Outline generation failed, using agent loop: {e}")
+                deck_title, outline = None, []
+
+            if outline:
+                yield AgentEvent(
+                    type="thinking",
+                    data={"message": f"Writing {len(outline)} slides in parallel..."},
+                )
+                slide_args = [{} for _ in outline]
+                tasks = self._start_outlined_slides(text, deck_title, outline, template_prompt)
+                try:
+                    # Emit slides as they finish; order comes from the outline position
+                    for next_done in asyncio.as_completed(tasks):
+                        order, args = await next_done
+                        slide_args[order] = args
+                        yield AgentEvent(
+                            type="tool_call",
+                            data={
+                                "tool": "add_slide",
+                                "args": args,
+                                "slide_number": order + 1,
+                                "slide": self._slide_preview(args, order),
+                            },
+                        )
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+                await self._insert_deck(deck_title, slide_args, presentation)
+                final = await self._load_presentation(presentation.id)
+                yield AgentEvent(
+                    type="complete",
+                    data={
+                        "presentation_id": presentation.id,
+                        "title": final.title,
+                        "slide_count": len(final.slides),
+                        "presentation": final.model_dump(mode="json"),
+                    },
+                )
+                return
+
+            yield AgentEvent(
+                type="thinking",
+                data={"message": "Switching to step-by-step generation..."},
+            )
 
         # Build initial messages
         logger.info("Building initial messages...")
@@ -223,17 +551,15 @@ class SlideGeneratorService:
             system_content += f"\n\n{template_prompt}"
         logger.info(f"System prompt length: {len(system_content)} chars")
 
-        messages: list[dict[str, Any]] = [
-            {
-                "role": "system",
-                "content": system_content,
-            },
-            {"role": "user", "content": text},
-        ]
+        history = ConversationHistory(
+            system_content=system_content,
+            user_content=text,
+            compact=settings.generation_compact_history,
+        )
+        usage = TokenUsage()
 
         slide_order = 0
-        presentation_id = presentation.id
-        logger.info(f"Starting agentic loop. Presentation ID: {presentation_id}")
+        logger.info("Starting agentic loop")
 
         # Agentic loop
         for iteration in range(MAX_ITERATIONS):
@@ -244,15 +570,35 @@ class SlideGeneratorService:
             )
             logger.info(f"Iteration {iteration + 1}: Thinking event yielded")
 
+            # Stream the completion so slides can be previewed while arguments are written
+            accumulator = ToolCallAccumulator()
+            last_previews: dict[int, dict[str, Any]] = {}
+            messages = history.messages()
             try:
-                logger.info(f"Iteration {iteration + 1}: Calling LLM API...")
+                logger.info(f"Iteration {iteration + 1}: Streaming LLM API...")
                 logger.info(f"Model: {self.llm.model}, Messages count: {len(messages)}")
-                response = await self.llm.complete_with_tools(
+                async for chunk in self.llm.stream_with_tools(
                     messages=messages,
                     tools=SLIDE_TOOLS,
                     temperature=0.7,
-                )
-                logger.info(f"Iteration {iteration + 1}: LLM API call completed successfully")
+                ):
+                    for index in accumulator.add(chunk):
+                        if accumulator.name(index) != "add_slide":
+                            continue
+                        partial_args = accumulator.partial_arguments(index)
+                        if not partial_args or partial_args == last_previews.get(index):
+                            continue
+                        last_previews[index] = partial_args
+                        order = slide_order + accumulator.position(index, "add_slide")
+                        yield AgentEvent(
+                            type="slide_preview",
+                            data={
+                                "slide_number": order + 1,
+                                "slide": self._slide_preview(partial_args, order),
+                                "partial": True,
+                            },
+                        )
+                logger.info(f"Iteration {iteration + 1}: LLM API stream completed successfully")
             except Exception as e:
                 logger.error(f"LLM API call failed (iteration {iteration + 1}): {e}", exc_info=True)
                 yield AgentEvent(
@@ -261,27 +607,30 @@ class SlideGeneratorService:
                 )
                 raise
 
-            assistant_message = response.choices[0].message
-            tool_calls = assistant_message.tool_calls
+            usage.record(
+                accumulator.usage, message_chars(messages), message_chars(history.full_messages())
+            )
+            content = accumulator.content
+            tool_calls = accumulator.tool_calls()
 
             if not tool_calls:
                 break
 
             # Emit thinking event with LLM's reasoning
-            if assistant_message.content:
+            if content:
                 yield AgentEvent(
                     type="thinking",
                     data={
-                        "message": assistant_message.content,
+                        "message": content,
                         "iteration": iteration + 1,
                     },
                 )
 
             # Add assistant message to context
-            messages.append(
+            history.add_assistant(
                 {
                     "role": "assistant",
-                    "content": assistant_message.content or "",
+                    "content": content,
                     "tool_calls": [
                         {
                             "id": tc.id,
@@ -313,21 +662,7 @@ class SlideGeneratorService:
 
                 # Include slide preview data
                 if name == "add_slide":
-                    event_data["slide"] = {
-                        "type": args.get("slide_type", "content"),
-                        "title": args.get("title"),
-                        "subtitle": args.get("subtitle"),
-                        "body": args.get("body"),
-                        "bullets": args.get("bullets"),
-                        "quote": args.get("quote"),
-                        "attribution": args.get("attribution"),
-                        "layout": args.get("layout", "center"),
-                        "order": slide_order,
-                        "chart_type": args.get("chart_type"),
-                        "chart_data": args.get("chart_data"),
-                        "chart_config": args.get("chart_config"),
-                        "image_query": args.get("image_query"),
-                    }
+                    event_data["slide"] = self._slide_preview(args, slide_order)
 
                 yield AgentEvent(type="tool_call", data=event_data)
 
@@ -346,19 +681,13 @@ class SlideGeneratorService:
                     },
                 )
 
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": result,
-                    }
-                )
+                history.add_tool_result(tool_call, result, slide_order)
 
                 if name == "add_slide":
                     slide_order += 1
 
                 if finished:
-                    await self.db.commit()
+                    presentation_id = await self._save_presentation(presentation)
                     final = await self._load_presentation(presentation_id)
                     yield AgentEvent(
                         type="complete",
@@ -367,12 +696,13 @@ class SlideGeneratorService:
                             "title": final.title,
                             "slide_count": len(final.slides),
                             "presentation": final.model_dump(mode="json"),
+                            "usage": usage.to_dict(),
                         },
                     )
                     return
 
         # Loop ended
-        await self.db.commit()
+        presentation_id = await self._save_presentation(presentation)
         final = await self._load_presentation(presentation_id)
         yield AgentEvent(
             type="complete",
@@ -381,9 +711,108 @@ class SlideGeneratorService:
                 "title": final.title,
                 "slide_count": len(final.slides),
                 "presentation": final.model_dump(mode="json"),
+                "usage": usage.to_dict(),
             },
         )
 
+    async def _condense_input(self, text: str) -> str:
+        """Condense long input text for the prompts; returns it unchanged on failure."""
+        try:
+            return await DocumentCondenser(self.llm).condense(text)
+        except Exception as e:
+            logger.warning(f"Condensing input failed, using the full text: {e}")
+            return text
+
+    def _cache_key(
+        self,
+        text: str,
+        title: str | None,
+        slide_count: int,
+        theme: str,
+        template_prompt: str | None,
+        mode: GenerationMode,
+    ) -> str:
+        """Generation cache key for a request."""
+        return GenerationCache.make_key(
+            text, title, slide_count, theme, template_prompt, self.llm.model, mode
+        )
+
+    async def _clone_cached(
+        self,
+        cached: CachedDeck,
+        text: str,
+        theme: str,
+        api_key_id: int | None = None,
+    ) -> PresentationResponse:
+        """Create a new presentation from a cached slide set."""
+        presentation = Presentation(
+            title=cached.title,
+            input_text=text,
+            theme=theme,
+            api_key_id=api_key_id,
+            slides=[Slide(**fields) for fields in cached.slides],
+        )
+        self.db.add(presentation)
+        await self.db.commit()
+        export_cache.prerender(presentation)
+        return await self._load_presentation(presentation.id)
+
+    async def _replay_cached(
+        self,
+        cached: CachedDeck,
+        text: str,
+        theme: str,
+        api_key_id: int | None = None,
+    ) -> AsyncGenerator[AgentEvent, None]:
+        """Clone a cached deck and emit the events a live generation would."""
+        yield AgentEvent(
+            type="thinking",
+            data={"message": "Found an identical earlier request, reusing its slides..."},
+        )
+
+        final = await self._clone_cached(cached, text, theme, api_key_id)
+
+        for slide in final.slides:
+            slide_data = slide.model_dump(mode="json", exclude={"id"})
+            yield AgentEvent(
+                type="tool_call",
+                data={
+                    "tool": "add_slide",
+                    "args": slide_data,
+                    "slide_number": slide.order + 1,
+                    "slide": slide_data,
+                },
+            )
+
+        yield AgentEvent(
+            type="complete",
+            data={
+                "presentation_id": final.id,
+                "title": final.title,
+                "slide_count": len(final.slides),
+                "presentation": final.model_dump(mode="json"),
+                "cached": True,
+            },
+        )
+
+    def _slide_preview(self, args: dict[str, Any], order: int) -> dict[str, Any]:
+        """Slide fields from add_slide arguments, for UI previews."""
+        return {
+            "type": args.get("slide_type", "content"),
+            "title": args.get("title"),
+            "subtitle": args.get("subtitle"),
+            "body": args.get("body"),
+            "bullets": args.get("bullets"),
+            "quote": args.get("quote"),
+            "attribution": args.get("attribution"),
+            "layout": args.get("layout", "center"),
+            "order": order,
+            "chart_type": args.get("chart_type"),
+            "chart_data": args.get("chart_data"),
+            "chart_config": args.get("chart_config"),
+            "image_query": args.get("image_query"),
+        }
+
     async def _load_presentation(self, presentation_id: int) -> PresentationResponse:
         """Load a presentation with all relationships for serialization."""
         stmt = (
@@ -417,36 +846,31 @@ class SlideGeneratorService:
         if name == "get_current_theme":
             return self._get_current_theme(), False
         elif name == "add_slide":
-            return await self._add_slide(args, presentation, slide_order)
+            return self._add_slide(args, slide_order)
         elif name == "finish_presentation":
             return await self._finish_presentation(args, presentation)
         else:
             return f"Error: Unknown tool '{name}'", False
 
-    async def _add_slide(
+    def _add_slide(
         self,
         args: dict[str, Any],
-        presentation: Presentation,
         order: int,
     ) -> tuple[str, bool]:
-        """Add a slide to the presentation."""
-        # Fetch image from Unsplash if image_query is provided
-        image_url = None
-        image_alt = None
-        image_credit = None
+        """Add a slide to the pending batch for the presentation."""
+        slide = self._build_slide(args, order)
+        self._pending_slides.append(slide)
 
-        image_query = args.get("image_query")
-        if image_query:
-            try:
-                image_data = await unsplash_provider.search_image(image_query)
-                if image_data:
-                    image_url = image_data["url"]
-                    image_alt = image_data["alt"]
-                    image_credit = f"Photo by {image_data['photographer']} on Unsplash"
-                    logger.debug(f"Fetched image for query '{image_query}': {image_url[:50]}...")
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for query '{image_query}': {e}")
+        logger.debug(f"Added slide {order + 1}: {slide.type} - {slide.title}")
+        image_info = " (with image)" if args.get("image_query") else ""
+        return f"Added slide {order + 1}: {slide.type} slide titled '{slide.title}'{image_info}", False
 
+    def _build_slide(
+        self,
+        args: dict[str, Any],
+        order: int,
+    ) -> Slide:
+        """Build a Slide from add_slide arguments and start its image lookup."""
         # Helper to ensure JSON fields get None instead of empty/null values
         # Also handles cases where LLM passes the literal string "null"
         def get_json_field(key: str) -> Any:
@@ -456,7 +880,6 @@ class SlideGeneratorService:
             return val
 
         slide = Slide(
-            presentation_id=presentation.id,
             type=args.get("slide_type", "content"),
             title=args.get("title"),
             subtitle=args.get("subtitle"),
@@ -469,9 +892,6 @@ class SlideGeneratorService:
             chart_type=args.get("chart_type"),
             chart_data=get_json_field("chart_data"),
             chart_config=get_json_field("chart_config"),
-            image_url=image_url,
-            image_alt=image_alt,
-            image_credit=image_credit,
             # New slide type fields
             stats=get_json_field("stats"),
             big_number_value=args.get("big_number_value"),
@@ -480,12 +900,255 @@ class SlideGeneratorService:
             comparison_columns=get_json_field("comparison_columns"),
             timeline_items=get_json_field("timeline_items"),
         )
-        self.db.add(slide)
-        await self.db.flush()
 
-        logger.debug(f"Added slide {order + 1}: {slide.type} - {slide.title}")
-        image_info = " (with image)" if image_url else ""
-        return f"Added slide {order + 1}: {slide.type} slide titled '{slide.title}'{image_info}", False
+        # Resolve the image in the background so the agent loop isn't blocked on Unsplash
+        image_query = args.get("image_query")
+        if image_query:
+            task = asyncio.create_task(self._fetch_image(image_query))
+            self._image_tasks.append((slide, task))
+
+        return slide
+
+    async def _generate_deck(
+        self,
+        text: str,
+        slide_count: int,
+        template_prompt: str | None,
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """
+        Generate the whole deck with one structured-output call.
+
+        Returns:
+            Tuple of (deck_title, add_slide argument dicts in order)
+
+        Raises:
+            ValueError: If the response doesn't contain a usable deck
+        """
+        system_content = DECK_SYSTEM_PROMPT.format(slide_count=slide_count)
+        if template_prompt:
+            system_content += f"\n\n{template_prompt}"
+
+        response = await self.llm.complete_json(
+            messages=[
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": text},
+            ],
+            schema=DECK_SCHEMA,
+            schema_name="presentation",
+            temperature=0.7,
+        )
+        deck = response["data"]
+
+        raw_slides = deck.get("slides") if isinstance(deck, dict) else None
+        if not isinstance(raw_slides, list):
+            raise ValueError("Structured response has no slides array")
+
+        slides = [
+            args
+            for args in raw_slides
+            if isinstance(args, dict)
+            and args.get("slide_type") in SLIDE_TYPES
+            and isinstance(args.get("title"), str)
+        ]
+        if not slides:
+            raise ValueError("Structured response contained no valid slides")
+        if len(slides) < len(raw_slides):
+            logger.warning(f"Dropped {len(raw_slides) - len(slides)} invalid slides from deck")
+
+        return deck.get("title"), slides
+
+    async def _generate_outline(
+        self,
+        text: str,
+        slide_count: int,
+        template_prompt: str | None,
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """
+        Generate the deck outline (slide types, titles, summaries, keywords).
+
+        Returns:
+            Tuple of (deck_title, outline entries in order)
+
+        Raises:
+            ValueError: If the response doesn't contain a usable outline
+        """
+        system_content = OUTLINE_SYSTEM_PROMPT.format(slide_count=slide_count)
+        if template_prompt:
+            system_content += f"\n\n{template_prompt}"
+
+        response = await self.llm.complete_json(
+            messages=[
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": text},
+            ],
+            schema=OUTLINE_SCHEMA,
+            schema_name="outline",
+            temperature=0.7,
+            max_tokens=4096,
+        )
+        deck = response["data"]
+
+        raw_entries = deck.get("slides") if isinstance(deck, dict) else None
+        if not isinstance(raw_entries, list):
+            raise ValueError("Outline response has no slides array")
+
+        outline = [
+            entry
+            for entry in raw_entries
+            if isinstance(entry, dict)
+            and entry.get("slide_type") in SLIDE_TYPES
+            and isinstance(entry.get("title"), str)
+        ]
+        if not outline:
+            raise ValueError("Outline response contained no valid slides")
+
+        for entry in outline:
+            if not isinstance(entry.get("keywords"), list):
+                entry["keywords"] = []
+
+        return deck.get("title"), outline
+
+    def _start_outlined_slides(
+        self,
+        text: str,
+        deck_title: str | None,
+        outline: list[dict[str, Any]],
+        template_prompt: str | None,
+    ) -> list[asyncio.Task[tuple[int, dict[str, Any]]]]:
+        """Start one bounded-concurrency task per outlined slide."""
+        passages = split_passages(text)
+        semaphore = asyncio.Semaphore(settings.generation_outline_concurrency)
+        system_content = SLIDE_SYSTEM_PROMPT.format(slide_count=len(outline))
+        if template_prompt:
+            system_content += f"\n\n{template_prompt}"
+
+        async def write_slide(order: int) -> tuple[int, dict[str, Any]]:
+            entry = outline[order]
+            context = select_context(
+                passages, entry, settings.generation_outline_context_chars
+            )
+            async with semaphore:
+                try:
+                    response = await self.llm.complete_json(
+                        messages=[
+                            {"role": "system", "content": system_content},
+                            {
+                                "role": "user",
+                                "content": slide_prompt(deck_title, outline, order, context),
+                            },
+                        ],
+                        schema=ADD_SLIDE_PARAMETERS,
+                        schema_name="slide",
+                        temperature=0.7,
+                    )
+                    args = response["data"]
+                    if not isinstance(args, dict) or args.get("slide_type") not in SLIDE_TYPES:
+                        raise ValueError("Slide response is not a valid slide")
+                except Exception as e:
+                    # Keep the deck complete: fall back to the outline entry itself
+                    logger.warning(f"Writing outlined slide {order + 1} failed: {e}")
+                    summary_field = "subtitle" if order == 0 else "body"
+                    args = {
+                        "slide_type": "title" if order == 0 else "content",
+                        "title": entry["title"],
+                        summary_field: entry.get("summary"),
+                    }
+            return order, args
+
+        return [asyncio.create_task(write_slide(order)) for order in range(len(outline))]
+
+    async def _generate_outlined_deck(
+        self,
+        text: str,
+        slide_count: int,
+        template_prompt: str | None,
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """
+        Generate a deck in two phases: an outline, then every slide concurrently.
+
+        Returns:
+            Tuple of (deck_title, add_slide argument dicts in order)
+        """
+        deck_title, outline = await self._generate_outline(text, slide_count, template_prompt)
+        tasks = self._start_outlined_slides(text, deck_title, outline, template_prompt)
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return deck_title, [args for _, args in sorted(results, key=lambda result: result[0])]
+
+    async def _insert_deck(
+        self,
+        deck_title: str | None,
+        slide_args: list[dict[str, Any]],
+        presentation: Presentation,
+    ) -> None:
+        """Save a complete deck generated in one call."""
+        self._pending_slides = [
+            self._build_slide(args, order) for order, args in enumerate(slide_args)
+        ]
+        presentation.title = deck_title or presentation.title
+        await self._save_presentation(presentation)
+
+    async def _save_presentation(self, presentation: Presentation) -> int:
+        """
+        Write the presentation and its pending slides in one transaction.
+
+        The slides go out as a single multi-row INSERT, after image lookups
+        have finished so no UPDATEs follow.
+
+        Returns:
+            The new presentation ID
+        """
+        await self._attach_images()
+        presentation.slides = self._pending_slides
+        self._pending_slides = []
+
+        self.db.add(presentation)
+        await self.db.commit()
+        export_cache.prerender(presentation)
+        return presentation.id
+
+    async def _fetch_image(self, image_query: str) -> dict | None:
+        """Look up a stock image for a slide. Never raises."""
+        try:
+            image_data = await unsplash_provider.search_image(image_query)
+            if image_data:
+                logger.debug(
+                    f"Fetched image for query '{image_query}': {image_data['url'][:50]}..."
+                )
+            return image_data
+        except Exception as e:
+            logger.warning(f"Failed to fetch image for query '{image_query}': {e}")
+            return None
+
+    async def _attach_images(self) -> None:
+        """Wait for pending image lookups and copy the results onto their slides."""
+        if not self._image_tasks:
+            return
+
+        pending = self._image_tasks
+        self._image_tasks = []
+        results = await asyncio.gather(*(task for _, task in pending))
+
+        for (slide, _), image_data in zip(pending, results, strict=True):
+            if not image_data:
+                continue
+            slide.image_url = image_data["url"]
+            slide.image_alt = image_data["alt"]
+            slide.image_credit = f"Photo by {image_data['photographer']} on Unsplash"
+
+    async def _cancel_images(self) -> None:
+        """Cancel image lookups left behind by a generation that didn't save its deck."""
+        if not self._image_tasks:
+            return
+
+        pending = self._image_tasks
+        self._image_tasks = []
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
     async def _finish_presentation(
         self,
@@ -0,0 +1,133 @@
+"""
+Idempotency key store
+Maps client idempotency keys to what their first request produced (a
+presentation or a generation job), so retries return the original result.
+Uses the same memory/redis split as the job queue: with job_backend =
+"redis" a retry that lands on another worker or node finds the original.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from packages.common.core.config import settings
+from packages.common.core.redis import get_redis
+
+KEY_PREFIX = "decksnap:idempotency"
+PENDING = "pending"  # Value held while the first request is still running
+PENDING_TTL_SECONDS = 600  # A claim left by a crashed worker stops blocking retries after this
+
+# Deletes a key only if it still holds the value the caller claimed it with
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class IdempotencyStore(ABC):
+    """
+    Base class for idempotency key stores.
+
+    Values are strings (a presentation or job ID, or PENDING). Entries
+    expire after ttl_seconds.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Return the value stored for a key, or None."""
+
+    @abstractmethod
+    async def claim(self, key: str, value: str, ttl_seconds: int) -> str | None:
+        """
+        Store value if the key is free.
+
+        Returns:
+            None if this call claimed the key, otherwise the value already stored
+        """
+
+    @abstractmethod
+    async def put(self, key: str, value: str) -> None:
+        """Store (or overwrite) the value for a key."""
+
+    @abstractmethod
+    async def release(self, key: str, value: str) -> None:
+        """Forget a key, unless it has been overwritten since it was claimed."""
+
+
+class InProcessIdempotencyStore(IdempotencyStore):
+    """Idempotency keys in a dict; only retries that reach this process are matched."""
+
+    def __init__(self, ttl_seconds: int):
+        super().__init__(ttl_seconds)
+        self._values: dict[str, tuple[str, float]] = {}  # key -> (value, expires at)
+
+    async def get(self, key: str) -> str | None:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._values[key]
+            return None
+        return value
+
+    async def claim(self, key: str, value: str, ttl_seconds: int) -> str | None:
+        existing = await self.get(key)
+        if existing is not None:
+            return existing
+        self._set(key, value, ttl_seconds)
+        return None
+
+    async def put(self, key: str, value: str) -> None:
+        self._set(key, value, self.ttl_seconds)
+
+    async def release(self, key: str, value: str) -> None:
+        entry = self._values.get(key)
+        if entry and entry[0] == value:
+            del self._values[key]
+
+    def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        now = time.monotonic()
+        # Drop expired entries opportunistically to keep the map bounded by TTL
+        expired = [k for k, (_, expires_at) in self._values.items() if now > expires_at]
+        for k in expired:
+            del self._values[k]
+        self._values[key] = (value, now + ttl_seconds)
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """Idempotency keys in Redis with native TTLs, shared by every process."""
+
+    @property
+    def redis(self) -> Any:
+        return get_redis()
+
+    def _key(self, key: str) -> str:
+        return f"{KEY_PREFIX}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        return await self.redis.get(self._key(key))
+
+    async def claim(self, key: str, value: str, ttl_seconds: int) -> str | None:
+        # SET NX GET (Redis 7+) stores only if absent and returns any existing value
+        return await self.redis.set(self._key(key), value, ex=ttl_seconds, nx=True, get=True)
+
+    async def put(self, key: str, value: str) -> None:
+        await self.redis.set(self._key(key), value, ex=self.ttl_seconds)
+
+    async def release(self, key: str, value: str) -> None:
+        await self.redis.eval(_RELEASE_SCRIPT, 1, self._key(key), value)
+
+
+@lru_cache
+def get_idempotency_store() -> IdempotencyStore:
+    """Get the process-wide idempotency store for the configured job backend"""
+    if settings.job_backend == "redis":
+        return RedisIdempotencyStore(ttl_seconds=settings.idempotency_key_ttl_seconds)
+    return InProcessIdempotencyStore(ttl_seconds=settings.idempotency_key_ttl_seconds)
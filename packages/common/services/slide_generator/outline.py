@@ -0,0 +1,87 @@
+"""
+Outline mode helpers
+Selects the part of the input text each outlined slide draws on and builds
+the per-slide prompts used when slides are written concurrently.
+"""
+
+import re
+from typing import Any
+
+PASSAGE_CHARS = 1500  # Target passage size when splitting the input
+MIN_TERM_LENGTH = 3
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9'-]*")
+
+
+def _terms(text: str) -> set[str]:
+    return {word for word in _WORD.findall(text.lower()) if len(word) >= MIN_TERM_LENGTH}
+
+
+def split_passages(text: str, passage_chars: int = PASSAGE_CHARS) -> list[str]:
+    """Split text into passages of roughly passage_chars, on paragraph boundaries."""
+    passages: list[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if current and len(current) + len(paragraph) > passage_chars:
+            passages.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+        # A single oversized paragraph is cut into fixed-size pieces
+        while len(current) > passage_chars * 2:
+            passages.append(current[:passage_chars])
+            current = current[passage_chars:]
+    if current:
+        passages.append(current)
+    return passages
+
+
+def select_context(passages: list[str], entry: dict[str, Any], max_chars: int) -> str:
+    """
+    Pick the passages most relevant to an outline entry.
+
+    Passages are ranked by how many of the entry's title, summary and
+    keyword terms they contain, then returned in document order until
+    max_chars is reached. Falls back to the opening passage if nothing
+    matches.
+    """
+    if not passages:
+        return ""
+
+    query = " ".join(
+        [entry.get("title") or "", entry.get("summary") or "", *entry.get("keywords", [])]
+    )
+    query_terms = _terms(query)
+    scores = [len(query_terms & _terms(passage)) for passage in passages]
+
+    ranked = sorted(
+        (i for i, score in enumerate(scores) if score > 0),
+        key=lambda i: scores[i],
+        reverse=True,
+    )
+    chosen: list[int] = []
+    used = 0
+    for i in ranked:
+        if chosen and used + len(passages[i]) > max_chars:
+            continue
+        chosen.append(i)
+        used += len(passages[i])
+
+    if not chosen:
+        chosen = [0]
+    return "\n\n".join(passages[i] for i in sorted(chosen))[:max_chars]
+
+
+def slide_prompt(deck_title: str | None, outline: list[dict[str, Any]], index: int, context: str) -> str:
+    """User message asking for one outlined slide, with the whole outline for continuity."""
+    lines = [f"PRESENTATION: {deck_title or 'Untitled'}", "", "OUTLINE:"]
+    for i, entry in enumerate(outline):
+        marker = "  <-- WRITE THIS SLIDE" if i == index else ""
+        lines.append(
+            f"{i + 1}. [{entry.get('slide_type')}] {entry.get('title')}: "
+            f"{entry.get('summary', '')}{marker}"
+        )
+    lines += ["", "SOURCE MATERIAL FOR THIS SLIDE:", context]
+    return "\n".join(lines)
@@ -0,0 +1,139 @@
+"""
+Single-flight coalescing for slide generation
+Concurrent requests with the same key share one running generation.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+from functools import partial
+from typing import Any, Generic, TypeVar
+
+from packages.common.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class _Broadcast(Generic[T]):
+    """Buffered event fan-out: every subscriber sees all events from the start."""
+
+    def __init__(self) -> None:
+        self.events: list[T] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, event: T) -> None:
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def close(self, error: BaseException | None = None) -> None:
+        async with self._changed:
+            self.done = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[T]:
+        position = 0
+        while True:
+            async with self._changed:
+                while position == len(self.events) and not self.done:
+                    await self._changed.wait()
+                pending = self.events[position:]
+                finished = self.done
+            for event in pending:
+                yield event
+            position += len(pending)
+            if finished and position == len(self.events):
+                if self.error:
+                    raise self.error
+                return
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent work that shares a key.
+
+    do() and stream() run the work once per key in a background task, so
+    that callers, including the first one, can disconnect or be cancelled
+    without stopping it for the others. do() hands the coroutine's result
+    (or exception) to every caller; stream() replays every event to every
+    subscriber.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[Any]] = {}
+        self._streams: dict[str, _Broadcast[Any]] = {}
+        self._stream_tasks: set[asyncio.Task[None]] = set()
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run fn for this key, or wait for the run already in flight."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info(f"Coalescing request onto in-flight generation {key[:16]}")
+        else:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._forget_call, key))
+        return await asyncio.shield(task)
+
+    def _forget_call(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller has gone away
+
+    async def stream(
+        self,
+        key: str,
+        factory: Callable[[], AsyncIterator[T]],
+    ) -> AsyncIterator[T]:
+        """Subscribe to the event stream for this key, starting it if needed."""
+        broadcast = self._streams.get(key)
+        if broadcast is not None:
+            self.coalesced += 1
+            logger.info(f"Coalescing stream onto in-flight generation {key[:16]}")
+        else:
+            broadcast = _Broadcast()
+            self._streams[key] = broadcast
+            task = asyncio.create_task(self._pump(key, broadcast, factory))
+            self._stream_tasks.add(task)
+            task.add_done_callback(self._stream_tasks.discard)
+
+        async for event in broadcast.subscribe():
+            yield event
+
+    async def _pump(
+        self,
+        key: str,
+        broadcast: _Broadcast[T],
+        factory: Callable[[], AsyncIterator[T]],
+    ) -> None:
+        try:
+            async for event in factory():
+                await broadcast.publish(event)
+        except asyncio.CancelledError:
+            # Subscribers would otherwise wait for events forever
+            await broadcast.close(RuntimeError("Generation was cancelled"))
+            raise
+        except Exception as e:
+            await broadcast.close(e)
+        else:
+            await broadcast.close()
+        finally:
+            self._streams.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """In-flight counters for metrics."""
+        return {
+            "in_flight": len(self._calls) + len(self._streams),
+            "coalesced": self.coalesced,
+        }
+
+
+# Singleton instance
+generation_flights = SingleFlight()
@@ -0,0 +1,139 @@
+"""
+Streaming helpers for tool calling
+Rebuilds tool calls from streamed deltas and parses their JSON arguments
+while they are still being written, so slides can be previewed early.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message_tool_call import Function
+
+# How far back parse_partial_json will trim a truncated document looking
+# for a parseable prefix (covers a dangling key name or partial literal).
+MAX_BACKTRACK = 64
+
+
+def _close_partial_json(text: str) -> str:
+    """Terminate open strings, arrays and objects of a truncated JSON document."""
+    stack: list[str] = []
+    in_string = False
+    escaped = False
+
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack:
+            stack.pop()
+
+    if escaped:
+        text = text[:-1]
+    if in_string:
+        text += '"'
+
+    text = text.rstrip()
+    if text.endswith(","):
+        text = text[:-1]
+
+    return text + "".join(reversed(stack))
+
+
+def parse_partial_json(text: str) -> dict[str, Any] | None:
+    """
+    Best-effort parse of an incomplete JSON object.
+
+    Returns the largest parseable prefix as a dict, or None if nothing
+    usable has been written yet.
+    """
+    text = text.strip()
+    if not text.startswith("{"):
+        return None
+
+    for end in range(len(text), max(len(text) - MAX_BACKTRACK, 0), -1):
+        try:
+            value = json.loads(_close_partial_json(text[:end]))
+        except ValueError:
+            continue
+        return value if isinstance(value, dict) else None
+
+    return None
+
+
+@dataclass
+class _PendingToolCall:
+    """A tool call being assembled from stream deltas."""
+
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+
+
+@dataclass
+class ToolCallAccumulator:
+    """Collects streamed chunks into assistant content and complete tool calls."""
+
+    content: str = ""
+    usage: Any = None
+    _calls: dict[int, _PendingToolCall] = field(default_factory=dict)
+
+    def add(self, chunk: ChatCompletionChunk) -> list[int]:
+        """
+        Merge a chunk into the accumulated message.
+
+        Returns the indexes of tool calls whose arguments changed.
+        """
+        if chunk.usage:
+            self.usage = chunk.usage
+        if not chunk.choices:
+            return []
+
+        delta = chunk.choices[0].delta
+        if delta.content:
+            self.content += delta.content
+
+        changed: list[int] = []
+        for tc in delta.tool_calls or []:
+            pending = self._calls.setdefault(tc.index, _PendingToolCall())
+            if tc.id:
+                pending.id = tc.id
+            if tc.function:
+                if tc.function.name:
+                    pending.name += tc.function.name
+                if tc.function.arguments:
+                    pending.arguments += tc.function.arguments
+                    changed.append(tc.index)
+        return changed
+
+    def name(self, index: int) -> str:
+        """Name of the tool call at the given stream index."""
+        return self._calls[index].name
+
+    def partial_arguments(self, index: int) -> dict[str, Any] | None:
+        """Arguments parsed so far for the tool call at the given stream index."""
+        return parse_partial_json(self._calls[index].arguments)
+
+    def position(self, index: int, name: str) -> int:
+        """How many calls to the same tool precede this one in the message."""
+        return sum(1 for i, c in self._calls.items() if i < index and c.name == name)
+
+    def tool_calls(self) -> list[ChatCompletionMessageToolCall]:
+        """Completed tool calls in stream order."""
+        return [
+            ChatCompletionMessageToolCall(
+                id=pending.id,
+                type="function",
+                function=Function(name=pending.name, arguments=pending.arguments or "{}"),
+            )
+            for _, pending in sorted(self._calls.items())
+        ]
@@ -257,3 +257,100 @@ RULES:
 6. After creating all slides, call finish_presentation with the presentation title
 
 Create slides now based on the user's text. Remember: Data-driven presentations with charts are more persuasive!"""
+
+
+# Parameters of the add_slide tool, reused for single-shot deck generation
+ADD_SLIDE_PARAMETERS = next(
+    tool["function"]["parameters"]
+    for tool in SLIDE_TOOLS
+    if tool["function"]["name"] == "add_slide"
+)
+
+SLIDE_TYPES = ADD_SLIDE_PARAMETERS["properties"]["slide_type"]["enum"]
+
+# Whole-deck structured output: one response holds every add_slide call's arguments
+DECK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {
+            "type": "string",
+            "description": "The presentation title",
+        },
+        "slides": {
+            "type": "array",
+            "items": ADD_SLIDE_PARAMETERS,
+            "description": "Every slide in presentation order",
+        },
+    },
+    "required": ["title", "slides"],
+}
+
+
+DECK_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + """
+
+OUTPUT FORMAT (overrides the tool instructions above):
+Do not call tools. Return the entire presentation as ONE JSON object with:
+- "title": the presentation title
+- "slides": an array of exactly {slide_count} slide objects in order, each using the same fields as add_slide"""
+)
+
+
+# Outline mode: a short outline call, then one structured call per slide
+OUTLINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {
+            "type": "string",
+            "description": "The presentation title",
+        },
+        "slides": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "slide_type": {"type": "string", "enum": SLIDE_TYPES},
+                    "title": {"type": "string"},
+                    "summary": {
+                        "type": "string",
+                        "description": "One sentence on what the slide covers",
+                    },
+                    "keywords": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "2-5 terms from the source text this slide draws on",
+                    },
+                },
+                "required": ["slide_type", "title", "summary", "keywords"],
+            },
+            "description": "Every slide in presentation order",
+        },
+    },
+    "required": ["title", "slides"],
+}
+
+
+OUTLINE_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + """
+
+OUTPUT FORMAT (overrides the tool instructions above):
+Do not call tools and do not write slide content yet. Return an OUTLINE as ONE JSON object with:
+- "title": the presentation title
+- "slides": an array of exactly {slide_count} entries in order, each with slide_type, title,
+  a one-sentence "summary" of what the slide covers, and 2-5 "keywords" copied from the
+  user's text that locate the material the slide draws on"""
+)
+
+
+SLIDE_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + """
+
+OUTPUT FORMAT (overrides the tool instructions above):
+Do not call tools. You are writing ONE slide of a presentation that has already been outlined.
+The user message contains the outline, with the slide to write marked, and the source
+material for it. Return ONE JSON object with the add_slide fields for that slide only.
+Keep the outlined slide_type and title unless they clearly don't fit the material."""
+)
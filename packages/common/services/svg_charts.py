@@ -0,0 +1,257 @@
+"""
+SVG chart renderer
+Writes the six chart types as inline SVG for the PDF export, so charts stay
+vector and no plotting library is loaded. Styling mirrors the matplotlib
+charts: theme colors, outlined marks and value labels.
+"""
+
+import math
+import re
+from html import escape
+from typing import Any
+
+WIDTH = 1000
+HEIGHT = 500
+FONT = "Inter, -apple-system, sans-serif"
+
+# Used for pie/donut slices when the data does not give distinct colors
+SLICE_PALETTE = [
+    "#fbb4ae", "#b3cde3", "#ccebc5", "#decbe4", "#fed9a6",
+    "#ffffcc", "#e5d8bd", "#fddaec", "#f2f2f2",
+]
+
+# Colors that may be written into an attribute: hex, or a named color
+_COLOR = re.compile(r"#[0-9a-fA-F]{3,8}|[a-zA-Z]{1,32}")
+
+
+def render_svg_chart(chart_type: str, chart_data: list[dict[str, Any]], theme_colors: dict) -> str:
+    """
+    Render a chart as an SVG element string.
+
+    Args:
+        chart_type: One of bar, horizontal_bar, line, area, pie, donut
+        chart_data: Points with label, value and optional color
+        theme_colors: background, accent and text colors
+
+    Returns:
+        SVG markup sized by its viewBox, ready to inline in HTML
+    """
+    labels = [str(point.get("label", "")) for point in chart_data]
+    values = [_number(point.get("value", 0)) for point in chart_data]
+    colors = {
+        "background": _color(theme_colors.get("background"), "#f4f4f0"),
+        "accent": _color(theme_colors.get("accent"), "#ff90e8"),
+        "text": _color(theme_colors.get("text"), "#0f0f0f"),
+    }
+    fills = [_color(point.get("color"), colors["accent"]) for point in chart_data]
+
+    if chart_type in ("pie", "donut"):
+        body = _pie(labels, values, fills, colors, donut=chart_type == "donut")
+    elif chart_type == "horizontal_bar":
+        body = _horizontal_bar(labels, values, fills, colors)
+    elif chart_type in ("line", "area"):
+        body = _line(labels, values, colors, area=chart_type == "area")
+    else:
+        body = _bar(labels, values, fills, colors)
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'class="chart-image" font-family="{FONT}">'
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="{colors["background"]}"/>'
+        f"{body}</svg>"
+    )
+
+
+def _number(value: Any) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return number if math.isfinite(number) else 0.0
+
+
+def _color(value: Any, fallback: str) -> str:
+    """A color safe to write into an SVG attribute, or fallback."""
+    if isinstance(value, str) and _COLOR.fullmatch(value.strip()):
+        return value.strip()
+    return fallback
+
+
+def _label(value: float) -> str:
+    return str(int(value)) if value == int(value) else f"{value:g}"
+
+
+def _text(x: float, y: float, content: str, color: str, size: int = 14, anchor: str = "middle", baseline: str = "auto") -> str:
+    return (
+        f'<text x="{x:.1f}" y="{y:.1f}" fill="{color}" font-size="{size}" '
+        f'text-anchor="{anchor}" dominant-baseline="{baseline}">{escape(content)}</text>'
+    )
+
+
+def _ticks(low: float, high: float, count: int = 5) -> list[float]:
+    """Evenly spaced round tick values covering [low, high]."""
+    span = high - low or 1.0
+    raw_step = span / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    start = math.floor(low / step) * step
+    ticks = []
+    value = start
+    while value <= high + step * 0.999:
+        ticks.append(round(value, 10))
+        value += step
+    return ticks
+
+
+def _axes(x0: float, y0: float, x1: float, y1: float, color: str) -> str:
+    """Left and bottom spines."""
+    return (
+        f'<path d="M{x0:.1f},{y0:.1f} V{y1:.1f} H{x1:.1f}" fill="none" '
+        f'stroke="{color}" stroke-width="1.5"/>'
+    )
+
+
+def _value_axis(ticks: list[float], scale, x: float, color: str, vertical: bool = True) -> str:
+    parts = []
+    for tick in ticks:
+        pos = scale(tick)
+        if vertical:
+            parts.append(f'<line x1="{x - 6:.1f}" y1="{pos:.1f}" x2="{x:.1f}" y2="{pos:.1f}" stroke="{color}"/>')
+            parts.append(_text(x - 10, pos, _label(tick), color, anchor="end", baseline="middle"))
+        else:
+            parts.append(f'<line x1="{pos:.1f}" y1="{x:.1f}" x2="{pos:.1f}" y2="{x + 6:.1f}" stroke="{color}"/>')
+            parts.append(_text(pos, x + 24, _label(tick), color))
+    return "".join(parts)
+
+
+def _bar(labels: list[str], values: list[float], fills: list[str], colors: dict) -> str:
+    left, right, top, bottom = 80, WIDTH - 30, 40, HEIGHT - 60
+    ticks = _ticks(min(0.0, *values), max(0.0, *values))
+    low, high = ticks[0], ticks[-1]
+
+    def y(value: float) -> float:
+        return bottom - (value - low) / (high - low or 1) * (bottom - top)
+
+    slot = (right - left) / max(len(values), 1)
+    parts = [_value_axis(ticks, y, left, colors["text"])]
+    for i, (label, value, fill) in enumerate(zip(labels, values, fills, strict=True)):
+        x = left + slot * i + slot * 0.1
+        top_y, base_y = sorted((y(value), y(0)))
+        parts.append(
+            f'<rect x="{x:.1f}" y="{top_y:.1f}" width="{slot * 0.8:.1f}" height="{base_y - top_y:.1f}" '
+            f'fill="{fill}" stroke="{colors["text"]}" stroke-width="1.5"/>'
+        )
+        label_y = y(value) - 6 if value >= 0 else y(value) + 18
+        parts.append(_text(x + slot * 0.4, label_y, _label(value), colors["text"]))
+        parts.append(_text(x + slot * 0.4, bottom + 24, label, colors["text"]))
+    parts.append(_axes(left, top, right, bottom, colors["text"]))
+    return "".join(parts)
+
+
+def _horizontal_bar(labels: list[str], values: list[float], fills: list[str], colors: dict) -> str:
+    left, right, top, bottom = 180, WIDTH - 60, 20, HEIGHT - 50
+    ticks = _ticks(min(0.0, *values), max(0.0, *values))
+    low, high = ticks[0], ticks[-1]
+
+    def x(value: float) -> float:
+        return left + (value - low) / (high - low or 1) * (right - left)
+
+    slot = (bottom - top) / max(len(values), 1)
+    parts = [_value_axis(ticks, x, bottom, colors["text"], vertical=False)]
+    # First item at the bottom, as matplotlib's barh draws it
+    for i, (label, value, fill) in enumerate(zip(labels, values, fills, strict=True)):
+        y = bottom - slot * (i + 1) + slot * 0.1
+        start_x, end_x = sorted((x(0), x(value)))
+        parts.append(
+            f'<rect x="{start_x:.1f}" y="{y:.1f}" width="{end_x - start_x:.1f}" height="{slot * 0.8:.1f}" '
+            f'fill="{fill}" stroke="{colors["text"]}" stroke-width="1.5"/>'
+        )
+        if value >= 0:
+            parts.append(_text(end_x + 6, y + slot * 0.4, _label(value), colors["text"], anchor="start", baseline="middle"))
+        else:
+            parts.append(_text(start_x - 6, y + slot * 0.4, _label(value), colors["text"], anchor="end", baseline="middle"))
+        parts.append(_text(left - 10, y + slot * 0.4, label, colors["text"], anchor="end", baseline="middle"))
+    parts.append(_axes(left, top, right, bottom, colors["text"]))
+    return "".join(parts)
+
+
+def _line(labels: list[str], values: list[float], colors: dict, area: bool) -> str:
+    left, right, top, bottom = 80, WIDTH - 40, 40, HEIGHT - 60
+    ticks = _ticks(min(0.0, *values) if area else min(values), max(values))
+    low, high = ticks[0], ticks[-1]
+
+    def y(value: float) -> float:
+        return bottom - (value - low) / (high - low or 1) * (bottom - top)
+
+    step = (right - left) / max(len(values) - 1, 1)
+    points = [(left + step * i, y(value)) for i, value in enumerate(values)]
+    path = " ".join(f"{px:.1f},{py:.1f}" for px, py in points)
+
+    parts = [_value_axis(ticks, y, left, colors["text"])]
+    if area and points:
+        base = y(max(low, 0.0))
+        parts.append(
+            f'<polygon points="{points[0][0]:.1f},{base:.1f} {path} {points[-1][0]:.1f},{base:.1f}" '
+            f'fill="{colors["accent"]}" fill-opacity="0.6" stroke="{colors["text"]}" stroke-width="2"/>'
+        )
+    parts.append(
+        f'<polyline points="{path}" fill="none" stroke="{colors["accent"]}" '
+        f'stroke-width="{2 if area else 3}" stroke-linejoin="round"/>'
+    )
+    radius = 4 if area else 7
+    marker_fill = colors["accent"] if area else colors["background"]
+    for (px, py), label, value in zip(points, labels, values, strict=True):
+        parts.append(
+            f'<circle cx="{px:.1f}" cy="{py:.1f}" r="{radius}" fill="{marker_fill}" '
+            f'stroke="{colors["accent"]}" stroke-width="2"/>'
+        )
+        if not area:
+            parts.append(_text(px, py - 14, _label(value), colors["text"]))
+        parts.append(_text(px, bottom + 24, label, colors["text"]))
+    parts.append(_axes(left, top, right, bottom, colors["text"]))
+    return "".join(parts)
+
+
+def _pie(labels: list[str], values: list[float], fills: list[str], colors: dict, donut: bool) -> str:
+    cx, cy, radius = WIDTH / 2, HEIGHT / 2, HEIGHT * 0.38
+    values = [max(value, 0.0) for value in values]
+    total = sum(values) or 1.0
+    if len(set(fills)) <= 1:
+        fills = [SLICE_PALETTE[i % len(SLICE_PALETTE)] for i in range(len(values))]
+
+    parts = []
+    angle = -math.pi / 2  # Start at 12 o'clock, clockwise
+    for label, value, fill in zip(labels, values, fills, strict=True):
+        sweep = value / total * 2 * math.pi
+        end = angle + sweep
+        if sweep >= 2 * math.pi - 1e-9:
+            parts.append(
+                f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{radius:.1f}" fill="{fill}" '
+                f'stroke="{colors["text"]}" stroke-width="2"/>'
+            )
+        elif sweep > 0:
+            x0, y0 = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+            x1, y1 = cx + radius * math.cos(end), cy + radius * math.sin(end)
+            large = 1 if sweep > math.pi else 0
+            parts.append(
+                f'<path d="M{cx:.1f},{cy:.1f} L{x0:.1f},{y0:.1f} '
+                f'A{radius:.1f},{radius:.1f} 0 {large} 1 {x1:.1f},{y1:.1f} Z" '
+                f'fill="{fill}" stroke="{colors["text"]}" stroke-width="2" stroke-linejoin="round"/>'
+            )
+
+        if sweep > 0:
+            middle = angle + sweep / 2
+            cos, sin = math.cos(middle), math.sin(middle)
+            inner = radius * (0.75 if donut else 0.6)
+            parts.append(_text(cx + inner * cos, cy + inner * sin, f"{value / total:.1%}", colors["text"], size=13, baseline="middle"))
+            anchor = "start" if cos > 0.1 else "end" if cos < -0.1 else "middle"
+            outer = radius * 1.1
+            parts.append(_text(cx + outer * cos, cy + outer * sin, label, colors["text"], size=15, anchor=anchor, baseline="middle"))
+        angle = end
+
+    if donut:
+        parts.append(
+            f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{radius * 0.5:.1f}" fill="{colors["background"]}" '
+            f'stroke="{colors["text"]}" stroke-width="2"/>'
+        )
+    return "".join(parts)
@@ -0,0 +1,114 @@
+"""
+Benchmark export image normalization: output size and time, before/after.
+
+Serves synthetic photo-sized JPEGs (like Unsplash `regular` images) from a
+local HTTP server, or uses the URLs given with --url, and exports a deck
+that shows them as PPTX (and PDF when WeasyPrint is installed), first with
+the original images and then with images normalized for their display
+size. Each run uses an empty image cache.
+
+Usage:
+    poetry run python scripts/benchmark_export_images.py [--images 8] [--url URL ...]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageFilter
+
+from packages.common.core.config import settings
+from packages.common.services.export_cache import DiskLRU
+from packages.common.services.export_service import generate_pdf
+from packages.common.services.image_cache import image_cache
+from packages.common.services.pptx_export_service import generate_pptx
+from packages.common.services.render_pool import PresentationSnapshot
+from tests.fixtures import make_deck, make_slide
+
+
+def synthetic_photo(seed: int, size: tuple[int, int] = (1920, 1280)) -> bytes:
+    """A noisy, blurred image that compresses like a photograph."""
+    image = Image.effect_noise(size, 60 + seed).convert("RGB").filter(ImageFilter.GaussianBlur(2))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def serve_images(count: int) -> tuple[ThreadingHTTPServer, list[str]]:
+    photos = [synthetic_photo(i) for i in range(count)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = photos[int(self.path.strip("/").split(".")[0])]
+            self.send_response(200)
+            self.send_header("Content-Type", "image/jpeg")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/{i}.jpg" for i in range(count)]
+    return server, urls
+
+
+def benchmark_deck(urls: list[str]) -> PresentationSnapshot:
+    slides = [
+        make_slide(i, type="content", title=f"Slide {i + 1}", body="Body text next to an image.", image_url=url)
+        for i, url in enumerate(urls)
+    ]
+    return make_deck(slides, title="Image benchmark")
+
+
+def run(label: str, render, deck: PresentationSnapshot, normalize: bool) -> None:
+    settings.export_image_normalize = normalize
+    image_cache.files = DiskLRU(tempfile.mkdtemp(), settings.image_cache_max_bytes, settings.image_cache_ttl_seconds)
+
+    start = time.perf_counter()
+    output = render(deck)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render(deck)
+    warm = time.perf_counter() - start
+
+    print(f"{label:>22}: {len(output) / 1024:9.1f} KB   cold {cold * 1000:7.0f} ms   cached {warm * 1000:7.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=8)
+    parser.add_argument("--url", action="append", help="Use real image URLs instead")
+    args = parser.parse_args()
+
+    urls = args.url
+    if not urls:
+        _, urls = serve_images(args.images)
+    deck = benchmark_deck(urls)
+    print(f"{len(urls)} images, {settings.export_image_dpi} dpi, quality {settings.export_image_quality}\n")
+
+    run("pptx original", generate_pptx, deck, normalize=False)
+    run("pptx normalized", generate_pptx, deck, normalize=True)
+
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        print("\nWeasyPrint not available: PDF runs skipped")
+        return
+    run("pdf original", generate_pdf, deck, normalize=False)
+    run("pdf normalized", generate_pdf, deck, normalize=True)
+
+
+if __name__ == "__main__":
+    main()
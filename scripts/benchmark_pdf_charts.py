@@ -0,0 +1,96 @@
+"""
+Benchmark PDF chart rendering: inline SVG vs matplotlib PNG.
+
+Renders a deck of chart slides (every chart type) with both renderers and
+reports chart render time, HTML size and, when WeasyPrint is installed,
+PDF render time and size. The chart cache is disabled so every matplotlib
+chart is actually drawn.
+
+Usage:
+    poetry run python scripts/benchmark_pdf_charts.py [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from packages.common.core.config import settings
+from packages.common.services import export_service
+from packages.common.services.chart_cache import chart_cache
+from packages.common.services.render_pool import PresentationSnapshot
+from tests.fixtures import make_deck, make_slide
+
+CHART_TYPES = ["bar", "horizontal_bar", "line", "area", "pie", "donut"]
+
+
+def benchmark_deck(charts_per_type: int) -> PresentationSnapshot:
+    slides = []
+    for i in range(charts_per_type * len(CHART_TYPES)):
+        chart_type = CHART_TYPES[i % len(CHART_TYPES)]
+        slides.append(
+            make_slide(
+                i,
+                type="chart",
+                title=f"{chart_type} chart {i}",
+                chart_type=chart_type,
+                chart_data=[
+                    {"label": f"Q{q + 1} {2020 + i}", "value": (q + 1) * 10 + i}
+                    for q in range(6)
+                ],
+            )
+        )
+    return make_deck(slides, title="Chart benchmark")
+
+
+def bench(renderer: str, deck: PresentationSnapshot, repeat: int) -> dict[str, float]:
+    settings.pdf_chart_renderer = renderer
+    html = export_service._generate_slide_html(deck)  # Warm up imports
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        html = export_service._generate_slide_html(deck)
+    result = {
+        "html_seconds": (time.perf_counter() - start) / repeat,
+        "html_kb": len(html.encode()) / 1024,
+    }
+
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError):
+        return result
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pdf = HTML(string=export_service._generate_slide_html(deck)).write_pdf()
+    result["pdf_seconds"] = (time.perf_counter() - start) / repeat
+    result["pdf_kb"] = len(pdf) / 1024
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--charts-per-type", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    chart_cache.enabled = False
+    deck = benchmark_deck(args.charts_per_type)
+    print(f"{len(deck.slides)} chart slides, {args.repeat} runs each\n")
+
+    for renderer in ("matplotlib", "svg"):
+        result = bench(renderer, deck, args.repeat)
+        line = f"{renderer:>10}: html {result['html_seconds'] * 1000:8.1f} ms  {result['html_kb']:8.1f} KB"
+        if "pdf_seconds" in result:
+            line += f"  |  pdf {result['pdf_seconds'] * 1000:8.1f} ms  {result['pdf_kb']:8.1f} KB"
+        print(line)
+
+    if "pdf_seconds" not in result:
+        print("\nWeasyPrint not available: PDF timings skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark PDF export after a single-slide edit, with and without the page cache.
+
+Exports a deck of mixed slides (titles, bullets, quotes, charts) once to
+warm the caches, edits one slide the way update_slide does, and times the
+next export: a full WeasyPrint layout of the deck versus re-rendering only
+the edited page and merging it with the cached ones. Requires WeasyPrint.
+
+Usage:
+    poetry run python scripts/benchmark_pdf_slide_cache.py [--slides 15] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from packages.common.core.config import settings
+from packages.common.services import export_service
+from packages.common.services.export_cache import DiskLRU
+from packages.common.services.pdf_page_cache import pdf_page_cache
+from packages.common.services.render_pool import PresentationSnapshot, SlideSnapshot
+from tests.fixtures import make_deck, make_slide
+
+
+def benchmark_slide(i: int) -> SlideSnapshot:
+    fields = {"title": f"Slide {i + 1}"}
+    kind = i % 4
+    if i == 0:
+        fields.update(type="title", subtitle="Quarterly business review")
+    elif kind == 1:
+        fields.update(type="bullets", bullets=[f"Point {n + 1} about topic {i}" for n in range(5)])
+    elif kind == 2:
+        fields.update(type="chart", chart_type="bar", chart_data=[
+            {"label": f"Q{q + 1}", "value": (q + 1) * 10 + i} for q in range(4)
+        ])
+    elif kind == 3:
+        fields.update(type="quote", quote=f"Quote number {i} about the results", attribution="Someone")
+    else:
+        fields.update(type="content", body=f"Body text for slide {i + 1}. " * 6)
+    return make_slide(i, **fields)
+
+
+def export(deck: PresentationSnapshot) -> tuple[float, int]:
+    output = BytesIO()
+    start = time.perf_counter()
+    export_service.write_pdf(deck, output)
+    return time.perf_counter() - start, len(output.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slides", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        print("WeasyPrint not available: nothing to benchmark")
+        return
+
+    pdf_page_cache.files = DiskLRU(tempfile.mkdtemp(), settings.pdf_page_cache_max_bytes)
+    deck = make_deck((benchmark_slide(i) for i in range(args.slides)), title="Slide cache benchmark")
+    print(f"{args.slides} slides, {args.repeat} edits each\n")
+
+    for label, enabled in (("full layout", False), ("page cache", True)):
+        pdf_page_cache.enabled = enabled
+        cold, _ = export(deck)  # Also warms imports, chart cache and page cache
+
+        times = []
+        for n in range(args.repeat):
+            edited = list(deck.slides)
+            target = edited[len(edited) // 2]
+            edited[len(edited) // 2] = replace(target, title=f"{target.title} (edit {label} {n})")
+            seconds, size = export(replace(deck, slides=edited))
+            times.append(seconds)
+
+        print(
+            f"{label:>12}: first export {cold * 1000:7.0f} ms   "
+            f"after one-slide edit {min(times) * 1000:7.0f} ms   {size / 1024:7.1f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark PPTX export throughput: python-pptx vs the direct OOXML writer.
+
+Writes the same chart-free deck (titles, bullets, content, quotes,
+sections, and a few slides with images) repeatedly with each writer and
+reports time per export and exports per second. Images come from
+in-memory fixtures, so only the writers are measured.
+
+Usage:
+    poetry run python scripts/benchmark_pptx_writer.py [--slides 20] [--repeat 50]
+"""
+
+import argparse
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from packages.common.core.config import settings
+from packages.common.services import pptx_export_service
+from packages.common.services.render_pool import PresentationSnapshot
+from tests.fixtures import make_deck, make_slide
+
+
+def fixture_images(count: int) -> dict[str, bytes]:
+    images = {}
+    for i in range(count):
+        buffer = BytesIO()
+        Image.effect_noise((825, 750), 40 + i).convert("RGB").save(buffer, format="JPEG", quality=80)
+        images[f"https://img.test/{i}.jpg"] = buffer.getvalue()
+    return images
+
+
+def benchmark_deck(slide_count: int, image_urls: list[str]) -> PresentationSnapshot:
+    slides = []
+    for i in range(slide_count):
+        fields = {"title": f"Slide {i + 1}"}
+        kind = i % 5
+        if i == 0:
+            fields.update(type="title", subtitle="Throughput benchmark")
+        elif kind == 1:
+            fields.update(type="bullets", bullets=[f"Point {n + 1} & detail <{i}>" for n in range(5)])
+        elif kind == 2:
+            fields.update(type="quote", quote="A quote worth repeating.", attribution="Someone")
+        elif kind == 3:
+            fields.update(type="section")
+        else:
+            fields.update(type="content", body=f"Body text for slide {i + 1}. " * 8)
+        if fields["type"] in ("bullets", "content") and i // 5 < len(image_urls):
+            fields["image_url"] = image_urls[i // 5]
+        slides.append(make_slide(i, **fields))
+    return make_deck(slides, title="PPTX benchmark")
+
+
+def bench(deck: PresentationSnapshot, repeat: int, fast: bool) -> tuple[float, int]:
+    settings.pptx_fast_writer_enabled = fast
+    pptx_export_service.generate_pptx(deck)  # Warm up (the fast writer loads its skeleton once)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        output = pptx_export_service.generate_pptx(deck)
+    return (time.perf_counter() - start) / repeat, len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--images", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    images = fixture_images(args.images)
+    pptx_export_service.fetch_export_images = lambda urls, width, height: {
+        url: images[url] for url in urls if url in images
+    }
+    deck = benchmark_deck(args.slides, list(images))
+    print(f"{args.slides} slides, {args.images} images, {args.repeat} exports each\n")
+
+    results = {}
+    for label, fast in (("python-pptx", False), ("ooxml", True)):
+        seconds, size = bench(deck, args.repeat, fast)
+        results[label] = seconds
+        print(f"{label:>12}: {seconds * 1000:7.1f} ms/export  {1 / seconds:7.1f} exports/s  {size / 1024:7.1f} KB")
+
+    print(f"\nspeedup: {results['python-pptx'] / results['ooxml']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,7 @@ async def main():
         # Create admin key with all permissions
         data = APIKeyCreate(
             name="Admin Key",
-            scopes="*,admin:keys",  # Full access + key management
+            scopes="*,admin:keys,admin:metrics",  # Full access + key management + /metrics
         )
 
         result = await api_key_service.create_key(db, data, is_test=False)
@@ -0,0 +1,22 @@
+"""
+Deck fixtures
+Builds presentation snapshots for the export renderers without a database.
+Shared by the tests and the benchmark scripts.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from packages.common.services.render_pool import PresentationSnapshot, SlideSnapshot
+
+SLIDE_DEFAULTS = dict.fromkeys(SlideSnapshot.__dataclass_fields__)
+
+
+def make_slide(order: int, **fields: Any) -> SlideSnapshot:
+    """A slide at the given position with every field not given left empty."""
+    return SlideSnapshot(**{**SLIDE_DEFAULTS, "id": order, "order": order, "layout": "default", **fields})
+
+
+def make_deck(slides: Iterable[SlideSnapshot], title: str = "Test deck", theme: str = "neobrutalism") -> PresentationSnapshot:
+    """A presentation snapshot of the given slides."""
+    return PresentationSnapshot(id=1, title=title, theme=theme, slides=list(slides))
@@ -0,0 +1,98 @@
+"""
+DiskLRU: atomic writes, LRU eviction by size and TTL expiry.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from packages.common.services.export_cache import DiskLRU
+
+
+def names(lru: DiskLRU) -> list[str]:
+    return sorted(path.name for path in lru.root.glob("*/*") if not path.name.startswith("."))
+
+
+def age(lru: DiskLRU, name: str, seconds: float) -> None:
+    """Backdate a file's atime and mtime."""
+    stamp = time.time() - seconds
+    os.utime(lru.path(name), (stamp, stamp))
+
+
+def test_round_trip_and_missing(tmp_path: Path) -> None:
+    lru = DiskLRU(str(tmp_path), max_bytes=1000)
+    lru.write("ab/key", b"data")
+
+    assert lru.read("ab/key") == b"data"
+    assert lru.exists("ab/key")
+    assert lru.read("ab/other") is None
+    assert not lru.exists("ab/other")
+    assert not list(tmp_path.glob("*/.*.tmp"))
+
+
+def test_least_recently_used_files_are_evicted(tmp_path: Path) -> None:
+    lru = DiskLRU(str(tmp_path), max_bytes=30)
+    for n, seconds in enumerate((300, 200, 100)):
+        lru.write(f"ab/{n}", b"x" * 10)
+        age(lru, f"ab/{n}", seconds)
+    lru.read("ab/0")  # Now the most recently used
+
+    lru.write("ab/3", b"x" * 10)
+
+    assert names(lru) == ["0", "2", "3"]
+
+
+def test_writes_from_other_processes_count_toward_the_limit(tmp_path: Path) -> None:
+    # Two instances on one directory stand in for two processes
+    first = DiskLRU(str(tmp_path), max_bytes=100)
+    second = DiskLRU(str(tmp_path), max_bytes=100)
+    first.write("ab/seed", b"x")
+    second.write("ab/seed", b"x")
+
+    for n in range(20):
+        writer = first if n % 2 else second
+        writer.write(f"ab/{n}", b"x" * 10)
+        age(writer, f"ab/{n}", 100 - n)
+
+    total = sum(path.stat().st_size for path in tmp_path.glob("*/*"))
+    assert total <= 100 + 2 * 10  # One rescan interval of slack per process
+    assert "19" in names(first)
+
+
+def test_link_hands_out_a_copy_that_survives_removal(tmp_path: Path) -> None:
+    lru = DiskLRU(str(tmp_path / "cache"), max_bytes=1000)
+    source = tmp_path / "render.pdf"
+    source.write_bytes(b"%PDF")
+    lru.put("1/key.pdf", source)
+
+    dest = tmp_path / "response.pdf"
+    assert lru.link("1/key.pdf", dest)
+    lru.remove("1")
+
+    assert dest.read_bytes() == b"%PDF"
+    assert not lru.exists("1/key.pdf")
+    assert not lru.link("1/key.pdf", tmp_path / "again.pdf")
+
+
+def test_expired_files_are_misses_and_evicted_first(tmp_path: Path) -> None:
+    lru = DiskLRU(str(tmp_path), max_bytes=25, ttl_seconds=60)
+    lru.write("ab/old", b"x" * 10)
+    lru.write("ab/fresh", b"x" * 10)
+    stamp = time.time()
+    os.utime(lru.path("ab/old"), (stamp, stamp - 120))  # Written long ago, used just now
+
+    assert lru.read("ab/old") is None
+    assert not lru.exists("ab/old")
+
+    lru.write("ab/new", b"x" * 10)
+    assert names(lru) == ["fresh", "new"]
+
+
+def test_reads_keep_the_write_time_with_a_ttl(tmp_path: Path) -> None:
+    lru = DiskLRU(str(tmp_path), max_bytes=1000, ttl_seconds=60)
+    lru.write("ab/key", b"data")
+    age(lru, "ab/key", 30)
+    written = lru.path("ab/key").stat().st_mtime
+
+    assert lru.read("ab/key") == b"data"
+    assert lru.path("ab/key").stat().st_mtime == written
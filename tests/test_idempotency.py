@@ -0,0 +1,43 @@
+"""
+Idempotency key store: the first claim wins, later claims see its value.
+"""
+
+import asyncio
+
+from packages.common.services.slide_generator.idempotency import (
+    PENDING,
+    InProcessIdempotencyStore,
+)
+
+
+async def test_first_claim_wins() -> None:
+    store = InProcessIdempotencyStore(ttl_seconds=60)
+
+    assert await store.claim("key", PENDING, ttl_seconds=60) is None
+    assert await store.claim("key", PENDING, ttl_seconds=60) == PENDING
+
+    await store.put("key", "42")
+    assert await store.claim("key", PENDING, ttl_seconds=60) == "42"
+    assert await store.get("key") == "42"
+
+
+async def test_release_only_drops_the_claimed_value() -> None:
+    store = InProcessIdempotencyStore(ttl_seconds=60)
+    await store.claim("key", PENDING, ttl_seconds=60)
+    await store.put("key", "42")
+
+    await store.release("key", PENDING)  # Overwritten since the claim
+    assert await store.get("key") == "42"
+
+    await store.release("key", "42")
+    assert await store.get("key") is None
+    assert await store.claim("key", PENDING, ttl_seconds=60) is None
+
+
+async def test_claims_expire() -> None:
+    store = InProcessIdempotencyStore(ttl_seconds=60)
+    await store.claim("key", PENDING, ttl_seconds=0.01)
+    await asyncio.sleep(0.02)
+
+    assert await store.get("key") is None
+    assert await store.claim("key", "7", ttl_seconds=60) is None
@@ -0,0 +1,99 @@
+"""
+In-process job queue: the shared worker loop, progress and retry limits.
+"""
+
+import asyncio
+
+import pytest
+
+from packages.common.schemas import GenerateSlidesRequest
+from packages.common.services.jobs import base
+from packages.common.services.jobs.base import MAX_JOB_ATTEMPTS
+from packages.common.services.jobs.memory import InProcessJobQueue
+from packages.common.services.slide_generator.generator import AgentEvent
+
+TEXT = "Quarterly results: revenue grew 20% while churn fell for the third quarter running."
+
+
+class FakeGenerator:
+    """Stands in for SlideGeneratorService, emitting a two-slide generation."""
+
+    runs = 0
+    fail = False
+
+    async def generate_stream(self, **kwargs):
+        FakeGenerator.runs += 1
+        yield AgentEvent(type="thinking", data={"message": "Thinking"})
+        if FakeGenerator.fail:
+            raise RuntimeError("LLM failed")
+        for n in (1, 2):
+            yield AgentEvent(type="tool_call", data={"tool": "add_slide", "slide_number": n})
+        yield AgentEvent(type="complete", data={"presentation_id": 7, "slide_count": 2})
+
+
+@pytest.fixture(autouse=True)
+def fake_generator(monkeypatch: pytest.MonkeyPatch) -> None:
+    FakeGenerator.runs = 0
+    FakeGenerator.fail = False
+    monkeypatch.setattr(base, "SlideGeneratorService", FakeGenerator)
+
+
+async def wait_for_status(queue: InProcessJobQueue, job_id: str, status: str) -> base.GenerationJob:
+    for _ in range(100):
+        job = await queue.get(job_id)
+        if job is not None and job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {status}")
+
+
+async def test_jobs_run_to_completion_and_record_progress() -> None:
+    queue = InProcessJobQueue(workers=2, ttl_seconds=60)
+    await queue.start()
+    try:
+        job = await queue.submit(GenerateSlidesRequest(text=TEXT, slide_count=5), api_key_id=1)
+        assert job.status == "queued"
+
+        done = await wait_for_status(queue, job.id, "completed")
+        assert done.presentation_id == 7
+        assert done.progress.slides_created == 2
+        assert done.attempts == 1
+        assert await queue.get(job.id, api_key_id=2) is None  # Only visible to its own key
+    finally:
+        await queue.stop()
+
+
+async def test_failed_generations_mark_the_job_failed() -> None:
+    FakeGenerator.fail = True
+    queue = InProcessJobQueue(workers=1, ttl_seconds=60)
+    await queue.start()
+    try:
+        job = await queue.submit(GenerateSlidesRequest(text=TEXT))
+        failed = await wait_for_status(queue, job.id, "failed")
+        assert failed.error == "LLM failed"
+    finally:
+        await queue.stop()
+
+
+async def test_jobs_interrupted_too_often_are_failed_without_running() -> None:
+    queue = InProcessJobQueue(workers=1, ttl_seconds=60)
+    job = await queue.submit(GenerateSlidesRequest(text=TEXT))
+    job.attempts = MAX_JOB_ATTEMPTS  # Picked up and lost by crashed workers
+
+    await queue._run(job)
+
+    assert job.status == "failed"
+    assert FakeGenerator.runs == 0
+
+
+async def test_idempotency_key_returns_the_original_job() -> None:
+    queue = InProcessJobQueue(workers=1, ttl_seconds=60)
+    request = GenerateSlidesRequest(text=TEXT)
+
+    first = await queue.submit(request, api_key_id=1, idempotency_key="retry-me")
+    retry = await queue.submit(request, api_key_id=1, idempotency_key="retry-me")
+    other_key = await queue.submit(request, api_key_id=2, idempotency_key="retry-me")
+
+    assert retry.id == first.id
+    assert other_key.id != first.id
+    assert (await queue.stats())["queued"] == 2
@@ -0,0 +1,98 @@
+"""
+AdaptiveLimiter: FIFO admission under an AIMD concurrency limit.
+"""
+
+import asyncio
+
+import pytest
+
+from packages.common.providers.llm import limiter as limiter_module
+from packages.common.providers.llm.limiter import AdaptiveLimiter
+
+
+def make_limiter(initial: int = 4, min_limit: int = 1, max_limit: int = 8) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        name="test-model",
+        initial=initial,
+        min_limit=min_limit,
+        max_limit=max_limit,
+        latency_target=30.0,
+    )
+
+
+async def test_rate_limit_halves_the_limit_once_per_cooldown() -> None:
+    limiter = make_limiter(initial=8)
+    leases = [await limiter.acquire() for _ in range(4)]
+
+    for lease in leases:  # One burst of 429s from calls in flight together
+        await lease.release(throttled=True)
+
+    assert int(limiter.limit) == 4
+    assert limiter.throttled == 4
+
+
+async def test_limit_recovers_additively_and_stops_at_max(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(limiter_module, "DECREASE_COOLDOWN_SECONDS", 0.0)
+    limiter = make_limiter(initial=4, max_limit=5)
+
+    await (await limiter.acquire()).release(throttled=True)
+    assert int(limiter.limit) == 2
+
+    for _ in range(2):  # Each fast call adds 1 / limit
+        await (await limiter.acquire()).release()
+    assert limiter.limit == pytest.approx(2.9)
+    await (await limiter.acquire()).release()
+    assert int(limiter.limit) == 3
+
+    for _ in range(50):
+        await (await limiter.acquire()).release()
+    assert limiter.limit == 5
+
+
+async def test_slow_calls_decrease_and_the_limit_stays_above_min(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(limiter_module, "DECREASE_COOLDOWN_SECONDS", 0.0)
+    limiter = make_limiter(initial=4, min_limit=1)
+    limiter.latency_target = 0.0
+
+    for _ in range(5):
+        lease = await limiter.acquire()
+        await asyncio.sleep(0.001)
+        await lease.release()
+
+    assert limiter.limit == 1
+
+
+async def test_waiters_are_admitted_in_order() -> None:
+    limiter = make_limiter(initial=1)
+    held = await limiter.acquire()
+    order = []
+
+    async def call(n: int) -> None:
+        lease = await limiter.acquire()
+        order.append(n)
+        await lease.release()
+
+    waiters = [asyncio.create_task(call(n)) for n in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.stats()["queue_depth"] == 3
+
+    await held.release()
+    await asyncio.gather(*waiters)
+    assert order == [0, 1, 2]
+    assert limiter.stats()["in_flight"] == 0
+
+
+async def test_cancelled_waiter_gives_up_its_place() -> None:
+    limiter = make_limiter(initial=1)
+    held = await limiter.acquire()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    await held.release()
+    lease = await asyncio.wait_for(limiter.acquire(), timeout=1)
+    await lease.release()
+    assert limiter.stats()["in_flight"] == 0
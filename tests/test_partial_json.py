@@ -0,0 +1,48 @@
+"""
+Partial JSON parsing of tool-call arguments that are still streaming in.
+"""
+
+import json
+
+import pytest
+
+from packages.common.services.slide_generator.streaming import parse_partial_json
+
+ARGUMENTS = json.dumps(
+    {
+        "slide_type": "bullets",
+        "title": 'Growth "so far"',
+        "bullets": ["Revenue up 20%", "Churn down\nagain"],
+        "layout": "center",
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"title": "Quar', {"title": "Quar"}),
+        ('{"title": "Q1", "bul', {"title": "Q1"}),
+        ('{"title": "Q1", "bullets": ["One", "Tw', {"title": "Q1", "bullets": ["One", "Tw"]}),
+        ('{"title": "Q1",', {"title": "Q1"}),
+        ('{"title": "a \\"quote', {"title": 'a "quote'}),
+        ('{"title": "trailing \\', {"title": "trailing "}),
+        ('{"count": 1', {"count": 1}),
+    ],
+)
+def test_truncated_arguments_parse_to_their_complete_prefix(text: str, expected: dict) -> None:
+    assert parse_partial_json(text) == expected
+
+
+def test_every_prefix_of_a_document_parses_to_a_subset() -> None:
+    complete = json.loads(ARGUMENTS)
+    for end in range(1, len(ARGUMENTS) + 1):
+        partial = parse_partial_json(ARGUMENTS[:end])
+        assert partial is not None
+        assert set(partial) <= set(complete)
+    assert parse_partial_json(ARGUMENTS) == complete
+
+
+@pytest.mark.parametrize("text", ["", "   ", "[1, 2", '"title"', "not json"])
+def test_non_objects_are_ignored(text: str) -> None:
+    assert parse_partial_json(text) is None
@@ -0,0 +1,134 @@
+"""
+SingleFlight runs concurrent work sharing a key once, detached from its callers.
+"""
+
+import asyncio
+
+import pytest
+
+from packages.common.services.slide_generator.singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_run() -> None:
+    flights = SingleFlight()
+    runs = 0
+    release = asyncio.Event()
+
+    async def work() -> str:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return "deck"
+
+    callers = [asyncio.create_task(flights.do("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == ["deck", "deck", "deck"]
+    assert runs == 1
+    assert flights.coalesced == 2
+    assert flights.stats()["in_flight"] == 0
+
+
+async def test_cancelled_leader_does_not_stop_the_run() -> None:
+    flights = SingleFlight()
+    runs = 0
+    release = asyncio.Event()
+
+    async def work() -> str:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return "deck"
+
+    leader = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert await follower == "deck"
+    assert runs == 1
+
+
+async def test_errors_reach_every_caller_and_are_not_cached() -> None:
+    flights = SingleFlight()
+    runs = 0
+
+    async def failing() -> str:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0)
+        raise ValueError("LLM failed")
+
+    callers = [asyncio.create_task(flights.do("key", failing)) for _ in range(2)]
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert runs == 1
+
+    with pytest.raises(ValueError):
+        await flights.do("key", failing)
+    assert runs == 2
+
+
+async def test_late_subscribers_replay_the_stream() -> None:
+    flights = SingleFlight()
+    second_started = asyncio.Event()
+    runs = 0
+
+    async def events():
+        nonlocal runs
+        runs += 1
+        yield 1
+        await second_started.wait()
+        yield 2
+
+    first = flights.stream("key", events)
+    assert await anext(first) == 1
+
+    async def collect() -> list[int]:
+        return [event async for event in flights.stream("key", events)]
+
+    late = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    second_started.set()
+
+    assert [event async for event in first] == [2]
+    assert await late == [1, 2]
+    assert runs == 1
+
+
+async def test_stream_errors_reach_subscribers() -> None:
+    flights = SingleFlight()
+
+    async def events():
+        yield 1
+        raise ValueError("LLM failed")
+
+    received = []
+    with pytest.raises(ValueError):
+        async for event in flights.stream("key", events):
+            received.append(event)
+    assert received == [1]
+
+
+async def test_cancelled_stream_releases_subscribers() -> None:
+    flights = SingleFlight()
+
+    async def events():
+        yield 1
+        await asyncio.Event().wait()  # Never finishes on its own
+        yield 2
+
+    stream = flights.stream("key", events)
+    assert await anext(stream) == 1
+    for task in flights._stream_tasks:
+        task.cancel()
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await asyncio.wait_for(anext(stream), timeout=1)
+    assert flights.stats()["in_flight"] == 0